@@ -0,0 +1,125 @@
+"""
+Benchmark the NAVFIT98A <-> NAVFITX row transformers and the CSV conversions built on them.
+
+Usage:
+    python benchmarks/navfit98_mapping.py [--rows 100000]
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from pathlib import Path
+
+from navfitx.models.navfit98 import N98Report
+from navfitx.navfit98 import (
+    NAVFIT98_COLUMNS,
+    compile_export,
+    compile_import,
+    convert_navfit98_csv,
+    export_navfit98_csv,
+)
+
+REPORT_TYPES = ("FitRep", "Eval", "Chief")
+
+
+def make_row(i: int) -> dict[str, str]:
+    row = dict.fromkeys(NAVFIT98_COLUMNS, "")
+    row.update(
+        {
+            "ReportID": str(i),
+            "ReportType": REPORT_TYPES[i % 3],
+            "FullName": f"DOE, JOHN {i}",
+            "Rate": "LT",
+            "Desig": "1110",
+            "SSN": "123-45-6789",
+            "Active": "1",
+            "UIC": "12345",
+            "ShipStation": "USS NEVERSAIL",
+            "PromotionStatus": "REGULAR",
+            "DateReported": "01/01/24 00:00:00",
+            "Periodic": "1",
+            "FromDate": "01/01/24 00:00:00",
+            "ToDate": "12/31/24 00:00:00",
+            "Regular": "1",
+            "PhysicalReadiness": "P",
+            "BilletSubcat": "NA",
+            "ReportingSenior": "SMITH, J",
+            "RSGrade": "CDR",
+            "RSTitle": "CO",
+            "RSUIC": "12345",
+            "RSSSN": "987-65-4321",
+            "Achievements": "Completed a six month deployment. " * 3,
+            "PrimaryDuty": "DIVO",
+            "Duties": "Division Officer responsible for 30 Sailors. " * 3,
+            "DateCounseled": "06/01/24 00:00:00",
+            "Counselor": "SMITH",
+            "PROF": "4",
+            "QUAL": "3",
+            "EO": "4",
+            "MIL": "5",
+            "PA": "3",
+            "TEAM": "4",
+            "LEAD": "4",
+            "MIS": "3",
+            "TAC": "4",
+            "RecommendA": "XO",
+            "RecommendB": "DH",
+            "Comments": "Superb performance. " * 40,
+            "PromotionRecom": "4",
+            "RetentionYes": "1",
+            "RetentionNo": "0",
+            "RSAddress": "123 MAIN ST\nNORFOLK VA 23511",
+        }
+    )
+    return row
+
+
+def report(label: str, rows: int, seconds: float) -> None:
+    print(f"{label:<40} {seconds:8.3f} s  {rows / seconds:12,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    rows = parser.parse_args().rows
+
+    dict_rows = [make_row(i) for i in range(1, rows + 1)]
+    list_rows = [list(row.values()) for row in dict_rows]
+
+    start = time.perf_counter()
+    for row in dict_rows:
+        N98Report.model_validate({name: value for name, value in zip(N98Report.model_fields, row.values()) if value})
+    report("N98Report.model_validate (per row)", rows, time.perf_counter() - start)
+
+    transform = compile_import(NAVFIT98_COLUMNS)
+    start = time.perf_counter()
+    converted = [transform(row) for row in list_rows]
+    report("compile_import transformer", rows, time.perf_counter() - start)
+
+    exporters = {doc_type: compile_export(doc_type) for doc_type in ("fitrep", "eval", "chiefeval")}
+    start = time.perf_counter()
+    for i, (doc_type, values) in enumerate(converted, start=1):
+        exporters[doc_type](values, i)
+    report("compile_export transformer", rows, time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "reports.csv"
+        with csv_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(NAVFIT98_COLUMNS)
+            writer.writerows(list_rows)
+        del dict_rows, list_rows, converted
+
+        db_path = Path(tmp) / "navfitx.db"
+        start = time.perf_counter()
+        convert_navfit98_csv(csv_path, db_path)
+        report("convert_navfit98_csv (CSV -> SQLite)", rows, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        export_navfit98_csv(db_path, Path(tmp) / "export.csv")
+        report("export_navfit98_csv (SQLite -> CSV)", rows, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark how long it takes to open a report in the GUI: building a new form for every report (what Home used to do)
+against rebinding the pre-built form of its report type.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/report_form_open.py [--opens 50]
+"""
+
+import argparse
+import statistics
+import time
+
+from PySide6.QtWidgets import QApplication
+
+from navfitx.examples import (
+    build_validated_example_chiefeval,
+    build_validated_example_eval,
+    build_validated_example_fitrep,
+)
+from navfitx.gui.home import REPORT_FORMS, Home
+
+EXAMPLES = (build_validated_example_fitrep, build_validated_example_eval, build_validated_example_chiefeval)
+
+
+def report(label: str, samples: list[float]) -> None:
+    print(f"{label:<32} median {statistics.median(samples) * 1000:7.2f} ms  max {max(samples) * 1000:7.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--opens", type=int, default=50)
+    opens = parser.parse_args().opens
+
+    app = QApplication([])
+    home = Home()
+    home.show()
+    app.processEvents()
+
+    for build_example in EXAMPLES:
+        doc_type = build_example().doc_type
+        new_form: list[float] = []
+        rebind: list[float] = []
+        for _ in range(opens):
+            example = build_example()
+            start = time.perf_counter()
+            form = REPORT_FORMS[doc_type](home, home.submit_form, home.cancel_form, example)
+            form.build_menu()
+            home.stack.addWidget(form)
+            home.stack.setCurrentWidget(form)
+            app.processEvents()
+            new_form.append(time.perf_counter() - start)
+            home.stack.setCurrentIndex(0)
+            home.stack.removeWidget(form)
+            form.deleteLater()
+
+            example = build_example()
+            start = time.perf_counter()
+            home.show_report_form(example, doc_type)
+            app.processEvents()
+            rebind.append(time.perf_counter() - start)
+            home.cancel_form()
+            app.processEvents()
+
+        report(f"{doc_type}: new form", new_form)
+        report(f"{doc_type}: pre-built form", rebind)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark reading reports back from a database, per 10k reports: the trusted column values of `iter_report_values`,
+report models loaded by the ORM (what `get_all_reports` does), models built from the values with `model_construct`,
+and models validated from the values with `model_validate`, which is what re-validating every read would cost.
+
+Usage:
+    python benchmarks/report_hydration.py [--rows 10000] [--repeat 3]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from navfitx.db import ensure_db_schema, get_engine, iter_report_values
+from navfitx.examples import build_validated_example_fitrep
+from navfitx.models import Fitrep
+
+
+def measure(label: str, load, count: int, repeat: int) -> None:
+    # the best of several runs, so the page cache of the database is warm for every method
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loaded = load()
+        best = min(best, time.perf_counter() - start)
+        assert len(loaded) == count
+    print(f"{label:<20} {count:>7} reports  {best * 1000:8.1f} ms  {best / count * 10_000 * 1000:8.1f} ms/10k")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    values = build_validated_example_fitrep().model_dump(exclude={"id"})
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "navfitx.db"
+        with ensure_db_schema(db_path).begin() as conn:
+            conn.execute(insert(Fitrep), [values | {"name": f"DOE, JOHN {i}"} for i in range(args.rows)])
+
+        def load_values() -> list:
+            return [row for _, partition in iter_report_values(db_path) for row in partition]
+
+        def load_models() -> list[Fitrep]:
+            with Session(get_engine(db_path)) as session:
+                return list(session.exec(select(Fitrep)))
+
+        def construct_models() -> list[Fitrep]:
+            return [Fitrep.model_construct(**row) for row in load_values()]
+
+        def validate_models() -> list[Fitrep]:
+            return [Fitrep.model_validate(row) for row in load_values()]
+
+        measure("trusted values", load_values, args.rows, args.repeat)
+        measure("ORM models", load_models, args.rows, args.repeat)
+        measure("model_construct", construct_models, args.rows, args.repeat)
+        measure("model_validate", validate_models, args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
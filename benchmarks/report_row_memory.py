@@ -0,0 +1,64 @@
+"""
+Benchmark the memory used to hold the reports of a large database for the Report List: full report models (what
+`get_all_reports` loads) against the `ReportRow`s read by `get_report_rows`.
+
+Models are only loaded for a sample of the reports, since every one of them carries its long text fields and its
+pydantic and SQLAlchemy state, and their per-report footprint is extrapolated from the sample.
+
+Usage:
+    python benchmarks/report_row_memory.py [--rows 100000] [--model-rows 10000]
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from navfitx.db import ensure_db_schema, get_engine, get_report_rows
+from navfitx.examples import build_validated_example_fitrep
+from navfitx.models import Fitrep
+
+
+def measure(label: str, load, count: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    loaded = load()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(loaded) == count
+    print(
+        f"{label:<24} {count:>7} reports  {size / 1024**2:8.1f} MiB  {size / count:7.0f} B/report  "
+        f"{elapsed * 1000:8.1f} ms"
+    )
+    del loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--model-rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    values = build_validated_example_fitrep().model_dump(exclude={"id"})
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "navfitx.db"
+        with ensure_db_schema(db_path).begin() as conn:
+            conn.execute(insert(Fitrep), [values | {"name": f"DOE, JOHN {i}"} for i in range(args.rows)])
+
+        def load_models() -> list[Fitrep]:
+            with Session(get_engine(db_path)) as session:
+                return list(session.exec(select(Fitrep).limit(args.model_rows)))
+
+        measure("report models", load_models, min(args.rows, args.model_rows))
+        measure("ReportRow", lambda: get_report_rows(db_path), args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark validating many reports: one `model_validate` call per report against one `validate_many` call per batch,
+over valid reports of every type, and the validators of the fields and dates common to every report on their own.
+
+Usage:
+    python benchmarks/report_validation.py [--reports 100000] [--batch-size 1000]
+"""
+
+import argparse
+import time
+from itertools import cycle, islice
+
+from navfitx.examples import (
+    build_validated_example_chiefeval,
+    build_validated_example_eval,
+    build_validated_example_fitrep,
+)
+from navfitx.models import Report, validate_many
+from navfitx.models.models import validation_date
+
+EXAMPLES = (build_validated_example_fitrep, build_validated_example_eval, build_validated_example_chiefeval)
+
+
+def measure(label: str, validate, count: int) -> None:
+    start = time.perf_counter()
+    validate()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {count:>7} reports  {elapsed:7.2f} s  {elapsed / count * 1e6:7.1f} us/report")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reports", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    examples = [(type(report), report.model_dump()) for report in (build() for build in EXAMPLES)]
+    reports = list(islice(cycle(examples), args.reports))
+
+    def one_at_a_time() -> None:
+        for model, values in reports:
+            model.model_validate(values)
+
+    def batches() -> None:
+        values = [values for _, values in reports]
+        for start in range(0, len(values), args.batch_size):
+            result = validate_many(values[start : start + args.batch_size])
+            assert not result.issues
+
+    instances = [model.model_validate(values) for model, values in reports]
+
+    def validators() -> None:
+        with validation_date():
+            for report in instances:
+                Report.validate_uic(report.uic)
+                Report.validate_ssn(report.ssn)
+                Report.validate_ssn(report.senior_ssn)
+                report.validate_dates()
+
+    measure("validators", validators, len(reports))
+    measure("model_validate", one_at_a_time, len(reports))
+    measure("validate_many", batches, len(reports))
+
+
+if __name__ == "__main__":
+    main()
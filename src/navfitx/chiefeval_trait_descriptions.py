@@ -1,176 +1,71 @@
-traits = {
-    "technical_mastery": {
-        1: """-Lacks basic rating knowledge
-    -Unaware and unwilling to learn details of technical rating proficiencies
-    -Lacks basic professional knowledge to perform effectively
-    -Cannot apply basic skills
-    -Tactical knowledge and skill in specialty are below standards
-    """,
-        2: """-Limited rating knowledge
-    -Learning technical in-rate proficiencies
-    -Only applies basic skills, difficulty with performing daily tasks consistently
-    """,
-        3: """-Demonstrates thorough rating knowledge of all technical actions, duties and procedures
-    -Tactical knowledge and skill in specialty equal to others of the same rate and experience
-    -Competently performs routine and new tasks within rating
-    """,
-        4: """-Demonstrates comprehensive rating knowledge
-    -Tactical rating knowledge above peers
-    -Ability to thoroughly plan and execute routine and new tasks
-    -Mastery of skills and ability to apply them day-to-day
-    """,
-        5: """-Recognized expert, sought after to solve difficult problems, executes innovative ideas
-    -Detailed, current knowledge and strong advocate for all technical programs and policies
-    -Uses technical knowledge and experience to produce a well-trained enlisted and officer team
-    """,
-    },
-    "institutional_expertise": {
-        1: """-Lacks basic Navy knowledge
-    -Unaware and unwilling to learn details of Navy programs and policies
-    -Cannot apply basic skills
-    -Unable to recognize and engage when required to ensure mission success
-    -Ignores Navy traditions
-    -No grasp of naval history
-    """,
-        2: """-Limited Navy knowledge
-    -Learning Navy programs and policies
-    -Only applies basic skills
-    -Does not regularly engage when required to ensure mission
-    success
-    -Lacks full understanding and knowledge of naval customs and traditions
-    """,
-        3: """-Demonstrates thorough knowledge of Navy organization and structure
-    -Able to resolve unit technical issues
-    -Demonstrates knowledge of Navy programs and policies
-    -Integrates naval traditions, customs, and practices into decision making processes, training, and  daily leadership
-    """,
-        4: """- Demonstrates comprehensive institutional knowledge
-    -Tactical unit level knowledge above peers
-    -Ability to plan and execute command mission requirements
-    -Recognizes and engages at the point of friction to ensure mission success
-    -Consistently uses naval history to demonstrate who we are as a service
-    """,
-        5: """- Navy expert, complete understanding of purpose within organization and structure
-    - Exceptionally skilled, complete accuracy and precision in all technical actions, duties, and procedures
-    - Understands how unit mission and the Navy mission support the National Military Strategy
-    - Thorough understanding and proactive integration of customs and traditions
-    """,
-    },
-    "professionalism": {
-        1: """-Does not effectively utilize the Chief's Mess to plan and solve challenges
-    -Improvement of peers, subordinates, and self is not a priority
-    -Unable to meet one or more physical readiness standards
-    -Consistently unsatisfactory appearance, demeanor, or conduct
-    -Fails to uphold, and enforce standards
-    """,
-        2: """-Infrequently upholds and enforces standards
-    -Learning to effectively utilize the Chief's Mess to plan and solve
-    challenges
-    -Improvement of peers, subordinates, and self is a low priority
-    -Struggled to meet one or more physical readiness standards
-    """,
-        3: """-Actively teaches, upholds, and enforces standards
-    -Committed to professional education and training for self and subordinates
-    -Complies with Physical Readiness Program
-    -Excellent personal appearance and representation of the Navy
-    """,
-        4: """-Understands and promotes the attributes and behaviors that define the Profession of Arms
-    -Conduct directly aligns with the Navy Core Values; actively teaches, upholds, and enforces standards
-    -Measured by the success of his/her Sailors and is the role model of good order and discipline
-    """,
-        5: """-Proactively teaches, upholds, and enforces standards throughout the command
-    -Fosters an environment of improvement, education, and professional development
-    -A leader in physical readiness
-    -Exemplary personal appearance and representative of the Navy
-    """,
-    },
-    "integrity": {
-        1: """-Does not demonstrate loyalty to mission, seniors, peers, or subordinates
-    -Not concerned about Sailor success
-    -Allows command challenges to impact Sailor readiness
-    -Does not set a positive tone or build trust with personnel
-    """,
-        2: """
-    -Does not consistently demonstrate loyalty to mission, seniors, peers, or subordinates
-    -Does not prioritize Sailor success
-    -Allows command challenges to impact Sailor and individual readiness; has difficulty building trust
-    """,
-        3: """-Loyal to mission, seniors, peers, and subordinates; moral courage to raise issues and support the outcome
-    -Effective mentor: actions adequately encourage and support subordinates personal/professional growth
-    -Routinely solves command challenges before they significantly impact sailors
-    """,
-        4: """-Abides by an uncompromising code of integrity, takes full responsibility for his/her actions and keeps his/her word
-    -Sets a positive tone, unifies the Mess
-    -Builds trust within the command to create esprit de corps and winning teams
-    """,
-        5: """-Loyal to mission, seniors, peers and subordinates; moral courage to raise issues and strength to fully support the outcome
-    -Exemplary mentor:  creates environment with outstanding professional growth opportunities for each Sailor
-    -Proactively identifies and solves command challenges
-    """,
-    },
-    "accountability": {
-        1: """-Demonstrates behavior that stifles command or work center success
-    -No personal integrity and does not take responsibility for actions or decisions
-    -Fails to live up to Navy Core Values: Honor, Courage, and Commitment
-    """,
-        2: """-Ignores destructive behavior; fails to correct obvious problems that lead to it
-    -Lacks personal integrity and does not actively take responsibility for actions or decisions
-    -Inconsistently lives up to Navy Core Values: Honor, Courage, and Commitment
-    """,
-        3: """-Values human differences, leverages them to foster an atmosphere conducive to personal and team success
-    -Trustworthy, ethical, and honest
-    -Lives up to Navy Core Values: Honor, Courage, and Commitment
-    """,
-        4: """-Clearly defines the problem and is accountable for the outcomes
-    -Continuously self-assesses with an unbiased, learning mindset to provide well-founded solutions
-    -Provides forceful backup and takes prompt action to learn from mistakes
-    -Holds self and peers Accountable
-    """,
-        5: """-Strengthens command through fair, character-based leadership
-    -Uncompromising code of integrity
-    -Exemplifies Navy Core Values: Honor, Courage, and Commitment
-    """,
-    },
-    "deckplate_leadership": {
-        1: """-Stifles information exchange, idea sharing, and diversity of opinion
-    -Does not take advantage of the Chief's Mess to discuss, plan, or act on command issues
-    -Poor communicator; actions negatively impact mission goals and readiness
-    """,
-        2: """-Minimal information exchange, idea sharing, and diversity of opinion
-    -Minimal use of the Chief's Mess to discuss, plan, or act on command issues
-    -Poor communicator; actions do not provide positive impact on mission goals and readiness
-    """,
-        3: """-Facilitates information exchange, idea sharing, and diversity of opinion
-    -Uses Chief's Mess as an open forum to discuss, plan, and act on command issues
-    -Effectively communicates and listens to subordinates, peers, and seniors
-    """,
-        4: """-Visible on the deck-plate; sets the tone for all Sailors
-    -Understands personnel programs and policies; proactive in understanding his/her Sailors and drives them to be better
-    -Enables Sailors to be individual war fighters and productive on credible combat teams
-    """,
-        5: """-Actively facilitates information exchange, idea sharing, and diversity of opinion
-    -Actively uses Chief's Mess as an open forum to discuss, plan, and act on command issues
-    -Energizes communication flow up and down the chain of command
-    """,
-    },
-    "team_effectiveness": {
-        1: """-Creates conflict, unwilling to work with others, puts self above the team
-    -Ignores connectedness, does not support a teamwork environment
-    -Overcome by challenges and delivers substandard outcomes
-    """,
-        2: """-Avoids conflict, hesitant to work with others, little concern with team goals
-    -Minimal connectedness, lack of support in a teamwork environment
-    -Overcome by challenges and delivers substandard outcomes
-    """,
-        3: """-Participates in command planning and problem solving through the Chief's Mess
-    -Reinforces others' efforts and meets personal commitments to team
-    """,
-        4: """-Proactive leader invested in all Sailors
-    -Understands the positive impact of empowerment at every level
-    -Cultivates seasoned teams that anticipate problems, overcome challenges, and deliver best outcomes
-    """,
-        5: """-Actively leads command activities, solves command challenges, and drives mission accomplishment through the Chief's Mess
-    -Team builder, inspires cooperation and focus on mission accomplishment: leverages talents of all Sailors
-    """,
-    },
-}
+"""
+The performance trait descriptions of the Chief Evaluation (NAVPERS 1616/27): what each grade of each trait means.
+
+The descriptions are a data file, `navfitx/data/chiefeval_traits.json`, with each grade already split into its
+bulleted lines. They are only read the first time help text is asked for, so importing this module costs nothing, and
+then indexed by (trait, grade) for lookups and by their lowercase text for searches.
+"""
+
+import importlib.resources as resources
+import json
+from functools import cache
+from typing import NamedTuple
+
+# The traits of a Chief Evaluation, in the order of the trait fields of the report (trait1 to trait7)
+TRAITS = (
+    "technical_mastery",
+    "institutional_expertise",
+    "professionalism",
+    "integrity",
+    "accountability",
+    "deckplate_leadership",
+    "team_effectiveness",
+)
+
+# The report field of each trait, e.g. "trait1" for Technical Mastery
+TRAIT_FIELDS = {f"trait{i}": trait for i, trait in enumerate(TRAITS, start=1)}
+
+
+class TraitDescription(NamedTuple):
+    """One line of the description of a grade of a trait."""
+
+    trait: str
+    grade: int
+    text: str
+
+
+def trait_title(trait: str) -> str:
+    """The name of a trait as printed on the report, e.g. "Technical Mastery"."""
+    return trait.replace("_", " ").title()
+
+
+@cache
+def _load() -> tuple[dict[tuple[str, int], tuple[str, ...]], tuple[tuple[str, TraitDescription], ...]]:
+    text = resources.files("navfitx.data").joinpath("chiefeval_traits.json").read_text(encoding="utf-8")
+    index = {
+        (trait, int(grade)): tuple(lines)
+        for trait, grades in json.loads(text).items()
+        for grade, lines in grades.items()
+    }
+    search = tuple(
+        (line.casefold(), TraitDescription(trait, grade, line))
+        for (trait, grade), lines in index.items()
+        for line in lines
+    )
+    return index, search
+
+
+def trait_description(trait: str, grade: int) -> tuple[str, ...]:
+    """
+    The lines describing a grade (1-5) of a trait, or none if the trait has no description for it, e.g. for Not
+    Observed.
+    """
+    index, _ = _load()
+    return index.get((trait, grade), ())
+
+
+def search_trait_descriptions(query: str) -> list[TraitDescription]:
+    """The lines of every trait description that contain all the words of `query`, ignoring case."""
+    words = query.casefold().split()
+    _, search = _load()
+    return [description for text, description in search if all(word in text for word in words)]
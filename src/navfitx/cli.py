@@ -1,15 +1,56 @@
+import importlib
+
 import typer
+from typer.core import TyperCommand, TyperGroup
 from typing_extensions import Annotated
 
-from navfitx.gui import app as gui_app
-from navfitx.importer import import_command
+from . import __version__
+
+# Subcommands and the "module:attribute" of the Typer app or command function that implements them. The module of a
+# subcommand is only imported when that subcommand is run, so headless commands never import the GUI (PySide6) or
+# pymupdf, and `import navfitx.cli` stays cheap.
+LAZY_COMMANDS = {
+    "gui": "navfitx.gui:app",
+    "toml": "navfitx.toml:app",
+    "import": "navfitx.importer:import_command",
+    "import-navfit98": "navfitx.navfit98:import_navfit98_command",
+    "export-navfit98": "navfitx.navfit98:export_navfit98_command",
+    "db": "navfitx.dbtools:app",
+    "stats": "navfitx.stats:stats_command",
+    # "json": "navfitx.json:app",
+}
 
-# from navfitx.json import app as json_app
-from navfitx.toml import app as toml_app
 
-from . import __version__
+def load_command(name: str) -> TyperCommand | TyperGroup:
+    module_name, attr = LAZY_COMMANDS[name].split(":")
+    obj = getattr(importlib.import_module(module_name), attr)
+    if not isinstance(obj, typer.Typer):
+        # a command function, registered the way `app.command(name=name)` would
+        obj_app = typer.Typer(add_completion=False)
+        obj_app.command(name=name)(obj)
+        obj = obj_app
+    # a Typer app with a single command and no callback, e.g. `gui`, becomes that command like `add_typer` without a
+    # name would make it
+    command = typer.main.get_command(obj)
+    command.name = name
+    return command
+
+
+class LazyGroup(TyperGroup):
+    """
+    Root command group that imports the module of a subcommand only when the subcommand is looked up.
+    """
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return [*super().list_commands(ctx), *(name for name in LAZY_COMMANDS if name not in self.commands)]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> TyperCommand | TyperGroup | None:
+        if cmd_name not in self.commands and cmd_name in LAZY_COMMANDS:
+            self.add_command(load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
-app = typer.Typer(add_completion=False)
+app = typer.Typer(cls=LazyGroup, add_completion=False)
 
 
 def version_callback(value: bool):
@@ -38,10 +79,6 @@ def callback(
     """
     # If no CLI options/args are given, this callback will launch the GUI.
     if ctx.invoked_subcommand is None:
-        gui_app()
-
+        from navfitx.gui import app as gui_app
 
-app.add_typer(gui_app)
-app.add_typer(toml_app, name="toml")
-app.command(name="import")(import_command)
-# app.add_typer(json_app, name="json")
+        gui_app()
@@ -4,19 +4,753 @@ Functions for interacting with the NAVFITX database.
 
 # import pyodbc
 # from pydantic import BaseModel, Field
+import json
+import sqlite3
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
+from typing import Any, NamedTuple
 
-from sqlmodel import Session, create_engine
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import (
+    Connection,
+    Engine,
+    RowMapping,
+    delete,
+    event,
+    exists,
+    insert,
+    inspect,
+    null,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, SQLModel, create_engine, select
 
+from navfitx.models import (
+    ChiefEval,
+    Draft,
+    Eval,
+    Fitrep,
+    Folder,
+    ReportKey,
+    ReportRow,
+    Rsca,
+    RscaKey,
+    SummaryGroup,
+    SummaryGroupKey,
+    ValidationIssue,
+    validate_many,
+)
 from navfitx.models.models import Report
+from navfitx.models.paygrade import ENLISTED_SUFFIXES, EXACT_PAYGRADES, RATE_WHITESPACE
 
+REPORT_MODELS: dict[str, type[Fitrep] | type[Eval] | type[ChiefEval]] = {
+    "fitrep": Fitrep,
+    "eval": Eval,
+    "chiefeval": ChiefEval,
+}
 
-def add_report_to_db(db_path: Path, report: Report):
+# The fields of a folder shown in the folder tree: (id, name, has_children)
+FolderRow = tuple[int, str, bool]
+
+SENIOR_FIELDS = frozenset(
+    {
+        "senior_name",
+        "senior_grade",
+        "senior_desig",
+        "senior_title",
+        "senior_uic",
+        "senior_ssn",
+        "senior_address",
+    }
+)
+
+
+# Archives are opened with a memory map this large so that lookups read straight from the OS page cache.
+ARCHIVE_MMAP_SIZE = 1024 * 1024 * 1024
+
+
+def _set_archive_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA mmap_size = {ARCHIVE_MMAP_SIZE}")
+    cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+
+def get_engine(db_path: Path, *, read_only: bool = False, immutable: bool = True) -> Engine:
+    """
+    Create an engine for a NAVFITX database.
+
+    Args:
+        db_path: Path to the database file.
+        read_only: Open the database read-only, so any write fails.
+        immutable: Open a read-only database as an immutable archive. SQLite then skips all locking and change
+            detection, which makes lookups fast even when the file is on a slow network share. Only use this for
+            databases that no other program is modifying: reading a database while it is written, e.g. by the GUI,
+            needs `immutable=False`.
+    """
+    if not read_only:
+        return create_engine(f"sqlite:///{db_path}")
+
+    uri = f"{db_path.resolve().as_uri()}?mode=ro{'&immutable=1' if immutable else ''}"
+    engine = create_engine(
+        "sqlite://",
+        creator=lambda: sqlite3.connect(uri, uri=True, check_same_thread=False),
+    )
+    event.listen(engine, "connect", _set_archive_pragmas)
+    return engine
+
+
+TRAIT_COLUMNS = tuple(f"trait{i}" for i in range(1, 8))
+
+# The report columns an RSCA is keyed by, in the order of the primary key of the rsca table, with the rate standing for
+# its paygrade
+RSCA_KEY_COLUMNS = ("senior_name", "senior_ssn", "senior_uic", "rate")
+
+# The report columns a summary group is keyed by, with the rate standing for its paygrade
+SUMMARY_GROUP_REPORT_COLUMNS = ("senior_name", "senior_ssn", "senior_uic", "rate", "period_end", "promotion_status")
+
+# The primary key of the summary_group table
+SUMMARY_GROUP_KEY_COLUMNS = ("senior_name", "senior_ssn", "senior_uic", "paygrade", "period_end", "promotion_status")
+
+# The columns of the summary_group table that count each promotion recommendation, in PromotionRecommendation order
+PROMOTION_COUNT_COLUMNS = ("nob", "significant_problems", "progressing", "promotable", "must_promote", "early_promote")
+
+
+def _paygrade_sql(rate: str) -> str:
+    """SQL for the paygrade of the rate `rate` (an SQL expression) as computed by `group_paygrade`."""
+    # SQLite's upper() only uppercases ASCII letters, which is all a rate holds
+    rate = f"upper(trim(coalesce({rate}, ''), {'char(' + ', '.join(str(ord(c)) for c in RATE_WHITESPACE) + ')'}))"
+    exact = " ".join(f"WHEN '{value}' THEN '{grade}'" for value, grade in EXACT_PAYGRADES.items())
+    suffixes = " ".join(
+        f"WHEN length({rate}) > {len(suffix)} AND substr({rate}, -{len(suffix)}) = '{suffix}' THEN '{grade}'"
+        for suffix, grade in ENLISTED_SUFFIXES
+    )
+    return f"CASE {rate} {exact} ELSE CASE {suffixes} ELSE {rate} END END"
+
+
+def _key_terms(row: str, columns: Iterable[str]) -> list[str]:
+    """SQL for the key of a report in an aggregate table, with its rate as its paygrade."""
+    return [_paygrade_sql(f"{row}.rate") if column == "rate" else f"coalesce({row}.{column}, '')" for column in columns]
+
+
+def _rsca_terms(row: str) -> tuple[list[str], str, str]:
+    """
+    SQL for the RSCA key, the member trait average and the number of observed traits of a report, where `row` is the
+    report, e.g. NEW or OLD in a trigger. A trait counts when it is graded 1-5, not when it is NOB (0) or blank.
+    """
+    observed = " + ".join(f"iif({row}.{trait} > 0, 1, 0)" for trait in TRAIT_COLUMNS)
+    total = " + ".join(f"iif({row}.{trait} > 0, {row}.{trait}, 0)" for trait in TRAIT_COLUMNS)
+    return _key_terms(row, RSCA_KEY_COLUMNS), f"CAST({total} AS REAL) / ({observed})", f"({observed})"
+
+
+def _rsca_add(row: str) -> str:
+    key, average, observed = _rsca_terms(row)
+    return (
+        "INSERT INTO rsca (senior_name, senior_ssn, senior_uic, paygrade, total, reports) "
+        f"SELECT {', '.join(key)}, {average}, 1 WHERE {observed} > 0 "
+        "ON CONFLICT (senior_name, senior_ssn, senior_uic, paygrade) "
+        "DO UPDATE SET total = total + excluded.total, reports = reports + 1;"
+    )
+
+
+def _rsca_remove(row: str) -> str:
+    key, average, observed = _rsca_terms(row)
+    match = f"(senior_name, senior_ssn, senior_uic, paygrade) = ({', '.join(key)})"
+    return (
+        f"UPDATE rsca SET total = total - {average}, reports = reports - 1 WHERE {observed} > 0 AND {match}; "
+        f"DELETE FROM rsca WHERE reports <= 0 AND {match};"
+    )
+
+
+def rebuild_rsca(conn: Connection) -> None:
+    """Recompute every RSCA from the reports, e.g. for a database whose reports were saved before it had RSCAs."""
+    key, average, observed = _rsca_terms("report")
+    columns = ", ".join(RSCA_KEY_COLUMNS)
+    reports = " UNION ALL ".join(
+        f"SELECT {', '.join(f'{value} AS {column}' for value, column in zip(key, RSCA_KEY_COLUMNS))}, "
+        f'{average} AS average FROM "{model.__tablename__}" AS report WHERE {observed} > 0'
+        for model in REPORT_MODELS.values()
+    )
+    conn.exec_driver_sql("DELETE FROM rsca")
+    conn.exec_driver_sql(
+        "INSERT INTO rsca (senior_name, senior_ssn, senior_uic, paygrade, total, reports) "
+        f"SELECT {columns}, sum(average), count(*) FROM ({reports}) GROUP BY {columns}"
+    )
+
+
+def _promotion_counts(row: str) -> list[str]:
+    """SQL for whether a report has each promotion recommendation, as 1 or 0, in PromotionRecommendation order."""
+    return [f"iif({row}.indiv_promo_rec = {value}, 1, 0)" for value in range(len(PROMOTION_COUNT_COLUMNS))]
+
+
+def _summary_group_add(row: str) -> str:
+    key = _key_terms(row, SUMMARY_GROUP_REPORT_COLUMNS)
+    return (
+        f"INSERT INTO summary_group ({', '.join((*SUMMARY_GROUP_KEY_COLUMNS, *PROMOTION_COUNT_COLUMNS))}) "
+        f"SELECT {', '.join((*key, *_promotion_counts(row)))} WHERE {row}.indiv_promo_rec IS NOT NULL "
+        f"ON CONFLICT ({', '.join(SUMMARY_GROUP_KEY_COLUMNS)}) "
+        f"DO UPDATE SET {', '.join(f'{column} = {column} + excluded.{column}' for column in PROMOTION_COUNT_COLUMNS)};"
+    )
+
+
+def _summary_group_remove(row: str) -> str:
+    key = _key_terms(row, SUMMARY_GROUP_REPORT_COLUMNS)
+    match = f"({', '.join(SUMMARY_GROUP_KEY_COLUMNS)}) = ({', '.join(key)})"
+    counts = zip(PROMOTION_COUNT_COLUMNS, _promotion_counts(row))
+    return (
+        f"UPDATE summary_group SET {', '.join(f'{column} = {column} - {count}' for column, count in counts)} "
+        f"WHERE {row}.indiv_promo_rec IS NOT NULL AND {match}; "
+        f"DELETE FROM summary_group WHERE {' + '.join(PROMOTION_COUNT_COLUMNS)} <= 0 AND {match};"
+    )
+
+
+def rebuild_summary_groups(conn: Connection) -> None:
+    """Recount the promotion recommendations of every summary group from the reports."""
+    key = _key_terms("report", SUMMARY_GROUP_REPORT_COLUMNS)
+    columns = ", ".join(SUMMARY_GROUP_KEY_COLUMNS)
+    values = [*zip(key, SUMMARY_GROUP_KEY_COLUMNS), *zip(_promotion_counts("report"), PROMOTION_COUNT_COLUMNS)]
+    reports = " UNION ALL ".join(
+        f"SELECT {', '.join(f'{value} AS {column}' for value, column in values)} "
+        f'FROM "{model.__tablename__}" AS report WHERE report.indiv_promo_rec IS NOT NULL'
+        for model in REPORT_MODELS.values()
+    )
+    conn.exec_driver_sql("DELETE FROM summary_group")
+    conn.exec_driver_sql(
+        f"INSERT INTO summary_group ({columns}, {', '.join(PROMOTION_COUNT_COLUMNS)}) "
+        f"SELECT {columns}, {', '.join(f'sum({column})' for column in PROMOTION_COUNT_COLUMNS)} FROM ({reports}) "
+        f"GROUP BY {columns}"
+    )
+
+
+class _Aggregate(NamedTuple):
+    """
+    A table of running totals over the reports, kept up to date by triggers on the report tables: a report's part is
+    added when it is inserted, removed when it is deleted, and moved when one of `columns` is updated.
+    """
+
+    table: str
+    # the report columns the totals depend on
+    columns: tuple[str, ...]
+    # SQL statements that add or remove the part of the report `row` (NEW or OLD) to or from the totals
+    add: Callable[[str], str]
+    remove: Callable[[str], str]
+    # recomputes every total from the reports
+    rebuild: Callable[[Connection], None]
+
+
+AGGREGATES = (
+    _Aggregate("rsca", (*TRAIT_COLUMNS, *RSCA_KEY_COLUMNS), _rsca_add, _rsca_remove, rebuild_rsca),
+    _Aggregate(
+        "summary_group",
+        (*SUMMARY_GROUP_REPORT_COLUMNS, "indiv_promo_rec"),
+        _summary_group_add,
+        _summary_group_remove,
+        rebuild_summary_groups,
+    ),
+)
+
+
+def _aggregate_triggers(table: str, aggregate: _Aggregate) -> dict[str, str]:
+    """
+    The triggers that keep an aggregate table up to date with the reports of a report table, by name. Each is the
+    statement SQLite keeps in sqlite_master, so a trigger created by another version of NAVFITX can be told apart.
+    """
+    name = f"{table}_{aggregate.table}"
+    return {
+        f"{name}_insert": f'CREATE TRIGGER "{name}_insert" AFTER INSERT ON "{table}" BEGIN {aggregate.add("NEW")} END',
+        f"{name}_delete": f'CREATE TRIGGER "{name}_delete" AFTER DELETE ON "{table}" BEGIN {aggregate.remove("OLD")} END',
+        f"{name}_update": (
+            f'CREATE TRIGGER "{name}_update" AFTER UPDATE OF {", ".join(aggregate.columns)} ON "{table}" '
+            f"BEGIN {aggregate.remove('OLD')} {aggregate.add('NEW')} END"
+        ),
+    }
+
+
+def ensure_db_schema(db_path: Path) -> Engine:
+    """
+    Create any missing tables in the database and add columns that were introduced after the database was created.
+
+    Only nullable columns are ever added, so databases created by older versions of NAVFITX keep working. The triggers
+    that maintain the aggregate tables (RSCAs and summary groups) are created too. The aggregate tables only hold
+    totals of the reports, so one that is new to the database, or whose columns or triggers differ from this version's,
+    is computed again from the reports.
+    """
+    engine = get_engine(db_path)
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        for aggregate in AGGREGATES:
+            if aggregate.table not in existing_tables:
+                continue
+            columns = {column["name"] for column in inspector.get_columns(aggregate.table)}
+            if columns != set(SQLModel.metadata.tables[aggregate.table].columns.keys()):
+                conn.exec_driver_sql(f'DROP TABLE "{aggregate.table}"')
+                existing_tables.remove(aggregate.table)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for table in SQLModel.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}')
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        triggers = dict(conn.exec_driver_sql("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'").all())
+        for aggregate in AGGREGATES:
+            stale = aggregate.table not in existing_tables
+            for model in REPORT_MODELS.values():
+                for name, trigger in _aggregate_triggers(model.__tablename__, aggregate).items():
+                    if triggers.get(name) != trigger:
+                        conn.exec_driver_sql(f'DROP TRIGGER IF EXISTS "{name}"')
+                        conn.exec_driver_sql(trigger)
+                        stale = True
+            if stale:
+                aggregate.rebuild(conn)
+    return engine
+
+
+def _group_keys(keys: Iterable[ReportKey]) -> dict[str, set[int]]:
+    grouped: dict[str, set[int]] = defaultdict(set)
+    for doc_type, report_id in keys:
+        if doc_type not in REPORT_MODELS:
+            raise ValueError(f"Unknown report type: {doc_type!r}")
+        grouped[doc_type].add(report_id)
+    return grouped
+
+
+def _selection_clauses(
+    keys: Iterable[ReportKey] | None,
+    where: Mapping[str, Any] | None,
+) -> dict[str, list[Any]]:
+    """
+    Build the WHERE clauses for every report table touched by a selection.
+
+    A selection is a set of report keys, a mapping of column equality filters, or both (in which case a report
+    must match both). Tables that cannot match the selection are left out so no statement is issued for them.
+
+    An empty selection (no keys and no filter) is rejected rather than read as every report.
+    """
+    if keys is not None:
+        keys = list(keys)
+    if not keys and not where:
+        raise ValueError("A selection of report keys or a filter is required.")
+
+    grouped = _group_keys(keys) if keys is not None else None
+    clauses: dict[str, list[Any]] = {}
+    for doc_type, model in REPORT_MODELS.items():
+        table_clauses = []
+        if grouped is not None:
+            ids = grouped.get(doc_type)
+            if not ids:
+                continue
+            table_clauses.append(model.__table__.c.id.in_(ids))  # ty: ignore[unresolved-attribute]
+        for field_name, value in (where or {}).items():
+            column = model.__table__.c.get(field_name)  # ty: ignore[unresolved-attribute]
+            if column is None:
+                raise ValueError(f"Unknown report field: {field_name!r}")
+            table_clauses.append(column.is_(None) if value is None else column == value)
+        clauses[doc_type] = table_clauses
+    return clauses
+
+
+def _bulk_update(
+    db_path: Path,
+    values: Mapping[str, Any],
+    keys: Iterable[ReportKey] | None,
+    where: Mapping[str, Any] | None,
+) -> int:
+    clauses = _selection_clauses(keys, where)
+    count = 0
+    with get_engine(db_path).begin() as conn:
+        for doc_type, table_clauses in clauses.items():
+            table = REPORT_MODELS[doc_type].__table__  # ty: ignore[unresolved-attribute]
+            result = conn.execute(update(table).where(*table_clauses).values(**values))
+            count += result.rowcount
+    return count
+
+
+def delete_reports(
+    db_path: Path,
+    keys: Iterable[ReportKey] | None = None,
+    *,
+    where: Mapping[str, Any] | None = None,
+) -> int:
+    """
+    Delete every report in the selection using one DELETE statement per report table, in a single transaction.
+
+    Args:
+        db_path: Path to the NAVFITX database.
+        keys: The (doc_type, id) pairs of the reports to delete.
+        where: Column equality filters, e.g. `{"period_end": date(2025, 2, 28)}`.
+
+    Returns:
+        The number of reports deleted.
+    """
+    clauses = _selection_clauses(keys, where)
+    count = 0
+    with get_engine(db_path).begin() as conn:
+        for doc_type, table_clauses in clauses.items():
+            table = REPORT_MODELS[doc_type].__table__  # ty: ignore[unresolved-attribute]
+            result = conn.execute(delete(table).where(*table_clauses))
+            count += result.rowcount
+    return count
+
+
+def move_reports_to_folder(
+    db_path: Path,
+    folder_id: int | None,
+    keys: Iterable[ReportKey] | None = None,
+    *,
+    where: Mapping[str, Any] | None = None,
+) -> int:
+    """
+    Move every report in the selection into the folder with the given id (or out of any folder if None).
+
+    Returns:
+        The number of reports moved.
+    """
+    return _bulk_update(db_path, {"folder_id": folder_id}, keys, where)
+
+
+def get_child_folders(db_path: Path, parent_id: int | None, *, read_only: bool = False) -> list[FolderRow]:
+    """
+    Get the folders directly inside a folder, or the top-level folders if `parent_id` is None, sorted by name.
+
+    Only one level of the tree is read. Whether each folder has folders of its own is answered with an EXISTS on the
+    index on `parent_id`, so a tree can show that a folder can be expanded without reading its children.
+    """
+    folder = Folder.__table__  # ty: ignore[unresolved-attribute]
+    child = folder.alias("child")
+    has_children = exists().where(child.c.parent_id == folder.c.id)
+    parent_clause = folder.c.parent_id.is_(None) if parent_id is None else folder.c.parent_id == parent_id
+    statement = select(folder.c.id, folder.c.name, has_children).where(parent_clause)
+    with get_engine(db_path, read_only=read_only).connect() as conn:
+        # archives created before folders were added have no folder table
+        if not inspect(conn).has_table(folder.name):
+            return []
+        rows = [(folder_id, name, bool(has_children)) for folder_id, name, has_children in conn.execute(statement)]
+    return sorted(rows, key=lambda row: row[1].casefold())
+
+
+def create_folder(db_path: Path, name: str, parent_id: int | None = None) -> FolderRow:
+    """
+    Create a folder inside the folder with the given id, or at the top of the tree if `parent_id` is None.
+
+    Returns:
+        The folder tree fields of the new folder.
+    """
+    name = name.strip()
+    if not name:
+        raise ValueError("A folder name is required.")
+    folder = Folder.__table__  # ty: ignore[unresolved-attribute]
+    with get_engine(db_path).begin() as conn:
+        result = conn.execute(insert(folder).values(name=name, parent_id=parent_id))
+        return (result.inserted_primary_key[0], name, False)
+
+
+def rename_folder(db_path: Path, folder_id: int, name: str) -> None:
+    name = name.strip()
+    if not name:
+        raise ValueError("A folder name is required.")
+    folder = Folder.__table__  # ty: ignore[unresolved-attribute]
+    with get_engine(db_path).begin() as conn:
+        conn.execute(update(folder).where(folder.c.id == folder_id).values(name=name))
+
+
+def delete_folder(db_path: Path, folder_id: int) -> int:
+    """
+    Delete a folder and every folder inside it, in a single transaction. No report is deleted: the reports in the
+    deleted folders are moved into the parent of the deleted folder.
+
+    Returns:
+        The number of folders deleted.
+    """
+    folder = Folder.__table__  # ty: ignore[unresolved-attribute]
+    with get_engine(db_path).begin() as conn:
+        parent_id = conn.execute(select(folder.c.parent_id).where(folder.c.id == folder_id)).scalar()
+        subtree = select(folder.c.id).where(folder.c.id == folder_id).cte("subtree", recursive=True)
+        subtree = subtree.union_all(select(folder.c.id).where(folder.c.parent_id == subtree.c.id))
+        folder_ids = list(conn.execute(select(subtree.c.id)).scalars())
+        for model in REPORT_MODELS.values():
+            table = model.__table__  # ty: ignore[unresolved-attribute]
+            conn.execute(update(table).where(table.c.folder_id.in_(folder_ids)).values(folder_id=parent_id))
+        return conn.execute(delete(folder).where(folder.c.id.in_(folder_ids))).rowcount
+
+
+def save_draft(db_path: Path, key: str, report: Report) -> None:
+    """Save the current state of a report being edited, replacing the last draft saved with the same key."""
+    draft = Draft.__table__  # ty: ignore[unresolved-attribute]
+    values = {"key": key, "doc_type": report.doc_type, "data": report.model_dump_json(), "saved_at": datetime.now(UTC)}
+    statement = sqlite_insert(draft).values(**values)
+    statement = statement.on_conflict_do_update(index_elements=[draft.c.key], set_=values)
+    with get_engine(db_path).begin() as conn:
+        conn.execute(statement)
+
+
+def delete_draft(db_path: Path, key: str) -> None:
+    draft = Draft.__table__  # ty: ignore[unresolved-attribute]
+    with get_engine(db_path).begin() as conn:
+        conn.execute(delete(draft).where(draft.c.key == key))
+
+
+def get_drafts(db_path: Path) -> list[Draft]:
+    """Get every draft that was not saved or discarded, the most recently saved first."""
+    with Session(get_engine(db_path)) as session:
+        return list(session.exec(select(Draft).order_by(Draft.saved_at.desc())))  # ty: ignore[unresolved-attribute]
+
+
+@cache
+def _field_type_adapters(model: type[Report]) -> dict[str, TypeAdapter]:
+    # only the types of the fields, without their constraints or validators
+    return {name: TypeAdapter(field.annotation) for name, field in model.model_fields.items()}
+
+
+def report_from_draft(draft: Draft) -> Report:
+    """
+    Rebuild the report saved in a draft.
+
+    A draft holds whatever was in the form, which need not be a valid report. So the JSON of each field is only
+    converted back to the type of the field (e.g. a date), and is not otherwise validated or changed.
+    """
+    model = REPORT_MODELS[draft.doc_type]
+    adapters = _field_type_adapters(model)
+    values = {}
+    for name, value in json.loads(draft.data).items():
+        if name not in adapters:
+            continue
+        try:
+            values[name] = adapters[name].validate_python(value)
+        except ValidationError:
+            values[name] = value
+    return model(**values)
+
+
+def set_reporting_senior(
+    db_path: Path,
+    senior: Mapping[str, str],
+    keys: Iterable[ReportKey] | None = None,
+    *,
+    where: Mapping[str, Any] | None = None,
+) -> int:
+    """
+    Overwrite the reporting senior fields (`senior_name`, `senior_grade`, etc.) of every report in the selection.
+    Only the fields present in `senior` are changed.
+
+    Returns:
+        The number of reports updated.
+    """
+    unknown = set(senior) - SENIOR_FIELDS
+    if unknown:
+        raise ValueError(f"Not reporting senior field(s): {', '.join(sorted(unknown))}")
+    if not senior:
+        return 0
+    return _bulk_update(db_path, senior, keys, where)
+
+
+def _missing_report_columns(conn: Connection, model: type[Report]) -> set[str]:
+    """
+    The columns of a report table that the database doesn't have. Archives are never migrated, so one written by an
+    older NAVFITX lacks the columns added since (e.g. `folder_id`), which are read as None.
+    """
+    existing = {column["name"] for column in inspect(conn).get_columns(model.__tablename__)}
+    return {column.name for column in model.__table__.columns if column.name not in existing}  # ty: ignore[unresolved-attribute]
+
+
+def _load_existing_columns(model: type[Report], missing: set[str]) -> list[Any]:
+    columns = model.__table__.columns  # ty: ignore[unresolved-attribute]
+    return [load_only(*(getattr(model, column.name) for column in columns if column.name not in missing))]
+
+
+def _set_missing_columns(report: Report, missing: set[str]) -> Report:
+    for name in missing:
+        set_committed_value(report, name, None)
+    return report
+
+
+def get_report(db_path: Path, key: ReportKey, *, read_only: bool = False) -> Report | None:
+    doc_type, report_id = key
+    model = REPORT_MODELS[doc_type]
+    with Session(get_engine(db_path, read_only=read_only)) as session:
+        missing = _missing_report_columns(session.connection(), model) if read_only else set()
+        if not missing:
+            return session.get(model, report_id)
+        report = session.get(model, report_id, options=_load_existing_columns(model, missing))
+        return _set_missing_columns(report, missing) if report is not None else None
+
+
+def get_all_reports(db_path: Path, *, read_only: bool = False) -> list[Report]:
+    """
+    Load every report in the database as a report model. Loading doesn't validate the reports; for bulk reads that
+    only need the values of the reports, `iter_report_values` is faster still.
+    """
+    reports: list[Report] = []
+    with Session(get_engine(db_path, read_only=read_only)) as session:
+        for model in REPORT_MODELS.values():
+            missing = _missing_report_columns(session.connection(), model) if read_only else set()
+            if not missing:
+                reports.extend(session.exec(select(model)))
+                continue
+            statement = select(model).options(*_load_existing_columns(model, missing))
+            reports.extend(_set_missing_columns(report, missing) for report in session.exec(statement))
+    return reports
+
+
+# Reports read at a time by iter_report_values
+READ_BATCH_SIZE = 5000
+
+
+def iter_report_values(
+    db_path: Path,
+    *,
+    doc_types: Iterable[str] | None = None,
+    batch_size: int = READ_BATCH_SIZE,
+    read_only: bool = False,
+    immutable: bool = True,
+) -> Iterator[tuple[str, Sequence[RowMapping]]]:
+    """
+    Read the column values of every report of the given types (by default every report), `batch_size` reports at a
+    time, as (doc_type, rows) batches.
+
+    This is the trusted read path for bulk reads such as exports: the values are read as they were saved, and were
+    validated when they were written, so no report models are built and nothing is validated again. Each row maps the
+    fields of a report to their values, e.g. to be passed to `validate_many` or a NAVFIT98 export transform.
+
+    `read_only` and `immutable` are passed to `get_engine`. A read-only database is never migrated, so the columns it
+    lacks are read as None.
+    """
+    with get_engine(db_path, read_only=read_only, immutable=immutable).connect() as conn:
+        for doc_type, model in REPORT_MODELS.items():
+            if doc_types is not None and doc_type not in doc_types:
+                continue
+            missing = _missing_report_columns(conn, model) if read_only else set()
+            columns = [
+                null().label(column.name) if column.name in missing else column
+                for column in model.__table__.columns  # ty: ignore[unresolved-attribute]
+            ]
+            result = conn.execution_options(yield_per=batch_size).execute(select(*columns))
+            for partition in result.mappings().partitions():
+                yield doc_type, partition
+
+
+# Reports validated at a time by validate_db
+VALIDATE_BATCH_SIZE = 1000
+
+
+def validate_db(
+    db_path: Path, *, batch_size: int = VALIDATE_BATCH_SIZE, archive: bool = False
+) -> tuple[int, list[ValidationIssue]]:
+    """
+    Validate every report in a database, reading the column values of `batch_size` reports at a time and validating
+    each batch with `validate_many`.
+
+    The database is opened read-only. It may be written while it is validated, e.g. by the GUI, unless it is opened
+    as an immutable `archive` (see `get_engine`).
+
+    Returns:
+        The number of reports validated, and the issues of the invalid ones. The index of an issue is the position of
+        its report in its batch, so reports are identified by their doc_type and id.
+    """
+    count = 0
+    issues: list[ValidationIssue] = []
+    for _, partition in iter_report_values(db_path, batch_size=batch_size, read_only=True, immutable=archive):
+        issues.extend(validate_many(partition).issues)
+        count += len(partition)
+    return count, issues
+
+
+def get_rsca(db_path: Path, key: RscaKey, *, read_only: bool = False) -> Rsca | None:
+    """
+    Get the RSCA of a reporting senior for a paygrade, or None if they signed no report with an observed trait.
+
+    Args:
+        key: (senior_name, senior_ssn, senior_uic, paygrade), e.g. from `rsca_key`.
+    """
+    engine = get_engine(db_path, read_only=read_only)
+    with Session(engine) as session:
+        # archives are never migrated, so one written by an older NAVFITX has no rsca table
+        if read_only and not inspect(session.connection()).has_table(Rsca.__tablename__):
+            return None
+        return session.get(Rsca, key)
+
+
+def get_summary_group(db_path: Path, key: SummaryGroupKey, *, read_only: bool = False) -> SummaryGroup | None:
+    """
+    Get the promotion recommendation counts of a summary group, or None if none of its reports has a recommendation.
+
+    Args:
+        key: (senior_name, senior_ssn, senior_uic, paygrade, period_end, promotion_status), e.g. from
+            `summary_group_key`.
+    """
+    engine = get_engine(db_path, read_only=read_only)
+    with Session(engine) as session:
+        if read_only and not inspect(session.connection()).has_table(SummaryGroup.__tablename__):
+            return None
+        return session.get(SummaryGroup, key)
+
+
+def get_summary_groups(db_path: Path, *, read_only: bool = False) -> list[SummaryGroup]:
+    """Get the promotion recommendation counts of every summary group."""
+    with Session(get_engine(db_path, read_only=read_only)) as session:
+        return list(session.exec(select(SummaryGroup)))
+
+
+def get_report_rows(
+    db_path: Path, *, where: Mapping[str, Any] | None = None, read_only: bool = False
+) -> list[ReportRow]:
+    """
+    Get the Report List fields of every report, or of the reports matching the column equality filters `where`. Only
+    those columns are read, which is much faster and uses much less memory than loading every report with
+    `get_all_reports`.
+
+    The report tables are read with a single UNION ALL query, so e.g. `where={"folder_id": 3}` is one query that
+    finds the reports of a folder through the index on `folder_id` of each table.
+    """
+    clauses = _selection_clauses(None, where) if where else dict.fromkeys(REPORT_MODELS, [])
+    statement = union_all(
+        *(
+            select(model.rate, model.name, model.ssn, model.doc_type, model.period_end, model.id).where(
+                *clauses[doc_type]
+            )
+            for doc_type, model in REPORT_MODELS.items()
+        )
+    )
+    with get_engine(db_path, read_only=read_only).connect() as conn:
+        return list(map(ReportRow._make, conn.execute(statement)))
+
+
+def get_report_row(report: Report) -> ReportRow:
+    """Get the Report List fields of a report."""
+    return ReportRow.from_report(report)
+
+
+def add_report_to_db(db_path: Path, report: Report) -> ReportRow:
+    """
+    Insert a new report, or save the changes to a report that was read from the database.
+
+    Returns:
+        The Report List fields of the saved report, so a Report List can be updated without reading it back.
+    """
     # TODO: confirm that db_path is to a sqlite database with appropriate schema
     engine = create_engine(f"sqlite:///{db_path}")
-    with Session(engine) as session:
-        session.add(report)
+    # the report is not expired on commit, so its fields (and new id) can be read without another query
+    with Session(engine, expire_on_commit=False) as session:
+        if report.id is not None and inspect(report).transient:
+            # a report rebuilt outside a session, e.g. from a draft, is saved over the report with its id
+            report = session.merge(report)
+        else:
+            session.add(report)
         session.commit()
+    return get_report_row(report)
 
 
 def add_fitrep_to_db(db_path: Path, report: Report):
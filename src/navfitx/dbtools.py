@@ -0,0 +1,94 @@
+"""
+Commands that work on a whole NAVFITX database.
+"""
+
+from pathlib import Path
+
+import typer
+from rich import print
+from rich.table import Table
+from typing_extensions import Annotated
+
+from navfitx.db import VALIDATE_BATCH_SIZE, ensure_db_schema, get_summary_groups, validate_db
+from navfitx.models import quota_violations
+from navfitx.utils import print_validation_issues
+
+app = typer.Typer(add_completion=False, no_args_is_help=True)
+
+
+@app.callback()
+def callback():
+    """
+    Database tools for NAVFITX.
+    """
+    pass
+
+
+@app.command()
+def validate(
+    db: Annotated[
+        Path,
+        typer.Option(
+            "--db",
+            help="Path to the NAVFITX SQLite database file.",
+            exists=True,
+            dir_okay=False,
+            readable=True,
+        ),
+    ],
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch-size", help="Number of reports to validate at a time.", min=1),
+    ] = VALIDATE_BATCH_SIZE,
+) -> None:
+    """
+    Validate every report in a NAVFITX database and print a table of the issues found.
+
+    The database is only read, so it isn't migrated either: the fields of reports that a database created by an older
+    NAVFITX doesn't have yet are validated as blank.
+    """
+    count, issues = validate_db(db, batch_size=batch_size)
+    if issues:
+        print_validation_issues(issues)
+        invalid = len({(issue.doc_type, issue.report_id) for issue in issues})
+        print(f"[red]{invalid} of {count} report(s) failed validation.[/red]")
+        raise typer.Exit(code=1)
+    print(f"All {count} report(s) in {db} are valid.")
+
+
+@app.command()
+def quotas(
+    db: Annotated[
+        Path,
+        typer.Option(
+            "--db",
+            help="Path to the NAVFITX SQLite database file.",
+            exists=True,
+            dir_okay=False,
+            readable=True,
+        ),
+    ],
+) -> None:
+    """
+    List the summary groups whose promotion recommendations are over the EVALMAN limits.
+
+    The recommendations of each summary group are counted as reports are saved, so this reads the counts rather than
+    the reports. A database created before the counts were kept has them added first.
+    """
+    ensure_db_schema(db)
+    table = Table("Reporting Senior", "Paygrade", "Period End", "Status", "MP", "EP", "Issue", title="Over Quota")
+    for group in get_summary_groups(db):
+        for violation in quota_violations(group.paygrade, group.counts()):
+            table.add_row(
+                group.senior_name,
+                group.paygrade,
+                group.period_end,
+                group.promotion_status,
+                str(group.must_promote),
+                str(group.early_promote),
+                violation,
+            )
+    if table.row_count:
+        print(table)
+        raise typer.Exit(code=1)
+    print(f"No summary group in {db} is over its promotion recommendation limits.")
@@ -1,24 +1,39 @@
 import sys
+from pathlib import Path
 
 import typer
-from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QApplication
+from typing_extensions import Annotated
 
 from navfitx.utils import get_icon_path
 
-from .home import Home
-
 app = typer.Typer(no_args_is_help=True, add_completion=False)
 
 
 @app.command()
-def gui():
+def gui(
+    archive: Annotated[
+        Path | None,
+        typer.Option(
+            "--archive",
+            help="Open a past year's database read-only, e.g. to look up and reprint old reports.",
+            exists=True,
+            dir_okay=False,
+            show_default=False,
+        ),
+    ] = None,
+):
     """
     Launch the NAVFITX Graphical User Interface.
     """
+    # Qt is imported here so that importing this package (e.g. to list the CLI commands) does not load it.
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication
+
+    from .home import Home
+
     qt_app = QApplication()
     qt_app.setWindowIcon(QIcon(str(get_icon_path())))
-    window = Home()
+    window = Home(archive=archive)
     window.setGeometry(200, 200, 1300, 800)
 
     screen = qt_app.primaryScreen().availableGeometry()
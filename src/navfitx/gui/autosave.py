@@ -0,0 +1,117 @@
+import uuid
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+from navfitx.db import delete_draft, save_draft
+
+from .report import BaseReportForm
+from .worker import BackgroundWorker
+
+AUTOSAVE_INTERVAL_MS = 5000
+
+
+class DraftAutosaver(QObject):
+    """
+    Write-behind autosave of the report being edited.
+
+    An edit only marks the draft as changed and starts a timer if it is not running yet, so typing costs no more than
+    it did without autosave. When the timer fires the form is read once, however many edits were made, and the draft
+    is written on the database worker. Drafts are therefore written at most every `AUTOSAVE_INTERVAL_MS`, and a draft
+    write that has not started yet is replaced by a newer one.
+
+    The draft is deleted once the report is saved or its form is closed. A draft that is still in the database when
+    NAVFITX starts is one whose edits were never saved.
+
+    A draft that could not be written is written again when the timer next fires, and every failure is reported with
+    `failed`.
+    """
+
+    AUTOSAVE_JOB = "autosave_draft"
+
+    # a message saying what could not be done, e.g. for the status bar
+    failed = Signal(str)
+
+    def __init__(self, worker: BackgroundWorker, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.worker = worker
+        self.db: Path | None = None
+        self.form: BaseReportForm | None = None
+        self.key: str | None = None
+        self.dirty = False
+        # whether a draft with this key may be in the database
+        self.saved = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(AUTOSAVE_INTERVAL_MS)
+        self.timer.timeout.connect(self.flush)
+
+    def start(self, db: Path, form: BaseReportForm, key: str | None = None) -> None:
+        """
+        Autosave the report of a form that was just opened. A recovered draft keeps its key, so it is overwritten
+        rather than copied.
+        """
+        if self.form is not None and self.form is not form:
+            self.form.edited.disconnect(self.mark_dirty)
+        if self.form is not form:
+            form.edited.connect(self.mark_dirty)
+        self.db = db
+        self.form = form
+        self.key = key or uuid.uuid4().hex
+        self.dirty = False
+        self.saved = key is not None
+        self.timer.stop()
+
+    @Slot()
+    def mark_dirty(self) -> None:
+        self.dirty = True
+        if not self.timer.isActive():
+            self.timer.start()
+
+    @Slot()
+    def flush(self) -> None:
+        """Write the draft now if it changed since it was last written."""
+        self.timer.stop()
+        if not self.dirty or self.db is None or self.form is None or self.key is None:
+            return
+        try:
+            report = self.form.draft_report()
+        except ValueError:
+            # the form cannot be read until the field in error is fixed, which is another edit
+            return
+        self.dirty = False
+        self.saved = True
+        key = self.key
+        self.worker.submit(
+            save_draft,
+            self.db,
+            key,
+            report,
+            kind=self.AUTOSAVE_JOB,
+            on_error=lambda exc: self.on_save_failed(key, exc),
+        )
+
+    def on_save_failed(self, key: str, exc: Exception) -> None:
+        self.failed.emit(f"Unable to autosave the report: {exc}")
+        # the draft of a form that was closed since is not written again
+        if key == self.key:
+            self.mark_dirty()
+
+    def discard(self) -> None:
+        """Stop autosaving and delete the draft, e.g. once the report was saved."""
+        self.timer.stop()
+        self.worker.cancel_kind(self.AUTOSAVE_JOB)
+        if self.saved and self.db is not None and self.key is not None:
+            self.worker.submit(
+                delete_draft,
+                self.db,
+                self.key,
+                on_error=lambda exc: self.failed.emit(f"Unable to delete the autosaved draft: {exc}"),
+            )
+        if self.form is not None:
+            self.form.edited.disconnect(self.mark_dirty)
+        self.db = None
+        self.form = None
+        self.key = None
+        self.dirty = False
+        self.saved = False
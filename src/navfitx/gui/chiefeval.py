@@ -1,7 +1,20 @@
 from typing import Callable
 
-from PySide6.QtWidgets import QCheckBox, QHBoxLayout, QLayout, QMainWindow
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QHBoxLayout,
+    QLayout,
+    QLineEdit,
+    QListWidget,
+    QMainWindow,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
 
+from navfitx.chiefeval_trait_descriptions import TRAIT_FIELDS, search_trait_descriptions, trait_description, trait_title
 from navfitx.models import ChiefEval
 
 from .report import BaseReportForm
@@ -40,6 +53,62 @@ class ChiefEvalForm(BaseReportForm[ChiefEval]):
         self.add_label("Leadership", 18, 2)
         self.add_label("Teamwork", 19, 0)
 
+        # the trait descriptions are only read once a tooltip or the search panel asks for them
+        self.trait_combos: dict[QComboBox, str] = {getattr(self, field): trait for field, trait in TRAIT_FIELDS.items()}
+        for combo in self.trait_combos:
+            combo.installEventFilter(self)
+
+        self.trait_help_button = QPushButton("Trait Descriptions")
+        self.trait_help_button.setCheckable(True)
+        self.trait_help_button.toggled.connect(self.toggle_trait_help)
+        self.form.addWidget(self.trait_help_button, 21, 0)
+        self.trait_help = QWidget()
+        help_layout = QVBoxLayout(self.trait_help)
+        help_layout.setContentsMargins(0, 0, 0, 0)
+        self.trait_search = QLineEdit()
+        self.trait_search.setPlaceholderText('Search the trait descriptions, e.g. "mission"')
+        self.trait_search.textChanged.connect(self.show_trait_descriptions)
+        help_layout.addWidget(self.trait_search)
+        self.trait_descriptions = QListWidget()
+        self.trait_descriptions.setFixedHeight(self.trait_search.sizeHint().height() * 8)
+        help_layout.addWidget(self.trait_descriptions)
+        self.trait_help.hide()
+        self.form.addWidget(self.trait_help, 21, 1, 1, 3)
+
+    def trait_tooltip(self, combo: QComboBox) -> str:
+        """The description of the grade selected in the combo box of a trait."""
+        trait = self.trait_combos[combo]
+        grade = self.trait_options[combo.currentText()]
+        lines = trait_description(trait, grade) if grade else ()
+        return "\n".join([f"{trait_title(trait)} {grade}", *(f"- {line}" for line in lines)]) if lines else ""
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802
+        if event.type() == QEvent.Type.ToolTip and watched in self.trait_combos:
+            assert isinstance(watched, QComboBox)
+            watched.setToolTip(self.trait_tooltip(watched))
+        return super().eventFilter(watched, event)
+
+    def toggle_trait_help(self, checked: bool) -> None:
+        self.trait_help.setVisible(checked)
+        if checked:
+            self.show_trait_descriptions()
+            self.trait_search.setFocus()
+
+    def show_trait_descriptions(self) -> None:
+        """List the lines of the trait descriptions that match the search."""
+        self.trait_descriptions.clear()
+        self.trait_descriptions.addItems(
+            [
+                f"{trait_title(description.trait)} {description.grade}: {description.text}"
+                for description in search_trait_descriptions(self.trait_search.text())
+            ]
+        )
+
+    def load_form(self) -> None:
+        super().load_form()
+        self.det_rs.setChecked(self.report.det_rs)
+        self.ops_cdr.setChecked(self.report.ops_cdr)
+
     def save_form(self) -> None:
         super().save_form()
         self.report.det_rs = self.det_rs.isChecked()
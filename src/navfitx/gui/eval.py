@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
     QTextEdit,
 )
 
+from navfitx.layout import chars_per_line
 from navfitx.models.enums import RetentionRecommendation
 from navfitx.models.eval import Eval
 
@@ -57,19 +58,19 @@ class EvalForm(BaseReportForm[Eval]):
         self.achievements.setFont(QFont("Courier"))
         self.achievements.setPlaceholderText("Maximum of 2 lines. Excess lines will be trimmed.")
         self.achievements.setWordWrapMode(QTextOption.WrapMode.WordWrap)
-        self.achievements.setLineWrapColumnOrWidth(91)
+        self.achievements.setLineWrapColumnOrWidth(chars_per_line(self.report_type.TEXT_BOXES["achievements"]))
         self.achievements.setText(self.report.achievements)
         line_height = self.achievements.fontMetrics().lineSpacing()
         self.achievements.setFixedHeight(int(line_height * 3))
         self.achievements.setFixedWidth(900)
         self.achievements_label = QLabel(
             f"Qualifications/Achievements\n"
-            f"(Line Count: {len(self.report_type.wrap_text(self.achievements.toPlainText(), 91).split(chr(10)))}/2)"
+            f"(Line Count: {len(self.report_type.layout_text('achievements', self.achievements.toPlainText()))}/2)"
         )
         self.achievements.textChanged.connect(
             lambda: self.achievements_label.setText(
                 f"Qualifications/Achievements\n"
-                f"(Line Count: {len(self.report_type.wrap_text(self.achievements.toPlainText(), 91).split(chr(10)))}/2)"
+                f"(Line Count: {len(self.report_type.layout_text('achievements', self.achievements.toPlainText()))}/2)"
             )
         )
         self.form.addWidget(self.achievements_label, 23, 0)
@@ -175,6 +176,12 @@ class EvalForm(BaseReportForm[Eval]):
         self.save_form()
         self.on_accept(self.report)
 
+    def load_form(self) -> None:
+        super().load_form()
+        self.prom_frock.setChecked(self.report.prom_frock)
+        self.achievements.setText(self.report.achievements)
+        self.set_combo_data(self.retain, self.report.retain)
+
     def save_form(self):
         """
         Create a Eval class from the data input in the GUI Form.
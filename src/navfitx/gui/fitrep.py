@@ -228,6 +228,11 @@ class FitrepForm(BaseReportForm[Fitrep]):
         self.save_form()
         self.on_accept(self.report)
 
+    def load_form(self) -> None:
+        super().load_form()
+        self.det_rs.setChecked(self.report.det_rs)
+        self.ops_cdr.setChecked(self.report.ops_cdr)
+
     def save_form(self):
         """
         Create a Fitrep class from the data input in the GUI Form.
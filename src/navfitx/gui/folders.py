@@ -0,0 +1,173 @@
+from functools import partial
+from pathlib import Path
+
+from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QLabel,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from navfitx.db import FolderRow, get_child_folders
+
+from .worker import BackgroundWorker
+
+
+class FolderTree(QTreeWidget):
+    """
+    Tree of the report folders in a NAVFITX database.
+
+    The tree is read one level at a time: the top-level folders are read when a database is set, and the folders
+    inside a folder are only read the first time it is expanded, so a database with thousands of folders opens as fast
+    as an empty one. The first item stands for no folder in particular and has no folder id.
+    """
+
+    FOLDER_ID_ROLE = Qt.ItemDataRole.UserRole
+    LOADED_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    # id of the selected folder, or None when the first item is selected
+    folder_selected = Signal(object)
+
+    def __init__(
+        self, worker: BackgroundWorker, root_label: str = "All Reports", parent: QWidget | None = None
+    ) -> None:
+        super().__init__(parent)
+        self.worker = worker
+        self.root_label = root_label
+        self.db: Path | None = None
+        self.read_only = False
+        # results of loads started for an earlier database are ignored
+        self._generation = 0
+        self.setHeaderHidden(True)
+        self.setColumnCount(1)
+        self.itemExpanded.connect(self.on_item_expanded)
+        self.currentItemChanged.connect(self.on_current_item_changed)
+        self.root_item = self._add_root_item()
+
+    def _add_root_item(self) -> QTreeWidgetItem:
+        item = QTreeWidgetItem([self.root_label])
+        item.setData(0, self.FOLDER_ID_ROLE, None)
+        item.setData(0, self.LOADED_ROLE, True)
+        self.addTopLevelItem(item)
+        return item
+
+    def set_database(self, db: Path | None, *, read_only: bool = False) -> None:
+        """Show the folders of another database, starting with only its top-level folders."""
+        self.db = db
+        self.read_only = read_only
+        self._generation += 1
+        self.blockSignals(True)
+        self.clear()
+        self.root_item = self._add_root_item()
+        self.setCurrentItem(self.root_item)
+        self.blockSignals(False)
+        if db is not None:
+            self.load_children(None)
+
+    def load_children(self, item: QTreeWidgetItem | None) -> None:
+        """Read the folders inside the folder of `item`, or the top-level folders if `item` is None."""
+        if self.db is None:
+            return
+        parent_id = None if item is None else item.data(0, self.FOLDER_ID_ROLE)
+        if item is not None:
+            item.setData(0, self.LOADED_ROLE, True)
+        self.worker.submit(
+            partial(get_child_folders, read_only=self.read_only),
+            self.db,
+            parent_id,
+            on_result=partial(self.on_children_loaded, self._generation, item),
+        )
+
+    def on_children_loaded(self, generation: int, item: QTreeWidgetItem | None, rows: list[FolderRow]) -> None:
+        if generation != self._generation:
+            return
+        for row in rows:
+            self.add_folder(item, row)
+        if item is not None and not rows:
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicator)
+
+    def add_folder(self, parent: QTreeWidgetItem | None, row: FolderRow) -> QTreeWidgetItem:
+        """Add a folder inside the folder of `parent`, or at the top of the tree if `parent` is None or the root."""
+        folder_id, name, has_children = row
+        item = QTreeWidgetItem([name])
+        item.setData(0, self.FOLDER_ID_ROLE, folder_id)
+        # a folder without children has nothing left to read
+        item.setData(0, self.LOADED_ROLE, not has_children)
+        if has_children:
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+        if parent is None or parent is self.root_item:
+            self.addTopLevelItem(item)
+        else:
+            parent.addChild(item)
+            parent.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicatorWhenChildren)
+        return item
+
+    def folder_created(self, parent: QTreeWidgetItem | None, row: FolderRow) -> None:
+        """Show a folder that was just created inside the folder of `parent`."""
+        if parent is not None and not parent.data(0, self.LOADED_ROLE):
+            # the new folder is read with the others when the parent is expanded
+            parent.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+            return
+        self.setCurrentItem(self.add_folder(parent, row))
+
+    def remove_folder(self, item: QTreeWidgetItem) -> None:
+        parent = item.parent()
+        if self.currentItem() is item or self._is_ancestor(item, self.currentItem()):
+            self.setCurrentItem(parent or self.root_item)
+        if parent is None:
+            self.takeTopLevelItem(self.indexOfTopLevelItem(item))
+        else:
+            parent.removeChild(item)
+
+    @staticmethod
+    def _is_ancestor(ancestor: QTreeWidgetItem, item: QTreeWidgetItem | None) -> bool:
+        while item is not None:
+            item = item.parent()
+            if item is ancestor:
+                return True
+        return False
+
+    def folder_id(self, item: QTreeWidgetItem | None) -> int | None:
+        return None if item is None else item.data(0, self.FOLDER_ID_ROLE)
+
+    def selected_folder_id(self) -> int | None:
+        return self.folder_id(self.currentItem())
+
+    @Slot(QTreeWidgetItem)
+    def on_item_expanded(self, item: QTreeWidgetItem) -> None:
+        if not item.data(0, self.LOADED_ROLE):
+            self.load_children(item)
+
+    @Slot(QTreeWidgetItem, QTreeWidgetItem)
+    def on_current_item_changed(self, current: QTreeWidgetItem | None, previous: QTreeWidgetItem | None) -> None:
+        self.folder_selected.emit(self.folder_id(current))
+
+
+class FolderDialog(QDialog):
+    """
+    Dialog for choosing the folder to move reports into.
+    """
+
+    def __init__(self, parent: QWidget | None, worker: BackgroundWorker, db: Path, report_count: int) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Move to Folder")
+
+        self.tree = FolderTree(worker, root_label="No Folder")
+        self.tree.set_database(db)
+        self.tree.itemDoubleClicked.connect(self.accept)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"Move the {report_count} selected report(s) to:"))
+        layout.addWidget(self.tree)
+        layout.addWidget(button_box)
+
+    def folder_id(self) -> int | None:
+        return self.tree.selected_folder_id()
@@ -2,41 +2,82 @@ import json
 import shutil
 import tomllib
 import webbrowser
-from datetime import date
+from functools import partial
 from pathlib import Path
 
 from platformdirs import user_config_dir
-from PySide6.QtCore import QPoint, Qt, Slot
-from PySide6.QtGui import QResizeEvent, QShowEvent
+from PySide6.QtCore import QPoint, Qt, QTimer, Slot
+from PySide6.QtGui import QCloseEvent, QResizeEvent, QShowEvent
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QDockWidget,
     QFileDialog,
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
+    QInputDialog,
     QLabel,
     QMainWindow,
     QMenu,
+    QMessageBox,
+    QProgressDialog,
     QPushButton,
     QSizePolicy,
     QStackedWidget,
-    QTableWidget,
-    QTableWidgetItem,
-    QTreeWidget,
     QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
-from sqlmodel import Session, SQLModel, create_engine, select
 
 from navfitx import __version__
 from navfitx.constants import APP_AUTHOR, APP_NAME, BUPERSINST_URL, FEEDBACK_URL, SITE_URL
-from navfitx.db import add_report_to_db
-from navfitx.models import ChiefEval, Eval, Fitrep, Report
+from navfitx.db import (
+    REPORT_MODELS,
+    FolderRow,
+    ReportKey,
+    ReportRow,
+    add_report_to_db,
+    create_folder,
+    delete_draft,
+    delete_folder,
+    delete_reports,
+    ensure_db_schema,
+    get_drafts,
+    get_report,
+    get_report_rows,
+    get_rsca,
+    get_summary_group,
+    move_reports_to_folder,
+    rename_folder,
+    report_from_draft,
+    set_reporting_senior,
+)
+from navfitx.models import ChiefEval, Draft, Eval, Fitrep, Report
 from navfitx.utils import get_blank_report_path
 
+from .autosave import DraftAutosaver
 from .chiefeval import ChiefEvalForm
 from .eval import EvalForm
 from .fitrep import FitrepForm
+from .folders import FolderDialog, FolderTree
+from .printing import ReportPrinter
+from .report import BaseReportForm
+from .report_list import (
+    REPORT_TYPE_DISPLAY_NAMES,
+    ReportListModel,
+    ReportListView,
+    rows_from_snapshot,
+    rows_to_snapshot,
+)
+from .senior import ReportingSeniorDialog
+from .worker import DatabaseWorker
+
+REPORT_FORMS: dict[str, type[BaseReportForm]] = {
+    "fitrep": FitrepForm,
+    "eval": EvalForm,
+    "chiefeval": ChiefEvalForm,
+}
 
 
 class Home(QMainWindow):
@@ -46,7 +87,11 @@ class Home(QMainWindow):
 
     REPORT_LIST_NAME_COLUMN = 1
     REPORT_LIST_TYPE_COLUMN = 3
-    REPORT_LIST_TYPE_ROLE = Qt.ItemDataRole.UserRole
+    REPORT_LIST_TYPE_ROLE = ReportListModel.TYPE_ROLE
+    REPORT_LIST_JOB = "report_list"
+    OPEN_REPORT_JOB = "open_report"
+    RSCA_JOB = "rsca"
+    SUMMARY_GROUP_JOB = "summary_group"
     REPORT_LIST_MIN_NAME_COLUMN_WIDTH = 180
     REPORT_LIST_DEFAULT_COLUMN_WIDTHS = {
         0: 120,  # Rank/Rate
@@ -84,9 +129,10 @@ class Home(QMainWindow):
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.sectionResized.connect(self.on_report_list_column_resized)
 
+        widths = self.saved_column_widths or self.REPORT_LIST_DEFAULT_COLUMN_WIDTHS.values()
         self._is_updating_report_list_columns = True
         try:
-            for column, width in self.REPORT_LIST_DEFAULT_COLUMN_WIDTHS.items():
+            for column, width in enumerate(widths):
                 self.reports_table.setColumnWidth(column, width)
         finally:
             self._is_updating_report_list_columns = False
@@ -116,108 +162,249 @@ class Home(QMainWindow):
 
     @Slot(QPoint)
     def show_reports_table_context_menu(self, pos):
+        keys = self.get_selected_report_keys()
+        if not keys:
+            return
         menu = QMenu(self)
         edit_action = menu.addAction("Edit Report")
-        delete_action = menu.addAction("Delete Report")
+        edit_action.setEnabled(len(keys) == 1)
+        delete_action = menu.addAction("Delete Report" if len(keys) == 1 else f"Delete {len(keys)} Reports")
+        delete_action.setDisabled(self.read_only)
+        senior_action = menu.addAction("Set Reporting Senior...")
+        senior_action.setDisabled(self.read_only)
+        move_action = menu.addAction("Move to Folder...")
+        move_action.setDisabled(self.read_only)
+        menu.addSeparator()
+        print_action = menu.addAction("Print Selected...")
         action = menu.exec(self.reports_table.viewport().mapToGlobal(pos))
         selected_row = self.reports_table.currentRow()
-        if selected_row < 0:
-            return
-        if action == edit_action:
+        if action == edit_action and selected_row >= 0:
             # Simulate double-click to edit
             self.edit_report_from_table(selected_row, 0)
         elif action == delete_action:
-            report_id_item = self.reports_table.item(selected_row, 5)
-            report_type_item = self.reports_table.item(selected_row, self.REPORT_LIST_TYPE_COLUMN)
-            if report_id_item and report_type_item:
-                report_id = int(report_id_item.text())
-                report_type = self.get_report_type_from_row(selected_row)
-                if report_type is None:
-                    return
-                self.delete_report_by_id(report_id, report_type)
-                self.refresh_reports_table()
+            self.delete_selected_reports(keys)
+        elif action == senior_action:
+            self.set_reporting_senior_for_selected_reports(keys)
+        elif action == move_action:
+            self.move_selected_reports_to_folder(keys)
+        elif action == print_action:
+            self.print_selected_reports(keys)
+
+    def get_report_key_from_row(self, row: int) -> ReportKey | None:
+        return self.report_list_model.report_key(row)
+
+    def get_selected_report_keys(self) -> list[ReportKey]:
+        selection_model = self.reports_table.selectionModel()
+        keys = []
+        for index in selection_model.selectedRows():
+            key = self.get_report_key_from_row(index.row())
+            if key is not None:
+                keys.append(key)
+        return keys
+
+    def delete_selected_reports(self, keys: list[ReportKey]) -> None:
+        if not self.db or self.read_only or not keys:
+            return
+        if len(keys) > 1:
+            answer = QMessageBox.question(
+                self,
+                "Delete Reports",
+                f"Permanently delete the {len(keys)} selected reports?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                return
+        self.db_worker.submit(
+            delete_reports,
+            self.db,
+            keys,
+            on_result=lambda _: self.on_reports_deleted(keys),
+            on_error=self.on_db_write_error,
+        )
+
+    def on_reports_deleted(self, keys: list[ReportKey]) -> None:
+        for key in keys:
+            self.report_list_model.remove_row(key)
+
+    def set_reporting_senior_for_selected_reports(self, keys: list[ReportKey]) -> None:
+        if not self.db or self.read_only or not keys:
+            return
+        dialog = ReportingSeniorDialog(self, len(keys))
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        senior = dialog.senior_values()
+        if not senior:
+            return
+        self.db_worker.submit(
+            set_reporting_senior,
+            self.db,
+            senior,
+            keys,
+            # the reporting senior is not shown in the Report List, so there is nothing to update
+            on_result=lambda count: self.statusBar().showMessage(f"Updated {count} report(s).", 5000),
+            on_error=self.on_db_write_error,
+        )
+
+    def move_selected_reports_to_folder(self, keys: list[ReportKey]) -> None:
+        if not self.db or self.read_only or not keys:
+            return
+        dialog = FolderDialog(self, self.db_worker, self.db, len(keys))
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        folder_id = dialog.folder_id()
+        self.db_worker.submit(
+            move_reports_to_folder,
+            self.db,
+            folder_id,
+            keys,
+            on_result=lambda count: self.on_reports_moved(keys, folder_id, count),
+            on_error=self.on_db_write_error,
+        )
+
+    def on_reports_moved(self, keys: list[ReportKey], folder_id: int | None, count: int) -> None:
+        # reports moved out of the folder being shown leave the Report List
+        if self.folder_id is not None and folder_id != self.folder_id:
+            for key in keys:
+                self.report_list_model.remove_row(key)
+        self.statusBar().showMessage(f"Moved {count} report(s).", 5000)
 
-    def get_report_type_display_name(self, report_type: str) -> str:
-        match report_type:
-            case "fitrep":
-                return "Fitness Report"
-            case "eval":
-                return "Evaluation"
-            case "chiefeval":
-                return "Chief Evaluation"
-            case _:
-                return report_type.upper()
-
-    def get_report_type_from_display_name(self, display_name: str) -> str | None:
-        normalized_name = display_name.strip().casefold()
-        if normalized_name == "fitness report":
-            return "fitrep"
-        if normalized_name == "evaluation":
-            return "eval"
-        if normalized_name == "chief evaluation":
-            return "chiefeval"
-        if normalized_name in {"fitrep", "eval", "chiefeval"}:
-            return normalized_name
-        return None
+    def print_selected_reports(self, keys: list[ReportKey]) -> None:
+        if not self.db or not keys:
+            return
+        if self.report_printer is not None and not self.report_printer.is_finished:
+            self.statusBar().showMessage("Reports are already being printed.", 5000)
+            return
+        choice = QMessageBox(self)
+        choice.setWindowTitle("Print Selected")
+        choice.setText(f"Print the {len(keys)} selected report(s) to:")
+        merged_button = choice.addButton("One PDF", QMessageBox.ButtonRole.AcceptRole)
+        folder_button = choice.addButton("A Folder of PDFs", QMessageBox.ButtonRole.AcceptRole)
+        choice.addButton(QMessageBox.StandardButton.Cancel)
+        choice.exec()
+        if choice.clickedButton() == merged_button:
+            filename, _ = QFileDialog.getSaveFileName(self, "Print Selected", "reports.pdf", "PDF Files (*.pdf)")
+            if not filename:
+                return
+            self.start_printing(keys, Path(filename), merge=True)
+        elif choice.clickedButton() == folder_button:
+            directory = QFileDialog.getExistingDirectory(self, "Print Selected")
+            if not directory:
+                return
+            self.start_printing(keys, Path(directory), merge=False)
+
+    def start_printing(self, keys: list[ReportKey], output: Path, *, merge: bool) -> ReportPrinter:
+        assert self.db is not None
+        printer = ReportPrinter(self.db, keys, output, merge=merge, read_only=self.read_only, parent=self)
+        progress = QProgressDialog("Printing reports...", "Cancel", 0, len(keys), self)
+        progress.setWindowTitle("Print Selected")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+        printer.progress.connect(progress.setValue)
+        progress.canceled.connect(printer.cancel)
+        printer.finished.connect(lambda: self.on_printing_finished(printer, progress))
+        self.report_printer = printer
+        printer.start()
+        return printer
+
+    def on_printing_finished(self, printer: ReportPrinter, progress: QProgressDialog) -> None:
+        progress.canceled.disconnect(printer.cancel)
+        progress.close()
+        if printer.cancelled:
+            self.statusBar().showMessage("Printing cancelled.", 5000)
+            return
+        if printer.error is not None:
+            QMessageBox.warning(self, "Print Selected", f"Unable to save {printer.output}:\n\n{printer.error}")
+            return
+        if printer.printed:
+            self.statusBar().showMessage(f"Printed {printer.printed} report(s) to {printer.output}.", 5000)
+        if printer.failures:
+            lines = [
+                f"{REPORT_TYPE_DISPLAY_NAMES.get(doc_type, doc_type)} {report_id}: {error}"
+                for (doc_type, report_id), error in printer.failures
+            ]
+            QMessageBox.warning(
+                self,
+                "Print Selected",
+                f"{len(printer.failures)} of {len(printer.keys)} report(s) could not be printed:\n\n"
+                + "\n".join(lines),
+            )
 
     def get_report_type_from_row(self, row: int) -> str | None:
-        item = self.reports_table.item(row, self.REPORT_LIST_TYPE_COLUMN)
-        if item is None:
-            return None
-        report_type = item.data(self.REPORT_LIST_TYPE_ROLE)
-        if isinstance(report_type, str):
-            return report_type
-        return self.get_report_type_from_display_name(item.text())
+        index = self.report_list_model.index(row, self.REPORT_LIST_TYPE_COLUMN)
+        report_type = index.data(self.REPORT_LIST_TYPE_ROLE)
+        return report_type if isinstance(report_type, str) else None
 
     def ensure_db_schema(self) -> None:
-        if not self.db:
+        if not self.db or self.read_only:
             return
-        engine = create_engine(f"sqlite:///{self.db}")
-        SQLModel.metadata.create_all(engine)
+        self.db_worker.submit(ensure_db_schema, self.db, on_error=self.on_db_read_error)
 
     def delete_report_by_id(self, report_id: int, report_type: str):
-        if not self.db:
+        if not self.db or self.read_only:
             return
-        engine = create_engine(f"sqlite:///{self.db}")
-        with Session(engine) as session:
-            if report_type.lower() == "fitrep":
-                fitrep = session.exec(select(Fitrep).where(Fitrep.id == report_id)).first()
-                if fitrep:
-                    session.delete(fitrep)
-                    session.commit()
-                    return
-            elif report_type.lower() == "eval":
-                eval = session.exec(select(Eval).where(Eval.id == report_id)).first()
-                if eval:
-                    session.delete(eval)
-                    session.commit()
-                    return
-            elif report_type.lower() == "chiefeval":
-                chiefeval = session.exec(select(ChiefEval).where(ChiefEval.id == report_id)).first()
-                if chiefeval:
-                    session.delete(chiefeval)
-                    session.commit()
-                    return
-
-    def __init__(self) -> None:
+        keys = [(report_type.lower(), report_id)]
+        self.db_worker.submit(
+            delete_reports,
+            self.db,
+            keys,
+            on_result=lambda _: self.on_reports_deleted(keys),
+            on_error=self.on_db_write_error,
+        )
+
+    @Slot(bool)
+    def on_db_busy_changed(self, busy: bool) -> None:
+        if busy:
+            self.reports_table.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.reports_table.unsetCursor()
+
+    def on_db_read_error(self, exc: Exception) -> None:
+        self.statusBar().showMessage(f"Unable to read database: {exc}")
+
+    def on_db_write_error(self, exc: Exception) -> None:
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "Database Error", f"Unable to save changes to the database:\n\n{exc}")
+
+    def wait_for_db(self) -> None:
+        """Block until all queued database jobs have finished and their results have been applied."""
+        self.db_worker.wait()
+
+    def __init__(self, archive: Path | None = None) -> None:
         super().__init__()
 
         self.db: Path | None = None
+        # Archives are opened read-only: the schema is never touched and every write action is disabled
+        self.read_only = False
         self.sort_column = 4
         self.sort_ascending = False
-        self._reports_cache: list[Report] = []
+        self.report_printer: ReportPrinter | None = None
+        # the Report List only shows the reports in this folder, or every report if None
+        self.folder_id: int | None = None
         self._is_updating_report_list_columns = False
+        # Report List state of the previous session, restored by load_last_db
+        self.saved_column_widths: list[int] | None = None
+        self.report_list_snapshot: list[ReportRow] | None = None
+
+        # All database access happens on this worker so the window never blocks on SQLite
+        self.db_worker = DatabaseWorker(self)
+        # e.g. the folders of the folder tree, which are read without an error callback of their own
+        self.db_worker.failed.connect(self.on_db_read_error)
+        self.autosaver = DraftAutosaver(self.db_worker, self)
+        self.autosaver.failed.connect(self.statusBar().showMessage)
 
         # Load last-used database path from previous session (if any)
         self.load_last_db()
+        if archive is not None:
+            if archive != self.db:
+                # the snapshot is of the last database, not of the archive (the column widths aren't per database)
+                self.report_list_snapshot = None
+            self.db = archive
+            self.read_only = True
         if self.db:
-            # refresh table and enable create button if DB was restored
-            try:
-                self.ensure_db_schema()
-                self.refresh_reports_table()
-            except Exception:
-                # Avoid crashing the UI if the restored DB is invalid/missing
-                pass
+            # errors from an invalid/missing restored DB are reported in the status bar instead of crashing the UI
+            self.ensure_db_schema()
             # if hasattr(self, "create_fitrep_btn"):
             #     self.create_fitrep_btn.setDisabled(False)
             # if hasattr(self, "create_eval_btn"):
@@ -230,15 +417,16 @@ class Home(QMainWindow):
         # right_label = QLabel("Right text")
         # self.statusBar().addPermanentWidget(right_label) # Bottom right
 
-        self.reports_table: QTableWidget = QTableWidget()
+        # The Report List is virtualized: the model holds compact rows and only the visible cells are materialized
+        self.report_list_model = ReportListModel(self)
+        self.reports_table = ReportListView()
+        self.reports_table.setModel(self.report_list_model)
         self.setup_reports_table_context_menu()
         # self.reports_table.setToolTip("Double click a Report to edit it.")
         self.reports_table.setToolTip("Right click a Report to see options.")
-        headers = ["Rank/Rate", "Full Name", "SSN", "Report", "Period End", "Report ID"]
-        self.reports_table.setRowCount(0)
-        self.reports_table.setColumnCount(len(headers))
-        self.reports_table.setHorizontalHeaderLabels(headers)
-        self.reports_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.reports_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.reports_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.reports_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.reports_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         header = self.reports_table.horizontalHeader()
         header.setSectionsClickable(True)
@@ -246,11 +434,25 @@ class Home(QMainWindow):
         header.sectionClicked.connect(self.sort_reports_by_column)
         self.configure_report_list_column_fill_mode()
         self.update_sort_indicator()
+        if self.report_list_snapshot is not None:
+            # paint the Report List of the previous session now; it is reconciled with the database once it is read
+            self.report_list_model.sort_column = self.sort_column
+            self.report_list_model.sort_order = self.get_sort_order()
+            self.report_list_model.set_rows(self.report_list_snapshot)
+            self.report_list_snapshot = None
 
-        self.reports_table.cellDoubleClicked.connect(self.edit_report_from_table)
+        self.reports_table.doubleClicked.connect(lambda index: self.edit_report_from_table(index.row(), index.column()))
+        self.db_worker.busy_changed.connect(self.on_db_busy_changed)
 
         self.setWindowTitle(f"NAVFITX v{__version__}")
 
+        self.folder_tree = self.create_folder_tree()
+        self.folder_dock = QDockWidget("Folders", self)
+        self.folder_dock.setObjectName("folder_dock")
+        self.folder_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable)
+        self.folder_dock.setWidget(self.folder_tree)
+        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.folder_dock)
+
         # Central widget container
         self.stack = QStackedWidget()
         self.stack.currentChanged.connect(self.on_stack_index_changed)
@@ -259,6 +461,12 @@ class Home(QMainWindow):
         self.stack.addWidget(self.create_home_widget())
         self.setCentralWidget(self.stack)
 
+        # One form per report type is kept in the stack and rebound to each report that is opened. They are built
+        # once the event loop is idle so the window appears first and opening the first report is fast too.
+        self.report_forms: dict[str, BaseReportForm] = {}
+        QTimer.singleShot(0, self, self.prebuild_report_forms)
+        QTimer.singleShot(0, self, self.recover_drafts)
+
     def showEvent(self, event: QShowEvent) -> None:
         super().showEvent(event)
         self.update_report_list_name_column_width()
@@ -267,6 +475,16 @@ class Home(QMainWindow):
         super().resizeEvent(event)
         self.update_report_list_name_column_width()
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        # let pending writes, including the draft of an open form, reach the database before the window goes away
+        self.autosaver.flush()
+        self.wait_for_db()
+        try:
+            self.save_report_list_state()
+        except Exception:
+            pass
+        super().closeEvent(event)
+
     def build_home_menu(self):
         self.menuBar().clear()
         file_menu = self.menuBar().addMenu("File")
@@ -276,7 +494,7 @@ class Home(QMainWindow):
         # import_toml_action = import_menu.addAction("Import Report from TOML")
         # import_toml_action.triggered.connect(self.import_toml_report)
 
-        if not self.db:
+        if not self.db or self.read_only:
             self.new_submenu.setDisabled(True)
             # import_menu.setDisabled(True)
 
@@ -292,11 +510,14 @@ class Home(QMainWindow):
         fitness_report_action.triggered.connect(lambda: self.open_fitrep_dialog(Fitrep()))
 
         folder_action = self.new_submenu.addAction("Folder")
-        folder_action.setDisabled(True)  # not implemented yet
+        folder_action.triggered.connect(self.create_folder_in_selected_folder)
         create_db_action = file_menu.addAction("Create Database")
         create_db_action.triggered.connect(self.create_db)
         open_db_action = file_menu.addAction("Open Database")
         open_db_action.triggered.connect(self.open_db)
+        open_archive_action = file_menu.addAction("Open Archive")
+        open_archive_action.setToolTip("Open a past year's database read-only for looking up and reprinting reports.")
+        open_archive_action.triggered.connect(self.open_archive)
 
         close_db_action = file_menu.addAction("Close Database")
         close_db_action.triggered.connect(self.close_db)
@@ -330,42 +551,91 @@ class Home(QMainWindow):
         about_navfitx_action = help_menu.addAction("About NAVFITX")
         about_navfitx_action.triggered.connect(lambda: self.open_link(SITE_URL))
 
+    def get_report_form(self, doc_type: str) -> BaseReportForm:
+        """Get the form for a report type, building it the first time it is needed."""
+        form = self.report_forms.get(doc_type)
+        if form is None:
+            form = REPORT_FORMS[doc_type](self, self.submit_form, self.cancel_form, REPORT_MODELS[doc_type]())
+            form.rsca_key_changed.connect(partial(self.load_rsca, form))
+            form.summary_group_key_changed.connect(partial(self.load_summary_group, form))
+            self.stack.addWidget(form)
+            self.report_forms[doc_type] = form
+        return form
+
+    @Slot()
+    def prebuild_report_forms(self) -> None:
+        for doc_type in REPORT_FORMS:
+            self.get_report_form(doc_type)
+
+    def show_report_form(self, report: Report, title: str) -> BaseReportForm:
+        form = self.get_report_form(report.doc_type)
+        form.bind(report)
+        form.set_read_only(self.read_only)
+        self.load_rsca(form)
+        self.load_summary_group(form)
+        if self.db and not self.read_only:
+            self.autosaver.start(self.db, form)
+        self.stack.setCurrentWidget(form)
+        form.build_menu()
+        self.setWindowTitle(title)
+        return form
+
+    def load_rsca(self, form: BaseReportForm) -> None:
+        """Look up the RSCA of the reporting senior and paygrade entered in a form, and show it in the form."""
+        if not self.db:
+            return
+        # a lookup for a key that was edited again since is superseded
+        self.db_worker.submit(
+            partial(get_rsca, read_only=self.read_only),
+            self.db,
+            form.rsca_key(),
+            kind=self.RSCA_JOB,
+            on_result=form.set_rsca,
+            on_error=self.on_db_read_error,
+        )
+
+    def load_summary_group(self, form: BaseReportForm) -> None:
+        """Look up the promotion recommendations of the summary group entered in a form, and show them in the form."""
+        if not self.db:
+            return
+        self.db_worker.submit(
+            partial(get_summary_group, read_only=self.read_only),
+            self.db,
+            form.summary_group_key(),
+            kind=self.SUMMARY_GROUP_JOB,
+            on_result=form.set_summary_group,
+            on_error=self.on_db_read_error,
+        )
+
     def open_eval_dialog(self, eval: Eval):
         # self.statusBar().hide()
-        self.eval_form = EvalForm(self, self.submit_form, self.cancel_form, eval)
-        idx = self.stack.addWidget(self.eval_form)
-        self.stack.setCurrentIndex(idx)
-        self.setWindowTitle("EVAL")
+        self.eval_form = self.show_report_form(eval, "EVAL")
 
     def open_fitrep_dialog(self, fitrep: Fitrep):
         # self.statusBar().hide()
-        self.fitrep_form = FitrepForm(self, self.submit_form, self.cancel_form, fitrep)
-        idx = self.stack.addWidget(self.fitrep_form)
-        self.stack.setCurrentIndex(idx)
+        self.fitrep_form = self.show_report_form(fitrep, "FITREP")
 
     def open_chiefeval_dialog(self, chiefeval: ChiefEval):
-        self.chiefeval_form = ChiefEvalForm(self, self.submit_form, self.cancel_form, chiefeval)
-        idx = self.stack.addWidget(self.chiefeval_form)
-        self.stack.setCurrentIndex(idx)
-        self.setWindowTitle("Chief Evaluation")
+        self.chiefeval_form = self.show_report_form(chiefeval, "Chief Evaluation")
 
     @Slot(int)
     def on_stack_index_changed(self, index: int):
-        """Handle stack index changes: restore home menu on index 0, set form title on index 1."""
+        """Handle stack index changes: restore the home menu on index 0. Report forms build their own menu."""
+        # the folders only filter the Report List, so they are hidden while a report is being edited
+        self.folder_dock.setVisible(index == 0)
         if index == 0:
             # self.statusBar().show()
             self.setWindowTitle(f"NAVFITX v{__version__}")
             self.build_home_menu()
-        elif index == 1:
-            # FitrepForm constructs its own menu when created.
-            self.setWindowTitle("FITREP")
 
     @Slot()
     def close_db(self):
         self.db = None
+        self.read_only = False
+        self.reload_folders()
         self.refresh_reports_table()
         self.new_submenu.setDisabled(True)
-        self.reports_table_label.setText("Reports (No database open)")
+        self.reports_table_label.setText(self.get_reports_table_label_text())
         # self.create_fitrep_btn.setDisabled(True)
         # self.create_eval_btn.setDisabled(True)
         # remove persisted last DB since there is no open DB now
@@ -382,6 +652,7 @@ class Home(QMainWindow):
         # TODO: validate that selected file is a valid navfitx database
         if filename:
             self.db = Path(filename)
+            self.read_only = False
             self.ensure_db_schema()
 
             # persist selection for next session
@@ -390,11 +661,41 @@ class Home(QMainWindow):
             except Exception:
                 pass
 
+            self.reload_folders()
             self.refresh_reports_table()
+            self.recover_drafts()
             self.new_submenu.setDisabled(False)
             # self.create_fitrep_btn.setDisabled(False)
             # self.create_eval_btn.setDisabled(False)
-            self.reports_table_label.setText(f"Reports ({self.db})")
+            self.reports_table_label.setText(self.get_reports_table_label_text())
+
+    @Slot()
+    def open_archive(self):
+        filename, selected_filter = QFileDialog.getOpenFileName(
+            self, "Open Archive", filter="Database Files (*.db *.sqlite);;All Files (*)"
+        )
+        if filename:
+            self.open_archive_path(Path(filename))
+
+    def open_archive_path(self, path: Path) -> None:
+        """Open a database read-only, without creating or migrating its schema."""
+        self.db = path
+        self.read_only = True
+        try:
+            self.save_last_db(self.db, read_only=True)
+        except Exception:
+            pass
+        self.reload_folders()
+        self.refresh_reports_table()
+        self.new_submenu.setDisabled(True)
+        self.reports_table_label.setText(self.get_reports_table_label_text())
+
+    def get_reports_table_label_text(self) -> str:
+        if not self.db:
+            return "Reports (No database open)"
+        if self.read_only:
+            return f"Reports ({self.db}, read-only archive)"
+        return f"Reports ({self.db})"
 
     @Slot()
     def create_db(self):
@@ -404,9 +705,9 @@ class Home(QMainWindow):
         path = Path(filename)
         if path.exists():
             path.unlink()
-        engine = create_engine(f"sqlite:///{path}")
-        SQLModel.metadata.create_all(engine)
+        ensure_db_schema(path)
         self.db = path
+        self.read_only = False
         # persist new database location
         try:
             self.save_last_db(self.db)
@@ -415,8 +716,9 @@ class Home(QMainWindow):
         self.new_submenu.setDisabled(False)
         # self.create_fitrep_btn.setDisabled(False)
         # self.create_eval_btn.setDisabled(False)
+        self.reload_folders()
         self.refresh_reports_table()
-        self.reports_table_label.setText(f"Reports ({self.db})")
+        self.reports_table_label.setText(self.get_reports_table_label_text())
 
     def import_toml_report(self):
         filename, selected_filter = QFileDialog.getOpenFileName(
@@ -463,63 +765,132 @@ class Home(QMainWindow):
         data_dir.mkdir(parents=True, exist_ok=True)
         return data_dir / "state.json"
 
-    def load_last_db(self) -> None:
-        """Load the last-used database path from the state file (if present).
-
-        Sets self.db to a Path if the file exists and the path is valid; otherwise leaves it None.
-        """
-        state_file = self._state_file()
-        if not state_file.exists():
-            return
+    def read_state(self) -> dict:
+        """Read the state file. A missing or corrupt state file is read as empty, so it never breaks the app."""
         try:
-            data = json.loads(state_file.read_text(encoding="utf-8"))
-            last = data.get("last_db")
-            if last:
-                p = Path(last)
-                if p.exists():
-                    self.db = p
+            data = json.loads(self._state_file().read_text(encoding="utf-8"))
         except Exception:
-            # Corrupt/invalid state should not break the app; ignore and continue
-            return
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def write_state(self, data: dict) -> None:
+        self._state_file().write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+
+    def load_last_db(self) -> None:
+        """Load the last-used database path, and the Report List state of the previous session, from the state file.
 
-    def save_last_db(self, db_path: Path | None) -> None:
-        """Persist the provided database path to the state file. If db_path is None the state
-        file will be removed.
+        Sets self.db to a Path if the file exists and the path is valid; otherwise leaves it None. The snapshot of the
+        Report List is only kept if it was taken of that database.
         """
-        state_file = self._state_file()
-        if db_path is None:
+        data = self.read_state()
+        last = data.get("last_db")
+        if last:
+            p = Path(last)
+            if p.exists():
+                self.db = p
+                self.read_only = bool(data.get("read_only", False))
+        sort_column = data.get("sort_column")
+        if isinstance(sort_column, int) and 0 <= sort_column < len(ReportListModel.HEADERS):
+            self.sort_column = sort_column
+            self.sort_ascending = bool(data.get("sort_ascending", False))
+        widths = data.get("column_widths")
+        if isinstance(widths, list) and len(widths) == len(ReportListModel.HEADERS):
+            if all(isinstance(width, int) and width > 0 for width in widths):
+                self.saved_column_widths = widths
+        snapshot = data.get("report_list")
+        if self.db is not None and isinstance(snapshot, dict) and snapshot.get("db") == str(self.db):
             try:
-                if state_file.exists():
-                    state_file.unlink()
-            except Exception:
+                self.report_list_snapshot = rows_from_snapshot(snapshot.get("rows"))
+            except (TypeError, ValueError):
                 pass
-            return
-        payload = {"last_db": str(db_path)}
-        state_file.write_text(json.dumps(payload), encoding="utf-8")
+
+    def save_last_db(self, db_path: Path | None, *, read_only: bool = False) -> None:
+        """Persist the provided database path, and whether it was opened as a read-only archive, to the
+        state file. If db_path is None the database, and the snapshot of its Report List, are forgotten.
+        """
+        data = self.read_state()
+        data.pop("report_list", None)
+        if db_path is None:
+            data.pop("last_db", None)
+            data.pop("read_only", None)
+        else:
+            data.update(last_db=str(db_path), read_only=read_only)
+        self.write_state(data)
+
+    def save_report_list_state(self) -> None:
+        """
+        Persist the Sort State, the column widths and a snapshot of the rows of the Report List, so the next session
+        can show the Report List as soon as its window opens.
+        """
+        data = self.read_state()
+        data["sort_column"] = self.sort_column
+        data["sort_ascending"] = self.sort_ascending
+        data["column_widths"] = [self.reports_table.columnWidth(i) for i in range(self.reports_table.columnCount())]
+        data.pop("report_list", None)
+        # the Report List of a folder is not what the next session shows first
+        if self.db is not None and self.folder_id is None and data.get("last_db") == str(self.db):
+            data["report_list"] = {"db": str(self.db), "rows": rows_to_snapshot(self.report_list_model.rows())}
+        self.write_state(data)
 
     def open_link(self, url: str):
         webbrowser.open(url)
 
     def submit_form(self, report: Report):
         assert self.db is not None
-        add_report_to_db(self.db, report)
-        self.refresh_reports_table()
-        i = self.stack.currentIndex()
+        if self.read_only:
+            self.statusBar().showMessage("Reports cannot be saved to a read-only archive.", 5000)
+            return
+        if report.id is None and self.folder_id is not None:
+            # new reports are created in the folder being shown
+            report.folder_id = self.folder_id
+        # The form stays open until the report is saved so nothing is lost if the write fails.
+        self.db_worker.submit(
+            add_report_to_db,
+            self.db,
+            report,
+            on_result=self.on_report_saved,
+            on_error=self.on_db_write_error,
+        )
+
+    def on_report_saved(self, row: ReportRow) -> None:
+        self.autosaver.discard()
+        if not self.report_list_model.update_row(row):
+            self.report_list_model.insert_row(row)
+        # the form is kept for the next report that is opened
         self.stack.setCurrentIndex(0)
-        widget = self.stack.widget(i)
-        if widget is not None:
-            # i == 0 when importing reports on the home screen
-            if i != 0:
-                self.stack.removeWidget(widget)
 
     @Slot()
     def cancel_form(self):
-        i = self.stack.currentIndex()
+        self.autosaver.discard()
+        # the form is kept for the next report that is opened
         self.stack.setCurrentIndex(0)
-        w = self.stack.widget(i)
-        if w is None:
-            raise Exception("No widget found at current stack index during cancel_form")
-        self.stack.removeWidget(w)
+
+    @Slot()
+    def recover_drafts(self) -> None:
+        """Offer to recover the reports whose edits were autosaved but never saved, e.g. because NAVFITX crashed."""
+        if not self.db or self.read_only:
+            return
+        self.db_worker.submit(get_drafts, self.db, on_result=self.on_drafts_loaded, on_error=self.on_db_read_error)
+
+    def on_drafts_loaded(self, drafts: list[Draft]) -> None:
+        # a report opened in the meantime is not replaced; the drafts are offered again next time
+        if not drafts or self.stack.currentIndex() != 0:
+            return
+        answer = QMessageBox.question(
+            self,
+            "Recover Unsaved Reports",
+            f"NAVFITX closed before the changes to {len(drafts)} report(s) were saved.\n\n"
+            "Open the most recently edited one to recover its changes? If not, the unsaved changes are discarded.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            for draft in drafts:
+                self.db_worker.submit(delete_draft, self.db, draft.key, on_error=self.on_db_write_error)
+            return
+        draft = drafts[0]
+        report = report_from_draft(draft)
+        self.open_report(report)
+        self.autosaver.start(self.db, self.get_report_form(report.doc_type), draft.key)
 
     def print_blank(self, report_type: str):
         filename, selected_filter = QFileDialog.getSaveFileName(
@@ -542,8 +913,7 @@ class Home(QMainWindow):
         # reports table
         self.refresh_reports_table()
 
-        db_path_str = f"{self.db}" if self.db else "No database open"
-        self.reports_table_label = QLabel(f"Reports ({db_path_str})")
+        self.reports_table_label = QLabel(self.get_reports_table_label_text())
         layout.addWidget(self.reports_table_label)
 
         layout.addWidget(self.reports_table, 1)
@@ -554,57 +924,143 @@ class Home(QMainWindow):
 
         return widget
 
-    def create_folder_tree(self) -> QTreeWidget:
-        folder_tree = QTreeWidget()
-        folder_tree.setWindowTitle("test")
-        folder_tree.setColumnCount(1)
-        folder_tree.setHeaderLabels(["Folders"])
-        root = QTreeWidgetItem(["Root"])
-        child = QTreeWidgetItem(["Child"])
-        root.addChild(child)
-        folder_tree.insertTopLevelItem(0, root)
+    def create_folder_tree(self) -> FolderTree:
+        folder_tree = FolderTree(self.db_worker)
+        folder_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        folder_tree.customContextMenuRequested.connect(self.show_folder_tree_context_menu)
+        folder_tree.folder_selected.connect(self.on_folder_selected)
+        folder_tree.set_database(self.db, read_only=self.read_only)
         return folder_tree
 
+    def reload_folders(self) -> None:
+        self.folder_id = None
+        self.folder_tree.set_database(self.db, read_only=self.read_only)
+
+    @Slot(object)
+    def on_folder_selected(self, folder_id: int | None) -> None:
+        if folder_id == self.folder_id:
+            return
+        self.folder_id = folder_id
+        self.refresh_reports_table()
+
+    @Slot(QPoint)
+    def show_folder_tree_context_menu(self, pos):
+        if not self.db:
+            return
+        item = self.folder_tree.itemAt(pos)
+        if item is not None:
+            self.folder_tree.setCurrentItem(item)
+        is_folder = self.folder_tree.folder_id(item) is not None
+        menu = QMenu(self)
+        new_action = menu.addAction("New Folder...")
+        new_action.setDisabled(self.read_only)
+        rename_action = menu.addAction("Rename Folder...")
+        rename_action.setDisabled(self.read_only or not is_folder)
+        delete_action = menu.addAction("Delete Folder")
+        delete_action.setDisabled(self.read_only or not is_folder)
+        action = menu.exec(self.folder_tree.viewport().mapToGlobal(pos))
+        if action == new_action:
+            self.create_folder_in_selected_folder()
+        elif action == rename_action:
+            self.rename_selected_folder()
+        elif action == delete_action:
+            self.delete_selected_folder()
+
+    @Slot()
+    def create_folder_in_selected_folder(self) -> None:
+        if not self.db or self.read_only:
+            return
+        name, ok = QInputDialog.getText(self, "New Folder", "Folder name:")
+        if not ok or not name.strip():
+            return
+        parent = self.folder_tree.currentItem()
+        parent_id = self.folder_tree.folder_id(parent)
+        self.db_worker.submit(
+            create_folder,
+            self.db,
+            name,
+            parent_id,
+            on_result=lambda row: self.on_folder_created(parent if parent_id is not None else None, row),
+            on_error=self.on_db_write_error,
+        )
+
+    def on_folder_created(self, parent: QTreeWidgetItem | None, row: FolderRow) -> None:
+        self.folder_tree.folder_created(parent, row)
+
+    def rename_selected_folder(self) -> None:
+        item = self.folder_tree.currentItem()
+        folder_id = self.folder_tree.folder_id(item)
+        if not self.db or self.read_only or item is None or folder_id is None:
+            return
+        name, ok = QInputDialog.getText(self, "Rename Folder", "Folder name:", text=item.text(0))
+        if not ok or not name.strip():
+            return
+        self.db_worker.submit(
+            rename_folder,
+            self.db,
+            folder_id,
+            name,
+            on_result=lambda _: item.setText(0, name.strip()),
+            on_error=self.on_db_write_error,
+        )
+
+    def delete_selected_folder(self) -> None:
+        item = self.folder_tree.currentItem()
+        folder_id = self.folder_tree.folder_id(item)
+        if not self.db or self.read_only or item is None or folder_id is None:
+            return
+        answer = QMessageBox.question(
+            self,
+            "Delete Folder",
+            f"Delete the folder {item.text(0)!r} and every folder inside it?\n\n"
+            "The reports in these folders are not deleted; they are moved to the parent folder.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+        self.db_worker.submit(
+            delete_folder,
+            self.db,
+            folder_id,
+            on_result=lambda _: self.on_folder_deleted(item),
+            on_error=self.on_db_write_error,
+        )
+
+    def on_folder_deleted(self, item: QTreeWidgetItem) -> None:
+        self.folder_tree.remove_folder(item)
+        # the reports of the deleted folders were moved into its parent, which may be the folder being shown
+        if self.folder_id is not None:
+            self.refresh_reports_table()
+
     @Slot(int, int)
     def edit_report_from_table(self, x: int, y: int):
-        item = self.reports_table.item(x, y)
-        assert item is not None
         if not self.db:
             return None
-        row = item.row()
-
-        # Assumes Record ID is col 5 and type is row 3
-        record_id_item = self.reports_table.item(row, 5)
-        assert record_id_item is not None
-
-        report_type_item = self.reports_table.item(row, self.REPORT_LIST_TYPE_COLUMN)
-        assert report_type_item is not None
-
-        record_id = int(record_id_item.text())
-        report_type = self.get_report_type_from_row(row)
-        assert report_type is not None
-
-        engine = create_engine(f"sqlite:///{self.db}")
-        with Session(engine) as session:
-            match report_type.lower():
-                case "fitrep":
-                    stmt = select(Fitrep).where(Fitrep.id == record_id)
-                    report = session.exec(stmt).first()
-                    assert report is not None
-                    self.open_fitrep_dialog(report)
-                case "eval":
-                    stmt = select(Eval).where(Eval.id == record_id)
-                    report = session.exec(stmt).first()
-                    assert report is not None
-                    self.open_eval_dialog(report)
-                case "chiefeval":
-                    stmt = select(ChiefEval).where(ChiefEval.id == record_id)
-                    report = session.exec(stmt).first()
-                    assert report is not None
-                    self.open_chiefeval_dialog(report)
-                case _:
-                    print("unknown report type")
-                    return
+
+        key = self.get_report_key_from_row(x)
+        if key is None:
+            return None
+        self.db_worker.submit(
+            partial(get_report, read_only=self.read_only),
+            self.db,
+            key,
+            kind=self.OPEN_REPORT_JOB,
+            on_result=self.open_report,
+            on_error=self.on_db_read_error,
+        )
+
+    def open_report(self, report: Report | None) -> None:
+        match report:
+            case Fitrep():
+                self.open_fitrep_dialog(report)
+            case Eval():
+                self.open_eval_dialog(report)
+            case ChiefEval():
+                self.open_chiefeval_dialog(report)
+            case None:
+                # the report was deleted after the Report List was loaded
+                self.statusBar().showMessage("The selected report no longer exists.", 5000)
+                self.refresh_reports_table()
 
     @Slot(int)
     def sort_reports_by_column(self, column: int) -> None:
@@ -615,102 +1071,43 @@ class Home(QMainWindow):
             self.sort_ascending = True
         self.render_reports_table()
 
+    def get_sort_order(self) -> Qt.SortOrder:
+        return Qt.SortOrder.AscendingOrder if self.sort_ascending else Qt.SortOrder.DescendingOrder
+
     def update_sort_indicator(self) -> None:
-        sort_order = Qt.SortOrder.AscendingOrder if self.sort_ascending else Qt.SortOrder.DescendingOrder
-        self.reports_table.horizontalHeader().setSortIndicator(self.sort_column, sort_order)
-
-    def get_report_id_for_sort(self, report: Report) -> int:
-        if report.id is None:
-            return -1
-        return report.id
-
-    def get_period_end_for_sort(self, report: Report) -> date | None:
-        period_end = report.period_end
-        if isinstance(period_end, date):
-            return period_end
-        if isinstance(period_end, str):
-            try:
-                return date.fromisoformat(period_end)
-            except ValueError:
-                return None
-        return None
-
-    def get_sorted_reports(self) -> list[Report]:
-        reports = list(self._reports_cache)
-        if self.sort_column == 4:
-
-            def period_end_key(report: Report) -> tuple[bool, date | int, int]:
-                period_end = self.get_period_end_for_sort(report)
-                report_id = self.get_report_id_for_sort(report)
-                if self.sort_ascending:
-                    return (period_end is None, period_end or date.min, -report_id)
-                return (period_end is None, -(period_end or date.min).toordinal(), -report_id)
-
-            return sorted(reports, key=period_end_key)
-
-        if self.sort_column == 5:
-            return sorted(
-                reports,
-                key=lambda report: self.get_report_id_for_sort(report),
-                reverse=not self.sort_ascending,
-            )
-        if self.sort_column == 3:
-            return sorted(
-                reports,
-                key=lambda report: report.doc_type.casefold(),
-                reverse=not self.sort_ascending,
-            )
-        if self.sort_column == 2:
-            return sorted(
-                reports,
-                key=lambda report: report.ssn.casefold(),
-                reverse=not self.sort_ascending,
-            )
-        if self.sort_column == 1:
-            return sorted(
-                reports,
-                key=lambda report: report.name.casefold(),
-                reverse=not self.sort_ascending,
-            )
-        return sorted(
-            reports,
-            key=lambda report: report.rate.casefold(),
-            reverse=not self.sort_ascending,
-        )
+        self.reports_table.horizontalHeader().setSortIndicator(self.sort_column, self.get_sort_order())
 
     def render_reports_table(self) -> None:
-        self.reports_table.clearContents()
-        sorted_reports = self.get_sorted_reports()
-        self.reports_table.setRowCount(len(sorted_reports))
-        for i, report in enumerate(sorted_reports):
-            self.reports_table.setItem(i, 0, QTableWidgetItem(report.rate))
-            self.reports_table.setItem(i, 1, QTableWidgetItem(report.name))
-            self.reports_table.setItem(i, 2, QTableWidgetItem(report.ssn))
-            report_type_item = QTableWidgetItem(self.get_report_type_display_name(report.doc_type))
-            report_type_item.setData(self.REPORT_LIST_TYPE_ROLE, report.doc_type)
-            self.reports_table.setItem(i, self.REPORT_LIST_TYPE_COLUMN, report_type_item)
-            period_end = self.get_period_end_for_sort(report)
-            self.reports_table.setItem(i, 4, QTableWidgetItem(str(period_end) if period_end else ""))
-            self.reports_table.setItem(i, 5, QTableWidgetItem(str(report.id) if report.id is not None else ""))
+        self.report_list_model.sort(self.sort_column, self.get_sort_order())
         self.update_sort_indicator()
 
     def refresh_reports_table(self):
-        self.reports_table.clearContents()
-        self.reports_table.setRowCount(0)
-        self._reports_cache = []
         if not self.db:
+            self.db_worker.cancel_kind(self.REPORT_LIST_JOB)
+            self.on_reports_loaded([])
             return
 
-        engine = create_engine(f"sqlite:///{self.db}")
-        with Session(engine) as session:
-            stmt = select(Fitrep)
-            results: list[Report] = list(session.exec(stmt))
-            stmt = select(Eval)
-            results.extend(list(session.exec(stmt)))
-            stmt = select(ChiefEval)
-            results.extend(list(session.exec(stmt)))
-            self._reports_cache = results
-            self.render_reports_table()
+        # The current rows stay visible until the new ones arrive. A refresh supersedes any that is still pending.
+        self.statusBar().showMessage("Loading reports...")
+        where = None if self.folder_id is None else {"folder_id": self.folder_id}
+        self.db_worker.submit(
+            partial(get_report_rows, where=where, read_only=self.read_only),
+            self.db,
+            kind=self.REPORT_LIST_JOB,
+            on_result=self.on_reports_loaded,
+            on_error=self.on_db_read_error,
+        )
+
+    def on_reports_loaded(self, rows: list[ReportRow]) -> None:
+        if self.report_list_model.has_rows(rows):
+            # e.g. the snapshot painted at startup was up to date; keeping it keeps the selection and scroll position
+            self.statusBar().clearMessage()
+            return
+        self.report_list_model.sort_column = self.sort_column
+        self.report_list_model.sort_order = self.get_sort_order()
+        self.report_list_model.set_rows(rows)
+        self.update_sort_indicator()
+        self.statusBar().clearMessage()
 
     def create_buttons_groupbox(self) -> QGroupBox:
         group_box = QGroupBox()
@@ -0,0 +1,169 @@
+import multiprocessing
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
+
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QHideEvent, QImage, QPixmap, QShowEvent
+from PySide6.QtWidgets import QLabel, QScrollArea, QVBoxLayout, QWidget
+
+from navfitx.models import Report
+from navfitx.printing import render_changed_pages
+
+from .worker import BackgroundWorker
+
+PREVIEW_ZOOM = 1.25
+PREVIEW_DEBOUNCE_MS = 400
+
+# The process every preview is rendered in, started by the first render. pymupdf must not be used from several threads
+# at the same time, and the main thread uses it too, e.g. to export a PDF or merge printed reports, so previews are
+# rendered in a process of their own rather than on the thread of their worker.
+_render_process: ProcessPoolExecutor | None = None
+
+
+def render_process() -> ProcessPoolExecutor:
+    global _render_process
+    if _render_process is None:
+        # Qt has threads running in this process, which a forked worker would inherit in an unknown state
+        _render_process = ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn"))
+    return _render_process
+
+
+class RenderedPage(NamedTuple):
+    page: int
+    digest: bytes
+    image: QImage
+
+
+def render_preview(
+    process: ProcessPoolExecutor, report: Report, digests: Mapping[int, bytes], zoom: float = PREVIEW_ZOOM
+) -> list[RenderedPage]:
+    """
+    Render the pages of a report that changed since `digests` (see `render_changed_pages`) in `process`, and wait
+    for their images.
+
+    QImage (unlike QPixmap) may be created off the main thread, so this can run on a worker.
+    """
+    pages = process.submit(render_changed_pages, report, dict(digests), zoom).result()
+    return [
+        RenderedPage(
+            page.page,
+            page.digest,
+            # the image must own its pixels, which otherwise belong to the bytes of the page
+            QImage(page.samples, page.width, page.height, page.stride, QImage.Format.Format_RGB888).copy(),
+        )
+        for page in pages
+    ]
+
+
+class ReportPreview(QWidget):
+    """
+    Pane showing the PDF of the report being edited, kept current as the user types.
+
+    Edits are debounced with `schedule_render`: the preview is rendered `PREVIEW_DEBOUNCE_MS` after the last one, in
+    the render process (see `render_process`) so typing never waits on pymupdf. A newer render supersedes one that has not finished. The last
+    image of every page is kept and only pages whose content changed are rendered again.
+    """
+
+    RENDER_JOB = "render_preview"
+
+    # page numbers that were rendered again
+    pages_rendered = Signal(list)
+
+    def __init__(self, get_report: Callable[[], Report], parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.get_report = get_report
+        self.worker = BackgroundWorker(self)
+        self.pixmaps: dict[int, QPixmap] = {}
+        self.digests: dict[int, bytes] = {}
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self.timer.timeout.connect(self.render_now)
+
+        self.status = QLabel()
+        self.status.setWordWrap(True)
+        self.status.hide()
+
+        self.pages = QWidget()
+        self.pages_layout = QVBoxLayout(self.pages)
+        self.pages_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self.page_labels: list[QLabel] = []
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setWidget(self.pages)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.status)
+        layout.addWidget(scroll_area)
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        super().showEvent(event)
+        self.render_now()
+
+    def hideEvent(self, event: QHideEvent) -> None:  # noqa: N802
+        super().hideEvent(event)
+        self.cancel()
+
+    @Slot()
+    def schedule_render(self) -> None:
+        """Render the preview once no more edits have been made for `PREVIEW_DEBOUNCE_MS`."""
+        if self.isVisible():
+            self.timer.start()
+
+    @Slot()
+    def render_now(self) -> None:
+        self.timer.stop()
+        try:
+            report = self.get_report()
+        except ValueError as err:
+            # the last preview stays visible until the form can be saved again
+            self.show_status(f"Preview not updated: {err}")
+            return
+        self.worker.submit(
+            render_preview,
+            render_process(),
+            report,
+            dict(self.digests),
+            kind=self.RENDER_JOB,
+            on_result=self.on_pages_rendered,
+            on_error=self.on_render_failed,
+        )
+
+    def cancel(self) -> None:
+        self.timer.stop()
+        self.worker.cancel_kind(self.RENDER_JOB)
+
+    def wait(self) -> None:
+        """Block until a pending render has been shown."""
+        if self.timer.isActive():
+            self.render_now()
+        self.worker.wait()
+
+    def show_status(self, text: str) -> None:
+        self.status.setText(text)
+        self.status.setVisible(bool(text))
+
+    def on_render_failed(self, exc: Exception) -> None:
+        global _render_process
+        if isinstance(exc, BrokenProcessPool):
+            # the render process died, so the next render starts a new one
+            _render_process = None
+        self.show_status(f"Unable to render preview: {exc}")
+
+    def on_pages_rendered(self, pages: list[RenderedPage]) -> None:
+        self.show_status("")
+        for page in pages:
+            while len(self.page_labels) <= page.page:
+                label = QLabel()
+                self.pages_layout.addWidget(label)
+                self.page_labels.append(label)
+            pixmap = QPixmap.fromImage(page.image)
+            self.pixmaps[page.page] = pixmap
+            self.digests[page.page] = page.digest
+            self.page_labels[page.page].setPixmap(pixmap)
+        self.pages_rendered.emit([page.page for page in pages])
@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple
+
+import pymupdf
+from PySide6.QtCore import QCoreApplication, QObject, Signal, Slot
+
+from navfitx.db import ReportKey
+from navfitx.printing import RenderedReport, render_report
+
+
+class PrintFailure(NamedTuple):
+    key: ReportKey
+    error: str
+
+
+class ReportPrinter(QObject):
+    """
+    Prints a selection of reports into one merged PDF, or into a folder with a PDF per report.
+
+    The reports are filled out on a pool of worker processes and the window stays responsive while they are. Each
+    finished report is written (or appended to the merged PDF, in selection order) on the main thread as it arrives.
+    A report that cannot be printed is recorded in `failures` and the others are still printed.
+    """
+
+    # number of reports that have been printed or have failed
+    progress = Signal(int)
+    # emitted once, when every report is done or printing was cancelled
+    finished = Signal()
+
+    _rendered = Signal(int, object)
+    _failed = Signal(int, object)
+
+    def __init__(
+        self,
+        db_path: Path,
+        keys: Iterable[ReportKey],
+        output: Path,
+        *,
+        merge: bool,
+        read_only: bool = False,
+        max_workers: int | None = None,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.db_path = db_path
+        self.keys = list(keys)
+        self.output = output
+        self.merge = merge
+        self.read_only = read_only
+        self.max_workers = max_workers
+        self.printed = 0
+        self.failures: list[PrintFailure] = []
+        # an error that stopped the merged PDF from being saved
+        self.error: str | None = None
+        self.cancelled = False
+        self.is_finished = False
+        self._done = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._merged: pymupdf.Document | None = None
+        # rendered PDFs waiting for the ones before them to be merged (None for reports that failed)
+        self._pending: dict[int, bytes | None] = {}
+        self._next_index = 0
+        self._rendered.connect(self._on_rendered)
+        self._failed.connect(self._on_failed)
+
+    def start(self) -> None:
+        if not self.keys:
+            self._finish()
+            return
+        if self.merge:
+            self._merged = pymupdf.open()
+        else:
+            self.output.mkdir(parents=True, exist_ok=True)
+        workers = self.max_workers or min(len(self.keys), os.process_cpu_count() or 1)
+        # Qt has threads running in this process, which a forked worker would inherit in an unknown state
+        self._executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        for index, key in enumerate(self.keys):
+            future = self._executor.submit(render_report, self.db_path, key, self.read_only)
+            future.add_done_callback(partial(self._on_future_done, index))
+
+    def cancel(self) -> None:
+        """Stop printing. Reports already written to a folder are kept, and no merged PDF is saved."""
+        if self.is_finished:
+            return
+        self.cancelled = True
+        self._finish()
+
+    def wait(self, timeout: float = 120.0) -> None:
+        """Block until printing has finished."""
+        deadline = time.monotonic() + timeout
+        while not self.is_finished and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.01)
+
+    def _on_future_done(self, index: int, future: Future) -> None:
+        # runs on a thread of the executor, so the result is handed to the main thread with a signal
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is None:
+            self._rendered.emit(index, future.result())
+        else:
+            self._failed.emit(index, exc)
+
+    @Slot(int, object)
+    def _on_rendered(self, index: int, rendered: RenderedReport) -> None:
+        if self.is_finished:
+            return
+        if self.merge:
+            self._pending[index] = rendered.pdf
+            self._merge_pending()
+        else:
+            try:
+                (self.output / rendered.filename).write_bytes(rendered.pdf)
+            except OSError as exc:
+                self._on_failed(index, exc)
+                return
+        self.printed += 1
+        self._report_done()
+
+    @Slot(int, object)
+    def _on_failed(self, index: int, exc: Exception) -> None:
+        if self.is_finished:
+            return
+        self.failures.append(PrintFailure(self.keys[index], str(exc)))
+        if self.merge:
+            self._pending[index] = None
+            self._merge_pending()
+        self._report_done()
+
+    def _merge_pending(self) -> None:
+        assert self._merged is not None
+        while self._next_index in self._pending:
+            pdf = self._pending.pop(self._next_index)
+            if pdf is not None:
+                with pymupdf.open(stream=pdf, filetype="pdf") as doc:
+                    self._merged.insert_pdf(doc)
+            self._next_index += 1
+
+    def _report_done(self) -> None:
+        self._done += 1
+        self.progress.emit(self._done)
+        if self._done == len(self.keys):
+            self._finish()
+
+    def _finish(self) -> None:
+        self.is_finished = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._merged is not None:
+            try:
+                if not self.cancelled and self.printed:
+                    self._merged.save(str(self.output), garbage=1, deflate=True)
+            except Exception as exc:
+                self.error = str(exc)
+            finally:
+                self._merged.close()
+        order = {key: index for index, key in enumerate(self.keys)}
+        self.failures.sort(key=lambda failure: order[failure.key])
+        self.finished.emit()
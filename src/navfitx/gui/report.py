@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import json
+from datetime import date
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable, Generic, TypeVar
 
 from pydantic import ValidationError
-from PySide6.QtCore import QDate, QRegularExpression, Slot
+from PySide6.QtCore import QDate, QRegularExpression, Qt, Signal, Slot
 from PySide6.QtGui import QFont, QRegularExpressionValidator, QTextOption
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -23,16 +25,47 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QScrollArea,
+    QSplitter,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from navfitx.constants import DUTIES_DESC_SPACE_FOR_ABBREV
-from navfitx.models import BilletSubcategory, DutyStatus, PromotionRecommendation, PromotionStatus, Report
+from navfitx.layout import chars_per_line
+from navfitx.models import (
+    BilletSubcategory,
+    DutyStatus,
+    PromotionRecommendation,
+    PromotionStatus,
+    Report,
+    Rsca,
+    RscaKey,
+    SummaryGroup,
+    SummaryGroupKey,
+    quota_violations,
+    rsca_key,
+    summary_group_key,
+)
+from navfitx.validation import ReportValidator
+
+from .preview import ReportPreview
 
 TReport = TypeVar("TReport", bound=Report)
 
+# The date a QDateEdit shows before a date is set
+BLANK_DATE = QDate(2000, 1, 1)
+
+TRAIT_FIELDS = frozenset(f"trait{i}" for i in range(1, 8))
+
+# The fields of a report that identify the RSCA its trait average counts towards
+RSCA_KEY_FIELDS = ("senior_name", "senior_ssn", "senior_uic", "rate")
+
+# The fields of a report that identify the summary group its promotion recommendation counts towards
+SUMMARY_GROUP_KEY_FIELDS = (*RSCA_KEY_FIELDS, "period_end", "promotion_status")
+
+VALIDATION_ERROR_COLOR = "#c0392b"
+
 
 class NoScrollDateEdit(QDateEdit):
     """QDateEdit that ignores wheel events to prevent accidental changes."""
@@ -52,6 +85,13 @@ class BaseReportForm(QWidget, Generic[TReport]):
     """Shared Qt scaffolding for report data-entry forms."""
 
     window_title = "Report Data Entry"
+
+    # emitted whenever the user edits a field of the report
+    edited = Signal()
+    # emitted when a field of `rsca_key` is edited, so the RSCA shown can be looked up again
+    rsca_key_changed = Signal()
+    # emitted when a field of `summary_group_key` is edited, so the summary group shown can be looked up again
+    summary_group_key_changed = Signal()
     pdf_default_name = "report.pdf"
     trait_options = {
         "": None,
@@ -79,6 +119,12 @@ class BaseReportForm(QWidget, Generic[TReport]):
         self.on_accept: Callable = on_accept
         self.on_reject: Callable = on_reject
         self.report: TReport = report
+        # the RSCA of the reporting senior for the member's paygrade, set by the window that opened the report
+        self.rsca: Rsca | None = None
+        # the saved promotion recommendation counts of the summary group entered in the form, set the same way
+        self.summary_group: SummaryGroup | None = None
+        # the summary group and promotion recommendation the report counts towards as it was opened, if it was saved
+        self.saved_promotion: tuple[SummaryGroupKey, int | None] | None = None
 
         self.setWindowTitle(self.window_title)
 
@@ -96,12 +142,252 @@ class BaseReportForm(QWidget, Generic[TReport]):
 
         self.button_box = self.build_button_box()
 
+        # The PDF preview is hidden until it is turned on from the View menu
+        self.preview = ReportPreview(self.draft_report)
+        self.preview.hide()
+        self._preview_connected = False
+        self.splitter = QSplitter(Qt.Orientation.Horizontal)
+        self.splitter.addWidget(self.scroll_area)
+        self.splitter.addWidget(self.preview)
+
+        # Fields are validated as they are edited, see `start_validation`
+        self.validator: ReportValidator | None = None
+        self.edited_fields: set[str] = set()
+        self._loading = False
+        self.validation_label = QLabel()
+        self.validation_label.setStyleSheet(f"color: {VALIDATION_ERROR_COLOR};")
+        self.validation_label.setWordWrap(True)
+        self.validation_label.hide()
+
         layout = QVBoxLayout(self)
-        layout.addWidget(self.scroll_area)
+        layout.addWidget(self.splitter)
+        layout.addWidget(self.validation_label)
         layout.addWidget(self.button_box)
 
         self.build_fields()
-        self.build_menu()
+
+    def bind(self, report: TReport) -> None:
+        """
+        Show another report in the form. A form is built once and then rebound to each report that is opened, which
+        is much faster than building a new form.
+        """
+        self.report = report
+        self._loading = True
+        try:
+            self.load_form()
+        finally:
+            self._loading = False
+        self.scroll_area.verticalScrollBar().setValue(0)
+        self.rsca = None
+        self.show_trait_average()
+        self.summary_group = None
+        self.saved_promotion = None
+        if report.id is not None:
+            self.saved_promotion = (self.saved_summary_group_key(), report.indiv_promo_rec)
+        self.show_promotion_quota()
+        self.start_validation()
+        if not self.preview.isHidden():
+            self.preview.render_now()
+
+    def field_widgets(self) -> dict[str, QWidget]:
+        """The widget of every report field that is edited in the form."""
+        widgets = {}
+        for name in self.report_type.model_fields:
+            widget = getattr(self, name, None)
+            if isinstance(widget, QWidget):
+                widgets[name] = widget
+        return widgets
+
+    def field_value(self, name: str) -> Any:
+        """The value of a report field as it is currently entered in its widget, before any field validators."""
+        widget = getattr(self, name)
+        if isinstance(widget, QLineEdit):
+            return widget.text()
+        if isinstance(widget, QTextEdit):
+            text = widget.toPlainText()
+            return text.strip() if name == "duties_description" else text
+        if isinstance(widget, QCheckBox):
+            return widget.isChecked()
+        if isinstance(widget, QDateEdit):
+            return widget.date().toPython()
+        if isinstance(widget, QComboBox):
+            if name == "indiv_promo_rec":
+                return self.promotion_recs[widget.currentText()]
+            if name in TRAIT_FIELDS:
+                return self.trait_options[widget.currentText()]
+            return widget.currentData()
+        raise TypeError(f"No value for widget of field {name!r}")
+
+    def start_validation(self) -> None:
+        """
+        Validate the fields of the report in the form, then keep validating them one at a time as they are edited.
+
+        Errors are only shown for fields edited since the report was opened, so a new report does not start out
+        covered in errors. The errors of model validators (e.g. the order of the report dates) are listed below the
+        form once one of the fields they check has been edited.
+        """
+        widgets = self.field_widgets()
+        if self.validator is None:
+            for name, widget in widgets.items():
+                for signal in self.change_signals(widget):
+                    signal.connect(partial(self.on_field_edited, name))
+        values = self.report.model_dump()
+        values.update((name, self.field_value(name)) for name in widgets)
+        self.validator = ReportValidator(self.report_type, values)
+        self.edited_fields.clear()
+        self.show_field_errors()
+
+    @staticmethod
+    def change_signals(widget: QWidget) -> list[Any]:
+        if isinstance(widget, (QLineEdit, QTextEdit)):
+            return [widget.textChanged]
+        if isinstance(widget, QCheckBox):
+            return [widget.toggled]
+        if isinstance(widget, QDateEdit):
+            return [widget.dateChanged]
+        if isinstance(widget, QComboBox):
+            return [widget.currentIndexChanged]
+        return []
+
+    def on_field_edited(self, name: str, *_) -> None:
+        if self._loading or self.validator is None:
+            return
+        self.edited_fields.add(name)
+        self.validator.set_field(name, self.field_value(name))
+        self.show_field_errors()
+        if name in TRAIT_FIELDS:
+            self.show_trait_average()
+        elif name == "indiv_promo_rec":
+            self.show_promotion_quota()
+        if name in RSCA_KEY_FIELDS:
+            self.rsca_key_changed.emit()
+        if name in SUMMARY_GROUP_KEY_FIELDS:
+            self.summary_group_key_changed.emit()
+        self.edited.emit()
+
+    def rsca_key(self) -> RscaKey:
+        """
+        The key of the RSCA of the reporting senior and paygrade currently entered in the form, with the values
+        `save_form` would store for them.
+        """
+        return rsca_key(*(self.field_value(field) for field in RSCA_KEY_FIELDS))
+
+    @Slot(object)
+    def set_rsca(self, rsca: Rsca | None) -> None:
+        self.rsca = rsca
+        self.show_trait_average()
+
+    def show_trait_average(self) -> None:
+        """Show the member trait average of the traits entered so far next to the RSCA, so the two can be compared."""
+        observed = [grade for grade in (self.field_value(name) for name in sorted(TRAIT_FIELDS)) if grade]
+        if not observed:
+            text = "No traits graded"
+        else:
+            average = sum(observed) / len(observed)
+            text = f"{average:.2f}"
+            if self.rsca is not None and self.rsca.reports:
+                text += (
+                    f"   RSCA {self.rsca.average:.2f} over {self.rsca.reports} report(s), "
+                    f"{average - self.rsca.average:+.2f}"
+                )
+        self.trait_average.setText(text)
+
+    def summary_group_key(self) -> SummaryGroupKey:
+        """
+        The key of the summary group of the fields as they are entered in the form, with the values `save_form` would
+        store for them.
+        """
+        return summary_group_key(*(self.field_value(field) for field in SUMMARY_GROUP_KEY_FIELDS))
+
+    def saved_summary_group_key(self) -> SummaryGroupKey:
+        """The key of the summary group the report counts towards in the database."""
+        return summary_group_key(*(getattr(self.report, field) for field in SUMMARY_GROUP_KEY_FIELDS))
+
+    @Slot(object)
+    def set_summary_group(self, summary_group: SummaryGroup | None) -> None:
+        self.summary_group = summary_group
+        self.show_promotion_quota()
+
+    def show_promotion_quota(self) -> None:
+        """
+        Show the promotion recommendations of the summary group with the one entered in the form, and whether they
+        are over the limits of the group. The saved recommendation of the report is replaced by the entered one.
+        """
+        counts = self.summary_group.counts() if self.summary_group is not None else [0] * len(PromotionRecommendation)
+        key = self.summary_group_key()
+        if self.saved_promotion is not None:
+            saved_key, saved = self.saved_promotion
+            if saved is not None and saved_key == key and counts[saved] > 0:
+                counts[saved] -= 1
+        entered = self.field_value("indiv_promo_rec")
+        if entered is not None:
+            counts[entered] += 1
+        if not any(counts):
+            self.promotion_quota.clear()
+            return
+        size = sum(counts) - counts[PromotionRecommendation.NOB.value]
+        text = (
+            f"Summary group of {size}: {counts[PromotionRecommendation.MUST_PROMOTE.value]} MP, "
+            f"{counts[PromotionRecommendation.EARLY_PROMOTE.value]} EP"
+        )
+        violations = quota_violations(key[3], counts)
+        self.promotion_quota.setText("\n".join([text, *violations]))
+        self.promotion_quota.setStyleSheet(f"color: {VALIDATION_ERROR_COLOR};" if violations else "")
+
+    def show_field_errors(self) -> None:
+        assert self.validator is not None
+        for name, widget in self.field_widgets().items():
+            error = self.validator.field_errors.get(name) if name in self.edited_fields else None
+            if error is None and widget.property("validationError"):
+                widget.setProperty("validationError", False)
+                widget.setStyleSheet("")
+                widget.setToolTip("")
+            elif error is not None:
+                widget.setProperty("validationError", True)
+                widget.setStyleSheet(f"border: 1px solid {VALIDATION_ERROR_COLOR};")
+                widget.setToolTip(error)
+
+        messages = [
+            f"{self.field_title(name)}: {error}"
+            for name, error in self.validator.field_errors.items()
+            if name in self.edited_fields
+        ]
+        messages.extend(
+            error
+            for validator, error in self.validator.model_errors.items()
+            if self.validator.model_validator_fields(validator) & self.edited_fields
+        )
+        self.validation_label.setText("\n".join(messages))
+        self.validation_label.setVisible(bool(messages))
+
+    def draft_report(self) -> TReport:
+        """A copy of the report with the current state of the widgets. self.report is left untouched."""
+        report = self.report
+        self.report = self.report_type(**report.model_dump())
+        try:
+            self.save_form()
+            return self.report
+        finally:
+            self.report = report
+
+    @Slot(bool)
+    def set_preview_visible(self, visible: bool) -> None:
+        if visible and not self._preview_connected:
+            # every edit restarts the preview's debounce timer
+            for line_edit in self.container.findChildren(QLineEdit):
+                line_edit.textChanged.connect(self.preview.schedule_render)
+            for text_edit in self.container.findChildren(QTextEdit):
+                text_edit.textChanged.connect(self.preview.schedule_render)
+            for combo in self.container.findChildren(QComboBox):
+                combo.currentIndexChanged.connect(self.preview.schedule_render)
+            for checkbox in self.container.findChildren(QCheckBox):
+                checkbox.toggled.connect(self.preview.schedule_render)
+            for date_edit in self.container.findChildren(QDateEdit):
+                date_edit.dateChanged.connect(self.preview.schedule_render)
+            self._preview_connected = True
+        if not visible:
+            self.preview.cancel()
+        self.preview.setVisible(visible)
 
     @property
     def report_type(self) -> type[TReport]:
@@ -273,19 +559,19 @@ class BaseReportForm(QWidget, Generic[TReport]):
         self.job.setFont(QFont("Courier"))
         self.job.setPlaceholderText("Maximum of 3 lines. Excess lines will be trimmed.")
         self.job.setWordWrapMode(QTextOption.WrapMode.WordWrap)
-        self.job.setLineWrapColumnOrWidth(92)
+        self.job.setLineWrapColumnOrWidth(chars_per_line(self.report_type.TEXT_BOXES["job"]))
         self.job.setText(self.report.job)
         line_height = self.job.fontMetrics().lineSpacing()
         self.job.setFixedHeight(int(line_height * 3.6))  # I don't know why, but 4 isn't quite tall enough.
         # self.job.setFixedWidth(900)
         self.job_label = QLabel(
             f"Command Employment and\nCommand Achievements\n"
-            f"(Line Count: {len(self.report_type.wrap_text(self.job.toPlainText(), 92).split('\n'))}/3)"
+            f"(Line Count: {len(self.report_type.layout_text('job', self.job.toPlainText()))}/3)"
         )
         self.job.textChanged.connect(
             lambda: self.job_label.setText(
                 f"Command Employment and\nCommand Achievements\n"
-                f"(Line Count: {len(self.report_type.wrap_text(self.job.toPlainText(), 92).split('\n'))}/3)"
+                f"(Line Count: {len(self.report_type.layout_text('job', self.job.toPlainText()))}/3)"
             )
         )
         self.form.addWidget(self.job_label, 11, 0)
@@ -307,7 +593,9 @@ class BaseReportForm(QWidget, Generic[TReport]):
             self.duties_description.setText(" " * DUTIES_DESC_SPACE_FOR_ABBREV)
         else:
             self.duties_description.setText(f"{' ' * DUTIES_DESC_SPACE_FOR_ABBREV}{self.report.duties_description}")
-        self.duties_description.setLineWrapColumnOrWidth(91)
+        self.duties_description.setLineWrapColumnOrWidth(
+            chars_per_line(self.report_type.TEXT_BOXES["duties_description"])
+        )
         line_height = self.duties_description.fontMetrics().lineSpacing()
         self.duties_description.setFixedHeight(
             int(line_height * 4.6)
@@ -350,12 +638,19 @@ class BaseReportForm(QWidget, Generic[TReport]):
         self.form.addWidget(self.trait6, 18, 3)
         self.trait7 = self.create_trait_combo(self.report.trait7)
         self.form.addWidget(self.trait7, 19, 1)
+        self.add_label("Member Trait Average", 19, 2)
+        self.trait_average = QLabel()
+        self.trait_average.setToolTip(
+            "The average of the observed traits, and the Reporting Senior Cumulative Average (RSCA) of the saved "
+            "reports of this reporting senior for members of this rate or grade."
+        )
+        self.form.addWidget(self.trait_average, 19, 3)
 
         self.career_rec_1 = QTextEdit(tabChangesFocus=True, lineWrapMode=QTextEdit.LineWrapMode.FixedColumnWidth)
         self.career_rec_1.setPlaceholderText("Maximum of 20 characters and two lines.")
         self.career_rec_1.setWordWrapMode(QTextOption.WrapMode.WrapAnywhere)
         self.career_rec_1.setText(self.report.career_rec_1)
-        self.career_rec_1.setLineWrapColumnOrWidth(13)
+        self.career_rec_1.setLineWrapColumnOrWidth(chars_per_line(self.report_type.TEXT_BOXES["career_rec_1"]))
         self.career_rec_1.setFont(QFont("Courier"))
         line_spacing = self.career_rec_1.fontMetrics().lineSpacing()
         self.career_rec_1.setFixedHeight(int(line_spacing * 2.6))
@@ -368,7 +663,7 @@ class BaseReportForm(QWidget, Generic[TReport]):
         self.career_rec_1.setPlaceholderText("Maximum of 20 characters and two lines.")
         self.career_rec_2.setWordWrapMode(QTextOption.WrapMode.WordWrap)
         self.career_rec_2.setText(self.report.career_rec_2)
-        self.career_rec_2.setLineWrapColumnOrWidth(13)
+        self.career_rec_2.setLineWrapColumnOrWidth(chars_per_line(self.report_type.TEXT_BOXES["career_rec_2"]))
         self.career_rec_2.setFont(QFont("Courier"))
         line_height = self.career_rec_2.fontMetrics().lineSpacing()
         self.career_rec_2.setFixedHeight(int(line_height * 2.6))
@@ -379,19 +674,19 @@ class BaseReportForm(QWidget, Generic[TReport]):
         self.comments.setText(self.report.comments)
         self.comments.setPlaceholderText("Maximum of 18 lines. Excess lines will be trimmed.")
         self.comments.setWordWrapMode(QTextOption.WrapMode.WordWrap)
-        self.comments.setLineWrapColumnOrWidth(92)
+        self.comments.setLineWrapColumnOrWidth(chars_per_line(self.report_type.TEXT_BOXES["comments"]))
         self.comments.setFont(QFont("Courier"))
         line_height = self.comments.fontMetrics().lineSpacing()
         self.comments.setFixedHeight(int(line_height * 18))
         self.comments.setFixedWidth(900)
         # self.comments.textChanged.connect(self.validate_comments)
         self.comments_label = QLabel(
-            f"Comments\n\n(Line Count: {len(self.report_type.wrap_text(self.comments.toPlainText(), 92).split('\n'))}/18)"
+            f"Comments\n\n(Line Count: {len(self.report_type.layout_text('comments', self.comments.toPlainText()))}/18)"
         )
         # num_lines = len(Fitrep.format_comments(self.comments.toPlainText()).split())
         self.comments.textChanged.connect(
             lambda: self.comments_label.setText(
-                f"Comments\n\n(Line Count: {len(self.report_type.wrap_text(self.comments.toPlainText(), 92).split('\n'))}/18)"
+                f"Comments\n\n(Line Count: {len(self.report_type.layout_text('comments', self.comments.toPlainText()))}/18)"
             )
         )
 
@@ -400,11 +695,16 @@ class BaseReportForm(QWidget, Generic[TReport]):
 
         combo = NoScrollComboBox()
         combo.addItems([p for p in BaseReportForm.promotion_recs.keys()])
-        if p := self.report.indiv_promo_rec is not None:
-            combo.setCurrentIndex(p + 1)
+        self.set_combo_option(combo, self.promotion_recs, self.report.indiv_promo_rec)
         self.indiv_promo_rec = combo
         self.form.addWidget(QLabel("Promotion Recommendation"), 24, 0)
         self.form.addWidget(self.indiv_promo_rec, 24, 1)
+        self.promotion_quota = QLabel()
+        self.promotion_quota.setToolTip(
+            "The promotion recommendations of the summary group: the saved reports of this reporting senior for "
+            "members of this rate or grade and promotion status with this period end, counting this report as entered."
+        )
+        self.form.addWidget(self.promotion_quota, 24, 2, 1, 2)
 
         self.senior_address = QTextEdit()
         self.senior_address.setText(self.report.senior_address)
@@ -418,6 +718,66 @@ class BaseReportForm(QWidget, Generic[TReport]):
         self.form.addWidget(QLabel("Reporting Senior Address"), 25, 0)
         self.form.addWidget(self.senior_address, 25, 1, 1, 3)
 
+    def load_form(self) -> None:
+        """Copy the fields of self.report into the widgets. This is the reverse of `save_form`."""
+        self.name.setText(self.report.name)
+        self.rate.setText(self.report.rate)
+        self.desig.setText(self.report.desig)
+        self.ssn.setText(self.report.ssn)
+        self.set_combo_data(self.group, self.report.group)
+        self.uic.setText(self.report.uic)
+        self.station.setText(self.report.station)
+        self.set_combo_data(self.promotion_status, self.report.promotion_status)
+        self.set_date(self.date_reported, self.report.date_reported)
+        self.periodic.setChecked(self.report.periodic)
+        self.det_indiv.setChecked(self.report.det_indiv)
+        self.special.setChecked(self.report.special)
+        self.set_date(self.period_start, self.report.period_start)
+        self.set_date(self.period_end, self.report.period_end)
+        self.not_observed.setChecked(self.report.not_observed)
+        self.regular.setChecked(self.report.regular)
+        self.concurrent.setChecked(self.report.concurrent)
+        self.physical_readiness.setText(self.report.physical_readiness)
+        self.set_combo_data(self.billet_subcategory, self.report.billet_subcategory)
+        self.senior_name.setText(self.report.senior_name)
+        self.senior_grade.setText(self.report.senior_grade)
+        self.senior_desig.setText(self.report.senior_desig)
+        self.senior_title.setText(self.report.senior_title)
+        self.senior_uic.setText(self.report.senior_uic)
+        self.senior_ssn.setText(self.report.senior_ssn)
+        self.job.setText(self.report.job)
+        self.duties_abbreviation.setText(self.report.duties_abbreviation)
+        self.duties_description.setText(f"{' ' * DUTIES_DESC_SPACE_FOR_ABBREV}{self.report.duties_description}")
+        self.set_date(self.date_counseled, self.report.date_counseled)
+        self.counselor.setText(self.report.counselor)
+        self.set_combo_option(self.trait1, self.trait_options, self.report.trait1)
+        self.set_combo_option(self.trait2, self.trait_options, self.report.trait2)
+        self.set_combo_option(self.trait3, self.trait_options, self.report.trait3)
+        self.set_combo_option(self.trait4, self.trait_options, self.report.trait4)
+        self.set_combo_option(self.trait5, self.trait_options, self.report.trait5)
+        self.set_combo_option(self.trait6, self.trait_options, self.report.trait6)
+        self.set_combo_option(self.trait7, self.trait_options, self.report.trait7)
+        self.career_rec_1.setText(self.report.career_rec_1)
+        self.career_rec_2.setText(self.report.career_rec_2)
+        self.comments.setText(self.report.comments)
+        self.set_combo_option(self.indiv_promo_rec, self.promotion_recs, self.report.indiv_promo_rec)
+        self.senior_address.setText(self.report.senior_address)
+
+    @staticmethod
+    def set_date(widget: QDateEdit, value: date | None) -> None:
+        widget.setDate(BLANK_DATE if value is None else QDate(value.year, value.month, value.day))
+
+    @staticmethod
+    def set_combo_data(widget: QComboBox, value: Any) -> None:
+        """Select the item of a combo box whose data is `value`, or the first (blank) item if there is none."""
+        widget.setCurrentIndex(max(widget.findData(value), 0))
+
+    @staticmethod
+    def set_combo_option(widget: QComboBox, options: dict[str, Any], value: Any) -> None:
+        """Select the item of a combo box built from `options` (item text -> value) whose value is `value`."""
+        texts = [text for text, option in options.items() if option == value]
+        widget.setCurrentText(texts[0] if texts else "")
+
     def create_trait_combo(self, trait: int | None) -> NoScrollComboBox:
         combo = NoScrollComboBox()
         combo.addItems([p for p in BaseReportForm.trait_options.keys()])
@@ -438,6 +798,13 @@ class BaseReportForm(QWidget, Generic[TReport]):
         button_box.rejected.connect(self.on_reject)
         return button_box
 
+    def set_read_only(self, read_only: bool) -> None:
+        """Disable saving, e.g. for a report opened from a read-only archive. It can still be exported as a PDF."""
+        save_btn = self.button_box.button(QDialogButtonBox.StandardButton.Ok)
+        if save_btn is not None:
+            save_btn.setDisabled(read_only)
+            save_btn.setToolTip("Reports cannot be saved to a read-only archive." if read_only else "")
+
     def build_menu(self) -> None:
         menu_bar = self.main.menuBar()
         menu_bar.clear()
@@ -449,6 +816,12 @@ class BaseReportForm(QWidget, Generic[TReport]):
         close_action = file_menu.addAction("Close")
         close_action.triggered.connect(self.on_reject)
 
+        view_menu = menu_bar.addMenu("View")
+        preview_action = view_menu.addAction("PDF Preview")
+        preview_action.setCheckable(True)
+        preview_action.setChecked(not self.preview.isHidden())
+        preview_action.toggled.connect(self.set_preview_visible)
+
         tools = menu_bar.addMenu("Tools")
         validate_action = tools.addAction("Validate Report")
         validate_action.triggered.connect(self.validate_report)
@@ -706,7 +1079,7 @@ class BaseReportForm(QWidget, Generic[TReport]):
         self.report.trait5 = self.trait_options[self.trait5.currentText()]
         self.report.trait6 = self.trait_options[self.trait6.currentText()]
         self.report.trait7 = self.trait_options[self.trait7.currentText()]
-        self.report.career_rec_1 = self.report_type.validate_career_rec(self.career_rec_1.toPlainText())
+        self.report.career_rec_1 = self.report_type.validate_career_rec_1(self.career_rec_1.toPlainText())
         self.report.career_rec_2 = self.career_rec_2.toPlainText()
         self.report.comments = self.report_type.validate_comments(self.comments.toPlainText())
         self.report.indiv_promo_rec = self.promotion_recs[self.indiv_promo_rec.currentText()]
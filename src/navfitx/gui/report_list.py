@@ -0,0 +1,254 @@
+from collections.abc import Callable, Sequence
+from datetime import date
+from typing import Any
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtWidgets import QTableView
+
+from navfitx.models import ReportKey, ReportRow
+
+REPORT_TYPE_DISPLAY_NAMES = {
+    "fitrep": "Fitness Report",
+    "eval": "Evaluation",
+    "chiefeval": "Chief Evaluation",
+}
+
+# Positions of the fields in a ReportRow
+RATE, NAME, SSN, DOC_TYPE, PERIOD_END, REPORT_ID = range(6)
+
+
+def rows_to_snapshot(rows: Sequence[ReportRow]) -> list[list[Any]]:
+    """Convert rows to a compact JSON-serializable snapshot of the Report List."""
+    return [[*row[:PERIOD_END], None if row.period_end is None else row.period_end.isoformat(), row.id] for row in rows]
+
+
+def rows_from_snapshot(snapshot: Any) -> list[ReportRow]:
+    """
+    Rebuild the rows of a snapshot made by `rows_to_snapshot`.
+
+    Raises:
+        ValueError: If the snapshot is not a valid Report List snapshot.
+    """
+    if not isinstance(snapshot, list):
+        raise ValueError("A Report List snapshot must be a list of rows.")
+    rows: list[ReportRow] = []
+    for item in snapshot:
+        rate, name, ssn, doc_type, period_end, report_id = item
+        if not all(isinstance(value, str) for value in (rate, name, ssn, doc_type)) or not isinstance(report_id, int):
+            raise ValueError(f"Invalid Report List snapshot row: {item!r}")
+        rows.append(
+            ReportRow(
+                rate, name, ssn, doc_type, None if period_end is None else date.fromisoformat(period_end), report_id
+            )
+        )
+    return rows
+
+
+def _period_end_sort_key(ascending: bool):
+    # reports without a period end always sort last, and ties are broken by the newest report first
+    if ascending:
+        return lambda row: (row.period_end is None, row.period_end or date.min, -(row.id or -1))
+    return lambda row: (row.period_end is None, -(row.period_end or date.min).toordinal(), -(row.id or -1))
+
+
+class ReportListModel(QAbstractTableModel):
+    """
+    Table model for the Report List.
+
+    Reports are kept as compact `ReportRow` tuples and the text of a cell is only created when a view asks for it, so
+    only the rows on screen are ever materialized. Rows are handed to views in pages of `PAGE_SIZE` through
+    `canFetchMore`/`fetchMore` as the user scrolls.
+    """
+
+    HEADERS = ("Rank/Rate", "Full Name", "SSN", "Report", "Period End", "Report ID")
+    TYPE_ROLE = Qt.ItemDataRole.UserRole
+    PAGE_SIZE = 500
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[ReportRow] = []
+        self._fetched = 0
+        self.sort_column = 4
+        self.sort_order = Qt.SortOrder.DescendingOrder
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> bool:  # noqa: N802
+        return not parent.isValid() and self._fetched < len(self._rows)
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> None:  # noqa: N802
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self._rows) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = row[column]
+            if column == DOC_TYPE:
+                return REPORT_TYPE_DISPLAY_NAMES.get(value, value.upper())
+            return "" if value is None else str(value)
+        if role == self.TYPE_ROLE and column == DOC_TYPE:
+            return row.doc_type
+        return None
+
+    def set_rows(self, rows: Sequence[ReportRow]) -> None:
+        """Replace all rows. They are sorted by the current sort column and order."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._sort_rows()
+        self._fetched = min(self.PAGE_SIZE, len(self._rows))
+        self.endResetModel()
+
+    def has_rows(self, rows: Sequence[ReportRow]) -> bool:
+        """Whether the model holds exactly these rows, in any order."""
+        return len(rows) == len(self._rows) and set(rows) == set(self._rows)
+
+    def rows(self) -> list[ReportRow]:
+        """Every row, including those not fetched by a view yet, in sorted order."""
+        return list(self._rows)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self.sort_column = column
+        self.sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        self._sort_rows()
+        self.layoutChanged.emit()
+
+    def _sort_key(self) -> tuple[Callable[[ReportRow], Any], bool]:
+        """The key function and reverse flag that order the rows by the current sort column and order."""
+        ascending = self.sort_order == Qt.SortOrder.AscendingOrder
+        column = self.sort_column
+        if column == PERIOD_END:
+            return _period_end_sort_key(ascending), False
+        if column == REPORT_ID:
+            return (lambda row: -1 if row.id is None else row.id), not ascending
+        return (lambda row: row[column].casefold()), not ascending
+
+    def _sort_rows(self) -> None:
+        key, reverse = self._sort_key()
+        self._rows.sort(key=key, reverse=reverse)
+
+    def _insert_position(self, row: ReportRow) -> int:
+        # binary search for the position after any rows that sort equal to `row`
+        key, reverse = self._sort_key()
+        row_key = key(row)
+        lo, hi = 0, len(self._rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_key = key(self._rows[mid])
+            if (mid_key < row_key) if reverse else (row_key < mid_key):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _find_row(self, key: ReportKey) -> int | None:
+        doc_type, report_id = key
+        for i, row in enumerate(self._rows):
+            if row.id == report_id and row.doc_type == doc_type:
+                return i
+        return None
+
+    def insert_row(self, row: ReportRow) -> None:
+        """Insert a report at its sorted position."""
+        position = self._insert_position(row)
+        # rows past the fetched ones are not shown yet, so views are only told about rows they have fetched
+        visible = position < self._fetched or self._fetched == len(self._rows)
+        if visible:
+            self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        if visible:
+            self._fetched += 1
+            self.endInsertRows()
+
+    def update_row(self, row: ReportRow) -> bool:
+        """
+        Replace the row of a report with new values, moving it if its sorted position changed.
+
+        Returns:
+            False if the report is not in the model.
+        """
+        old_position = self._find_row(row.key)
+        if old_position is None:
+            return False
+        old_row = self._rows.pop(old_position)
+        new_position = self._insert_position(row)
+        self._rows.insert(old_position, old_row)
+        if new_position == old_position:
+            self._rows[old_position] = row
+            if old_position < self._fetched:
+                last_column = self.columnCount() - 1
+                self.dataChanged.emit(self.index(old_position, 0), self.index(old_position, last_column))
+        else:
+            self._remove_at(old_position)
+            self.insert_row(row)
+        return True
+
+    def remove_row(self, key: ReportKey) -> bool:
+        """
+        Remove the row of a report.
+
+        Returns:
+            False if the report is not in the model.
+        """
+        position = self._find_row(key)
+        if position is None:
+            return False
+        self._remove_at(position)
+        return True
+
+    def _remove_at(self, position: int) -> None:
+        visible = position < self._fetched
+        if visible:
+            self.beginRemoveRows(QModelIndex(), position, position)
+        del self._rows[position]
+        if visible:
+            self._fetched -= 1
+            self.endRemoveRows()
+
+    def report_row(self, row: int) -> ReportRow | None:
+        if 0 <= row < self._fetched:
+            return self._rows[row]
+        return None
+
+    def report_key(self, row: int) -> ReportKey | None:
+        report_row = self.report_row(row)
+        if report_row is None or report_row.id is None:
+            return None
+        return report_row.key
+
+    def total_rows(self) -> int:
+        """Number of reports, including those not fetched by a view yet."""
+        return len(self._rows)
+
+
+class ReportListView(QTableView):
+    """
+    A QTableView for the Report List with the row and column conveniences of QTableWidget.
+    """
+
+    def rowCount(self) -> int:  # noqa: N802
+        model = self.model()
+        return model.rowCount() if model is not None else 0
+
+    def columnCount(self) -> int:  # noqa: N802
+        model = self.model()
+        return model.columnCount() if model is not None else 0
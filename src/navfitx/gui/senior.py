@@ -0,0 +1,55 @@
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QDialog, QDialogButtonBox, QFormLayout, QLabel, QLineEdit, QTextEdit, QVBoxLayout, QWidget
+
+
+class ReportingSeniorDialog(QDialog):
+    """
+    Dialog for setting the reporting senior fields of several reports at once.
+
+    Blank fields are left unchanged on the selected reports.
+    """
+
+    def __init__(self, parent: QWidget | None, report_count: int) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Set Reporting Senior")
+
+        self.line_edits: dict[str, QLineEdit] = {}
+        form = QFormLayout()
+        for field_name, label, kwargs in (
+            ("senior_name", "Reporting Senior Name", {"placeholderText": "LAST, FI MI", "maxLength": 27}),
+            ("senior_grade", "Reporting Senior Grade", {"maxLength": 5}),
+            ("senior_desig", "Reporting Senior Designator", {"maxLength": 5}),
+            ("senior_title", "Reporting Senior Title", {"maxLength": 14}),
+            ("senior_uic", "Reporting Senior UIC", {"maxLength": 5}),
+            ("senior_ssn", "Reporting Senior SSN", {"inputMask": "000-00-0000;_"}),
+        ):
+            widget = QLineEdit(**kwargs)
+            widget.setFont(QFont("Courier"))
+            form.addRow(label, widget)
+            self.line_edits[field_name] = widget
+
+        self.senior_address = QTextEdit()
+        self.senior_address.setFont(QFont("Courier"))
+        self.senior_address.setFixedHeight(self.senior_address.fontMetrics().lineSpacing() * 5)
+        form.addRow("Reporting Senior Address", self.senior_address)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"Blank fields are left unchanged on the {report_count} selected report(s)."))
+        layout.addLayout(form)
+        layout.addWidget(button_box)
+
+    def senior_values(self) -> dict[str, str]:
+        values = {}
+        for field_name, widget in self.line_edits.items():
+            text = widget.text().strip()
+            # an untouched SSN input mask still contains its separators
+            if text and text != "--":
+                values[field_name] = text.upper() if field_name == "senior_title" else text
+        address = self.senior_address.toPlainText().strip()
+        if address:
+            values["senior_address"] = address
+        return values
@@ -0,0 +1,158 @@
+import itertools
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+
+class _JobSignals(QObject):
+    finished = Signal(int, object)
+    failed = Signal(int, object)
+
+
+class _Job(QRunnable):
+    def __init__(self, job_id: int, fn: Callable[..., Any], args: tuple[Any, ...], signals: _JobSignals) -> None:
+        super().__init__()
+        # The worker keeps a reference to every job until its result is delivered, so Qt must not delete it.
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.fn = fn
+        self.args = args
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            result = self.fn(*self.args)
+        except Exception as exc:
+            self.signals.failed.emit(self.job_id, exc)
+        else:
+            self.signals.finished.emit(self.job_id, result)
+
+
+@dataclass
+class _PendingJob:
+    runnable: _Job
+    kind: str | None
+    on_result: Callable[[Any], None] | None
+    on_error: Callable[[Exception], None] | None
+    cancelled: bool = False
+
+
+class BackgroundWorker(QObject):
+    """
+    Runs jobs off the Qt main thread so the GUI never blocks.
+
+    Jobs run one at a time, in submission order, on a thread pool with a single thread. Results and errors are
+    delivered back on the main thread through the `on_result` and `on_error` callbacks.
+
+    Jobs may be given a `kind`. Submitting a job cancels any earlier job of the same kind: it is removed from the
+    queue if it has not started yet, and its result is discarded if it has.
+
+    The error of a job submitted without `on_error` is logged and emitted with `failed`, for the window to report it.
+    Raising it in the slot that delivers it would only print a traceback.
+    """
+
+    busy_changed = Signal(bool)
+    # the error of a job that has no on_error callback
+    failed = Signal(object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._signals = _JobSignals(self)
+        self._signals.finished.connect(self._on_job_finished)
+        self._signals.failed.connect(self._on_job_failed)
+        self._jobs: dict[int, _PendingJob] = {}
+        self._latest_by_kind: dict[str, int] = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._jobs)
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        kind: str | None = None,
+        on_result: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> int:
+        """Queue `fn(*args)` to run on the worker thread and return the id of the new job."""
+        if kind is not None and (previous := self._latest_by_kind.get(kind)) is not None:
+            self.cancel(previous)
+
+        was_busy = self.busy
+        job_id = next(self._ids)
+        runnable = _Job(job_id, fn, args, self._signals)
+        self._jobs[job_id] = _PendingJob(runnable, kind, on_result, on_error)
+        if kind is not None:
+            self._latest_by_kind[kind] = job_id
+        self.pool.start(runnable)
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return job_id
+
+    def cancel(self, job_id: int) -> None:
+        """Cancel a job. A job that is already running finishes, but its result is not delivered."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job.cancelled = True
+        if self.pool.tryTake(job.runnable):
+            self._finish(job_id)
+
+    def cancel_kind(self, kind: str) -> None:
+        if (job_id := self._latest_by_kind.get(kind)) is not None:
+            self.cancel(job_id)
+
+    def wait(self, timeout: float = 10.0) -> None:
+        """
+        Block until every queued job has finished and its result has been delivered, including jobs submitted by
+        the callbacks of earlier jobs.
+        """
+        deadline = time.monotonic() + timeout
+        while self._jobs and time.monotonic() < deadline:
+            self.pool.waitForDone(50)
+            QCoreApplication.processEvents()
+
+    def _finish(self, job_id: int) -> _PendingJob | None:
+        job = self._jobs.pop(job_id, None)
+        if job is not None and job.kind is not None and self._latest_by_kind.get(job.kind) == job_id:
+            del self._latest_by_kind[job.kind]
+        if not self._jobs:
+            self.busy_changed.emit(False)
+        return job
+
+    @Slot(int, object)
+    def _on_job_finished(self, job_id: int, result: Any) -> None:
+        job = self._finish(job_id)
+        if job is None or job.cancelled or job.on_result is None:
+            return
+        job.on_result(result)
+
+    @Slot(int, object)
+    def _on_job_failed(self, job_id: int, exc: Exception) -> None:
+        job = self._finish(job_id)
+        if job is None or job.cancelled:
+            return
+        if job.on_error is None:
+            logger.error("Background job %s failed", job.runnable.fn, exc_info=exc)
+            self.failed.emit(exc)
+            return
+        job.on_error(exc)
+
+
+class DatabaseWorker(BackgroundWorker):
+    """
+    Runs database jobs off the Qt main thread so the GUI never blocks on SQLite.
+
+    Because jobs run one at a time in submission order, the worker is the only writer to the database and e.g. a
+    save is always committed before a following refresh reads.
+    """
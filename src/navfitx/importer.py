@@ -4,14 +4,15 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
-import tomlkit
 import typer
 from pydantic import ValidationError
 from rich import print
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session
 from typing_extensions import Annotated
 
+from navfitx.db import ensure_db_schema
 from navfitx.models import BilletSubcategory, ChiefEval, DutyStatus, Eval, Fitrep, PromotionStatus
+from navfitx.models.models import STORAGE_FIELDS
 
 app = typer.Typer(no_args_is_help=True, add_completion=False)
 
@@ -65,7 +66,7 @@ class ImportSchemaError(ValueError):
 
 
 def _allowed_keys(model_type: type[Fitrep] | type[ChiefEval] | type[Eval]) -> set[str]:
-    return (set(model_type.model_fields) - {"id"}) | {"schema_version"}
+    return (set(model_type.model_fields) - STORAGE_FIELDS) | {"schema_version"}
 
 
 def _resolve_model_type(doc_type: str) -> type[Fitrep] | type[ChiefEval] | type[Eval]:
@@ -80,7 +81,7 @@ def _resolve_model_type(doc_type: str) -> type[Fitrep] | type[ChiefEval] | type[
 
 
 def _build_report_template_toml(model_type: type[Fitrep] | type[ChiefEval] | type[Eval], doc_type: str) -> str:
-    data = model_type().model_dump(exclude={"id"})
+    data = model_type().model_dump(exclude=set(STORAGE_FIELDS))
     template_dates = {
         "date_reported": date.today(),
         "period_start": date.today(),
@@ -108,11 +109,13 @@ def _build_report_template_toml(model_type: type[Fitrep] | type[ChiefEval] | typ
     data.update(template_enums)
     data.update(template_ints)
 
+    import tomlkit
+
     document = tomlkit.document()
     document.add("schema_version", SUPPORTED_SCHEMA_VERSION)
     document.add("doc_type", doc_type)
     for key in model_type.model_fields:
-        if key in {"id", "doc_type"}:
+        if key in STORAGE_FIELDS or key == "doc_type":
             continue
         document.add(key, data[key])
     return tomlkit.dumps(document)
@@ -291,8 +294,7 @@ def import_report_toml(input_path: Path, db_path: Path, *, strict: bool = False)
 
     report = parse_report_toml(toml_str, strict=strict)
 
-    engine = create_engine(f"sqlite:///{db_path}")
-    SQLModel.metadata.create_all(engine)
+    engine = ensure_db_schema(db_path)
     with Session(engine, expire_on_commit=False) as session:
         session.add(report)
         session.commit()
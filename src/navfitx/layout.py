@@ -0,0 +1,105 @@
+"""
+Line breaking for the multi-line boxes of the report forms.
+
+The same text is laid out by the field validators, to check that it fits its box, and by `build_pdf`, to draw it. The
+layouts are cached by text and width, so validating a report and then printing it lays out each box only once. A
+layout is a tuple of lines so the cached value can be shared safely.
+
+Reports are printed in Courier, whose glyphs all have the same advance width, so the number of characters that fit on
+a line of a box follows exactly from the box's width in points and its font size. Lines are broken at that many
+characters, so a layout that the validators accept is exactly what fits when it is drawn.
+"""
+
+import math
+import textwrap
+from functools import cache
+from typing import NamedTuple
+
+# Advance width of every Courier glyph, in ems (the Adobe Courier metrics, as measured by pymupdf.get_text_length)
+COURIER_ADVANCE = 0.6
+
+# Enough for every box of a few hundred reports while a folder is validated or printed
+LAYOUT_CACHE_SIZE = 4096
+
+
+class TextBox(NamedTuple):
+    """A multi-line text box of a report form, measured in points on its page."""
+
+    # where each line of text starts
+    left: float
+    # the border of the box, which text must not cross
+    right: float
+    fontsize: float
+    max_lines: int
+    # whether line breaks typed in the text are kept, or treated as spaces
+    keep_line_breaks: bool = False
+    # spaces before the text on its first line, e.g. to skip a smaller box printed at the start of the line
+    first_line_indent: int = 0
+
+
+def text_width(text: str, fontsize: float) -> float:
+    """Width in points of a line of text printed in Courier."""
+    return len(text) * COURIER_ADVANCE * fontsize
+
+
+@cache
+def chars_per_line(box: TextBox) -> int:
+    """How many characters fit on a line of a box."""
+    # the tolerance keeps a box that holds a whole number of characters from losing one to rounding
+    return math.floor((box.right - box.left) / (COURIER_ADVANCE * box.fontsize) + 1e-6)
+
+
+_layouts: dict[tuple[str, int, bool], tuple[str, ...]] = {}
+
+
+def _layout(text: str, width: int, keep_line_breaks: bool) -> tuple[str, ...]:
+    key = (text, width, keep_line_breaks)
+    lines = _layouts.get(key)
+    if lines is not None:
+        return lines
+    if keep_line_breaks:
+        wrapped: list[str] = []
+        for part in text.split("\n"):
+            wrapped.extend(textwrap.wrap(part, width=width) or [""])
+        lines = tuple(wrapped)
+    else:
+        lines = tuple(textwrap.wrap(text, width=width))
+    if len(_layouts) >= LAYOUT_CACHE_SIZE:
+        _layouts.clear()
+    _layouts[key] = lines
+    # Laying out the text of a layout gives the same lines. Validators store that text (e.g. comments), so printing
+    # the validated report finds its layout here too.
+    _layouts.setdefault(("\n".join(lines), width, keep_line_breaks), lines)
+    return lines
+
+
+def wrap_lines(text: str, width: int) -> tuple[str, ...]:
+    """
+    Break text into lines of at most `width` characters, keeping the line breaks (including empty lines) already in
+    the text.
+    """
+    return _layout(text, width, True)
+
+
+def fill_lines(text: str, width: int) -> tuple[str, ...]:
+    """Break text into lines of at most `width` characters, treating line breaks in the text as spaces."""
+    return _layout(text, width, False)
+
+
+def box_layout(text: str, box: TextBox) -> tuple[str, ...]:
+    """The lines of text as they are printed in a box."""
+    return _layout(box.first_line_indent * " " + text, chars_per_line(box), box.keep_line_breaks)
+
+
+def trim_to_box(text: str, box: TextBox) -> str:
+    """
+    The text cut to the lines that fit in a box, or the text itself if it fits. The cut text is cached with its
+    layout, so printing it doesn't lay it out again.
+    """
+    lines = box_layout(text, box)
+    if len(lines) <= box.max_lines:
+        return text
+    lines = lines[: box.max_lines]
+    trimmed = "\n".join(lines)
+    _layouts.setdefault((trimmed, chars_per_line(box), box.keep_line_breaks), lines)
+    return trimmed
@@ -1,17 +1,37 @@
+from .batch import BatchValidation, ValidationIssue, validate_many
 from .chiefeval import ChiefEval
+from .draft import Draft
 from .enums import BilletSubcategory, DutyStatus, PromotionRecommendation, PromotionStatus, RetentionRecommendation
 from .eval import Eval
 from .fitrep import Fitrep
+from .folder import Folder
 from .models import Report
+from .row import ReportKey, ReportRow
+from .rsca import Rsca, RscaKey, rsca_key
+from .summary_group import SummaryGroup, SummaryGroupKey, quota_violations, summary_group_key
 
 __all__ = [
     "Report",
+    "ReportKey",
+    "ReportRow",
     "Eval",
     "Fitrep",
     "ChiefEval",
+    "Draft",
+    "Folder",
+    "Rsca",
+    "RscaKey",
+    "rsca_key",
+    "SummaryGroup",
+    "SummaryGroupKey",
+    "quota_violations",
+    "summary_group_key",
     "DutyStatus",
     "PromotionStatus",
     "PromotionRecommendation",
     "RetentionRecommendation",
     "BilletSubcategory",
+    "BatchValidation",
+    "ValidationIssue",
+    "validate_many",
 ]
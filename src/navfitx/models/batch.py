@@ -0,0 +1,103 @@
+"""
+Validate many reports of any type at once.
+
+`validate_many` validates each report of a batch once, with the `model_validate` of the model its `doc_type` names, and
+checks every report against the same date for dates in the future, so a batch costs no more than validating its reports
+one by one. The errors of the batch come back as `ValidationIssue` rows, one per field in error, which can be printed
+as a table or filtered like any list of tuples.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, NamedTuple
+
+from pydantic import ValidationError
+
+from .chiefeval import ChiefEval
+from .eval import Eval
+from .fitrep import Fitrep
+from .models import Report, validation_date
+
+# error type of a report whose doc_type is missing or not a type of report
+INVALID_DOC_TYPE = "invalid_doc_type"
+
+
+class ValidationIssue(NamedTuple):
+    """A field of a report in a batch that failed validation."""
+
+    # position of the report in the batch
+    index: int
+    doc_type: str | None
+    report_id: int | None
+    # the field in error, e.g. "duties_description", or "" for an error about the whole report
+    field: str
+    # pydantic error type, e.g. "string_too_long"
+    error_type: str
+    message: str
+
+
+class BatchValidation(NamedTuple):
+    # the validated report for each report of the batch, or None if it has issues
+    reports: list[Report | None]
+    issues: list[ValidationIssue]
+
+
+def _doc_type(value: Any) -> str | None:
+    if isinstance(value, Mapping):
+        return value.get("doc_type")
+    return getattr(value, "doc_type", None)
+
+
+def _report_id(value: Any) -> int | None:
+    if isinstance(value, Mapping):
+        return value.get("id")
+    return getattr(value, "id", None)
+
+
+# the model of each doc_type
+_MODELS: dict[str, type[Report]] = {
+    model.model_fields["doc_type"].default: model for model in (Fitrep, Eval, ChiefEval)
+}
+_INVALID_DOC_TYPE_MESSAGE = f"doc_type should be one of {', '.join(_MODELS)}"
+
+
+def _issues(index: int, report: Any, error: ValidationError) -> list[ValidationIssue]:
+    return [
+        ValidationIssue(
+            index,
+            _doc_type(report),
+            _report_id(report),
+            ".".join(str(part) for part in detail["loc"]),
+            detail["type"],
+            detail["msg"],
+        )
+        for detail in error.errors(include_url=False, include_input=False)
+    ]
+
+
+def validate_many(reports: Sequence[Report | Mapping[str, Any]]) -> BatchValidation:
+    """
+    Validate a batch of reports, given as report models or as dicts of their fields with a `doc_type`.
+
+    Each report is validated once, by the model of its `doc_type`, and every report of the batch is checked against the
+    same date for dates in the future.
+    """
+    validated: list[Report | None] = []
+    issues: list[ValidationIssue] = []
+    with validation_date():
+        for index, report in enumerate(reports):
+            doc_type = _doc_type(report)
+            model = _MODELS.get(doc_type) if isinstance(doc_type, str) else None
+            if model is None:
+                validated.append(None)
+                issues.append(
+                    ValidationIssue(
+                        index, doc_type, _report_id(report), "doc_type", INVALID_DOC_TYPE, _INVALID_DOC_TYPE_MESSAGE
+                    )
+                )
+                continue
+            try:
+                validated.append(model.model_validate(report))
+            except ValidationError as error:
+                validated.append(None)
+                issues.extend(_issues(index, report, error))
+    return BatchValidation(validated, issues)
@@ -0,0 +1,21 @@
+"""
+SQLModel for the autosaved drafts of reports being edited.
+"""
+
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class Draft(SQLModel, table=True):
+    """
+    The last autosaved state of a report that was being edited, kept until the report is saved or its form is closed,
+    so the edits can be recovered if NAVFITX exits without saving them.
+    """
+
+    # identifies one editing session, so a draft is overwritten in place however often it is autosaved
+    key: str = Field(primary_key=True)
+    doc_type: str
+    # the fields of the report as JSON, including the id of the report if it was already saved once
+    data: str
+    saved_at: datetime
@@ -1,15 +1,16 @@
-import textwrap
-from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, ClassVar
 
 from pydantic import BaseModel, StringConstraints, field_validator, model_validator
-from pymupdf import Point
 from sqlmodel import Field
 
-from navfitx.utils import wrap_duty_desc
+from navfitx.constants import DUTIES_DESC_SPACE_FOR_ABBREV
+from navfitx.layout import TextBox, trim_to_box
 
 from .enums import DutyStatus, PromotionRecommendation, RetentionRecommendation
-from .models import Report
+from .models import FORM_RIGHT_BORDER, Point, Report
+
+if TYPE_CHECKING:
+    import pymupdf
 
 
 class Eval(Report, table=True):
@@ -23,6 +24,16 @@ class Eval(Report, table=True):
             Professional knowledge score (0-5).
     """
 
+    TEXT_BOXES: ClassVar[dict[str, TextBox]] = Report.TEXT_BOXES | {
+        "duties_description": TextBox(
+            24, FORM_RIGHT_BORDER, 10, max_lines=4, first_line_indent=DUTIES_DESC_SPACE_FOR_ABBREV
+        ),
+        "career_rec_1": TextBox(121, 227, 10, max_lines=2),
+        "career_rec_2": TextBox(227, 319.68, 10, max_lines=2),
+        # not printed yet, so measured as a box as wide as the duties description box
+        "achievements": TextBox(24, FORM_RIGHT_BORDER, 10, max_lines=2, keep_line_breaks=True),
+    }
+
     doc_type: str = "eval"
     prom_frock: bool = False
 
@@ -44,11 +55,7 @@ class Eval(Report, table=True):
     @field_validator("achievements")
     @classmethod
     def validate_achievements(cls, achievements: str) -> str:
-        wrapped = cls.wrap_text(achievements, 91)
-        if len(wrapped.split("\n")) > 2:
-            lines = wrapped.split("\n")
-            achievements = "\n".join(lines[:2])
-        return achievements
+        return trim_to_box(achievements, cls.TEXT_BOXES["achievements"])
 
     @model_validator(mode="after")
     def validate_occasion_for_report(self):
@@ -85,10 +92,9 @@ class Eval(Report, table=True):
 
     def _insert_duties_classification_fields(self, front) -> None:
         front.insert_text(Point(28, 212), self.duties_abbreviation, fontsize=12, fontname="Cour")
-        duties_desc = wrap_duty_desc(self.duties_description)
-        front.insert_text(Point(24, 212), duties_desc, fontsize=10, fontname="Cour", lineheight=1.0)
+        self._insert_box_text(front, "duties_description", 212, lineheight=1.0)
 
-    def create_pdf(self, path: Path) -> None:
+    def build_pdf(self) -> "pymupdf.Document":
         doc, front, back = self._open_report_pdf("eval")
         self._insert_common_report_fields(front, back)
 
@@ -218,14 +224,11 @@ class Eval(Report, table=True):
 
         back.insert_text(Point(47, 304), self.member_trait_avg(), fontsize=12, fontname="Cour")
         # back.insert_text(Point(240, 694), self.summary_group_avg(), fontsize=12, fontname="Cour")
-        back.insert_text(Point(121, 292), textwrap.fill(self.career_rec_1, 13), fontsize=10, fontname="Cour")
-        back.insert_text(Point(227, 292), textwrap.fill(self.career_rec_2, 13), fontsize=10, fontname="Cour")
-        back.insert_text(
-            Point(34, 338), self.wrap_text(self.comments, 92), fontsize=9.2, fontname="Cour", lineheight=1.11
-        )
+        self._insert_box_text(back, "career_rec_1", 292)
+        self._insert_box_text(back, "career_rec_2", 292)
+        self._insert_box_text(back, "comments", 338, lineheight=1.11)
         back.insert_text(Point(389, 609), self.senior_address, fontsize=9, fontname="Cour", lineheight=1.0)
-        doc.save(str(path))
-        doc.close()
+        return doc
 
 
 class ChiefEvalTrait(BaseModel):
@@ -1,14 +1,16 @@
-import textwrap
-from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
 
 from pydantic import field_validator, model_validator
-from pymupdf import Point
 from sqlmodel import Field
 
-from navfitx.utils import wrap_duty_desc
+from navfitx.constants import DUTIES_DESC_SPACE_FOR_ABBREV
+from navfitx.layout import TextBox
 
 from .enums import DutyStatus, PromotionRecommendation
-from .models import Report
+from .models import FORM_RIGHT_BORDER, Point, Report
+
+if TYPE_CHECKING:
+    import pymupdf
 
 
 class Fitrep(Report, table=True):
@@ -39,6 +41,14 @@ class Fitrep(Report, table=True):
 
     """
 
+    TEXT_BOXES: ClassVar[dict[str, TextBox]] = Report.TEXT_BOXES | {
+        "duties_description": TextBox(
+            24, FORM_RIGHT_BORDER, 10, max_lines=4, first_line_indent=DUTIES_DESC_SPACE_FOR_ABBREV
+        ),
+        "career_rec_1": TextBox(370, 455.76, 10, max_lines=2),
+        "career_rec_2": TextBox(467, FORM_RIGHT_BORDER, 10, max_lines=2),
+    }
+
     doc_type: str = Field(default="fitrep", const=True)
     det_rs: bool = Field(default=False, title="Detachment of Reporting Senior")
     ops_cdr: bool = Field(title="Ops Commander", default=False)
@@ -175,8 +185,7 @@ class Fitrep(Report, table=True):
 
     def _insert_duties_classification_fields(self, front) -> None:
         front.insert_text(Point(28, 212), self.duties_abbreviation, fontsize=12, fontname="Cour")
-        duties_desc = wrap_duty_desc(self.duties_description)
-        front.insert_text(Point(24, 212), duties_desc, fontsize=10, fontname="Cour", lineheight=1.0)
+        self._insert_box_text(front, "duties_description", 212, lineheight=1.0)
 
     @classmethod
     def from_toml(cls, toml_str: str) -> "Fitrep":
@@ -190,7 +199,7 @@ class Fitrep(Report, table=True):
             raise ValueError(f"Expected TOML for {cls.__name__} but got {type(report).__name__}.")
         return report
 
-    def create_pdf(self, path: Path):
+    def build_pdf(self) -> "pymupdf.Document":
         """
         Fills out a FITREP PDF report with the provided FITREP data.
 
@@ -300,12 +309,7 @@ class Fitrep(Report, table=True):
             case 5:
                 back.insert_text(Point(551, 282), "X", fontsize=12, fontname="Cour")
 
-        back.insert_text(
-            Point(34, 354),
-            self.wrap_text(self.comments, 92),
-            fontsize=9.2,
-            fontname="Cour",
-        )
+        self._insert_box_text(back, "comments", 354)
 
         match self.indiv_promo_rec:
             case PromotionRecommendation.NOB.value:
@@ -330,8 +334,7 @@ class Fitrep(Report, table=True):
         back.insert_text(Point(388, 586), self.senior_address, fontsize=9, fontname="Cour", lineheight=1.1)
         back.insert_text(Point(105, 694), self.member_trait_avg(), fontsize=12, fontname="Cour")
         back.insert_text(Point(240, 694), self.summary_group_avg(), fontsize=12, fontname="Cour")
-        back.insert_text(Point(370, 300), textwrap.fill(self.career_rec_1, 13), fontsize=10, fontname="Cour")
-        back.insert_text(Point(467, 300), textwrap.fill(self.career_rec_2, 13), fontsize=10, fontname="Cour")
+        self._insert_box_text(back, "career_rec_1", 300)
+        self._insert_box_text(back, "career_rec_2", 300)
 
-        doc.save(str(path))
-        doc.close()
+        return doc
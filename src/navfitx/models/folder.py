@@ -0,0 +1,19 @@
+"""
+SQLModel for the folders that reports are organized in.
+"""
+
+from sqlmodel import Field, SQLModel
+
+
+class Folder(SQLModel, table=True):
+    """
+    A folder of reports, like the folders of NAVFIT98A. Folders nest: a folder without a parent is shown at the top of
+    the folder tree.
+
+    Reports refer to their folder with `Report.folder_id`. Both `parent_id` and `folder_id` are indexed, so the
+    children of a folder and the reports in a folder are each found with an index lookup however large the database.
+    """
+
+    id: int | None = Field(primary_key=True, default=None)
+    name: str = Field(title="Name", min_length=1, max_length=50)
+    parent_id: int | None = Field(default=None, index=True, foreign_key="folder.id")
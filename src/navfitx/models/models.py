@@ -3,23 +3,72 @@ SQLModels for each type of report.
 """
 
 import re
-import textwrap
 from abc import abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date
 from enum import Enum
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, ClassVar, NamedTuple
 
-import pymupdf
-import tomlkit
 from pydantic import StringConstraints, field_validator, model_validator
-from pymupdf import Point
 from sqlmodel import Field, SQLModel
 
-from navfitx.utils import get_blank_report_path, wrap_duty_desc
+from navfitx.layout import TextBox, box_layout, chars_per_line, trim_to_box, wrap_lines
+from navfitx.utils import get_blank_report_path
 
 from .enums import BilletSubcategory, DutyStatus, PromotionStatus
 
+if TYPE_CHECKING:
+    import pymupdf
+
+# The right border of the report forms, which long text boxes run up to
+FORM_RIGHT_BORDER = 565.2
+
+# Fields that only describe where a report is stored in a NAVFITX database, not the report itself.
+# These are excluded from Report TOML Files.
+STORAGE_FIELDS = frozenset({"id", "folder_id"})
+
+UIC_PATTERN = re.compile(r"^[A-Za-z0-9]+$")
+SSN_PATTERN = re.compile(r"^\d{3}-\d{2}-\d{4}$")
+
+# Report dates must be after this date. Date fields of the GUI show it until a date is picked.
+BLANK_DATE = date(2000, 1, 1)
+
+_validation_today: ContextVar[date | None] = ContextVar("validation_today", default=None)
+
+
+@contextmanager
+def validation_date() -> Iterator[date]:
+    """
+    Check that the dates of every report validated in the block aren't in the future against one "today", read once,
+    e.g. for a batch of reports.
+    """
+    today = date.today()
+    token = _validation_today.set(today)
+    try:
+        yield today
+    finally:
+        _validation_today.reset(token)
+
+
+def validation_today() -> date:
+    """Today, as of the `validation_date` block being validated in if there is one."""
+    return _validation_today.get() or date.today()
+
+
+class Point(NamedTuple):
+    """
+    A position on a report PDF, in points from the top left corner of the page.
+
+    pymupdf accepts any (x, y) pair where it takes a point, so reports use this instead of `pymupdf.Point` and
+    pymupdf is only imported once a PDF is actually filled out.
+    """
+
+    x: float
+    y: float
+
 
 class Report(SQLModel):
     """
@@ -31,7 +80,15 @@ class Report(SQLModel):
         on validator methods for them to trigger when calling `Fitrep.model_validate(some_fitrep.model_dump())`.
     """
 
+    # The multi-line text boxes of the report form, by the field printed in them. Each report type adds the boxes whose
+    # position differs between forms.
+    TEXT_BOXES: ClassVar[dict[str, TextBox]] = {
+        "job": TextBox(19, FORM_RIGHT_BORDER, 10, max_lines=3),
+        "comments": TextBox(34, FORM_RIGHT_BORDER, 9.2, max_lines=18, keep_line_breaks=True),
+    }
+
     id: int | None = Field(primary_key=True, default=None)
+    folder_id: int | None = Field(default=None, index=True)
     doc_type: str
     name: Annotated[str, StringConstraints(max_length=27, min_length=1, strip_whitespace=True, to_upper=True)] = Field(
         title="Name", default=""
@@ -118,25 +175,24 @@ class Report(SQLModel):
     @staticmethod
     def format_job(text: str) -> str:
         """Formats the 'Command employment and command achievements' to fit within the constraints of the FITREP form."""
-        text = textwrap.fill(text, width=91)
-        return text
+        return "\n".join(box_layout(text, Report.TEXT_BOXES["job"]))
 
     @field_validator("uic")
     @classmethod
     def validate_uic(cls, uic: str) -> str:
         # only alphanumeric characters are allowed in UICs
-        if not re.match(r"^[A-Za-z0-9]+$", uic):
+        if not UIC_PATTERN.match(uic):
             raise ValueError("UIC may only contain alphanumeric characters.")
         return uic
 
     @field_validator("job")
     @classmethod
     def validate_job(cls, job: str) -> str:
-        formatted: str = cls.format_job(job)
-        # ensure formatted job is no more than 3 lines
-        if len(formatted.split("\n")) > 3:
+        box = cls.TEXT_BOXES["job"]
+        if len(box_layout(job, box)) > box.max_lines:
             raise ValueError(
-                "Command employment and command achievements too long; limit of 3 lines of 91 characters each."
+                "Command employment and command achievements too long; "
+                f"limit of {box.max_lines} lines of {chars_per_line(box)} characters each."
             )
         return job
 
@@ -166,7 +222,7 @@ class Report(SQLModel):
     @classmethod
     def validate_ssn(cls, ssn: str) -> str:
         ssn = ssn.strip()
-        if not re.match(r"^\d{3}-\d{2}-\d{4}$", ssn):
+        if not SSN_PATTERN.match(ssn):
             raise ValueError("SSN must be in the format XXX-XX-XXXX")
         return ssn
 
@@ -184,18 +240,24 @@ class Report(SQLModel):
             raise ValueError("Billet Subcategory must be specified.")
         return billet_subcategory
 
-    @field_validator("career_rec_2", "career_rec_1")
     @classmethod
-    def validate_career_rec(cls, career_rec: str) -> str:
+    def fit_career_rec(cls, field: str, career_rec: str) -> str:
         if len(career_rec) > 20:
             raise ValueError("Career Recommendation must be 20 characters or less (including whitespace).")
 
-        wrapped = cls.wrap_text(career_rec, 13)
-        length = len(wrapped.split())
-        if length > 2:
-            lines = wrapped.split("\n")
-            career_rec = "\n".join(lines[:2])
-        return career_rec
+        return trim_to_box(career_rec, cls.TEXT_BOXES[field])
+
+    # The two boxes differ in width, and validators are called with only the value (see navfitx.validation), so each
+    # box has its own validator.
+    @field_validator("career_rec_1")
+    @classmethod
+    def validate_career_rec_1(cls, career_rec: str) -> str:
+        return cls.fit_career_rec("career_rec_1", career_rec)
+
+    @field_validator("career_rec_2")
+    @classmethod
+    def validate_career_rec_2(cls, career_rec: str) -> str:
+        return cls.fit_career_rec("career_rec_2", career_rec)
 
     @model_validator(mode="after")
     def validate_career_recs(self):
@@ -214,15 +276,10 @@ class Report(SQLModel):
     @field_validator("comments")
     @classmethod
     def validate_comments(cls, comments: str) -> str:
-        wrapped = cls.wrap_text(comments, 92)
-        length = len(wrapped.split())
-        if length > 18:
-            # raise ValueError(f"Comments must be 18 lines or less (currently {length} lines).")
+        # raise ValueError(f"Comments must be 18 lines or less (currently {length} lines).")
 
-            # trim comments to 18 lines
-            lines = wrapped.split("\n")
-            comments = "\n".join(lines[:18])
-        return comments
+        # trim comments to 18 lines
+        return trim_to_box(comments, cls.TEXT_BOXES["comments"])
 
     @field_validator("duties_description")
     @classmethod
@@ -232,57 +289,77 @@ class Report(SQLModel):
         but it is ignored by the NAVFIT98 v33 app, which will allow as much text as can fit into the field. This gets
         weird because of the small box within the block that holds the duties abbreviation. The account for the space
         this block takes, spaces can be prepended to the description text before counting its lines.
+
+        The description is stored as it was entered: it is laid out again when the report is printed.
         """
-        duties_description = wrap_duty_desc(duties_description)
-        num_lines = len(duties_description.split("\n"))
-        if num_lines > 4:
-            raise ValueError(f"Duties description must be 4 lines or less (currently {num_lines} lines).")
+        box = cls.TEXT_BOXES["duties_description"]
+        num_lines = len(box_layout(duties_description, box))
+        if num_lines > box.max_lines:
+            raise ValueError(f"Duties description must be {box.max_lines} lines or less (currently {num_lines} lines).")
         return duties_description
 
     @model_validator(mode="after")
     def validate_dates(self):
-        if self.date_reported is None:
+        today = validation_today()
+        date_reported, period_start, period_end, date_counseled = (
+            self.date_reported,
+            self.period_start,
+            self.period_end,
+            self.date_counseled,
+        )
+        # Every check below holds exactly when the dates are set and in this order, which is one comparison chain for
+        # the usual report whose dates are fine. Otherwise the checks find the first one that fails.
+        if (
+            date_reported is not None
+            and period_start is not None
+            and period_end is not None
+            and date_counseled is not None
+            and BLANK_DATE < date_reported <= period_start <= date_counseled <= period_end <= today
+        ):
+            return self
+
+        if date_reported is None:
             raise ValueError("Report date must be set.")
-        if self.period_start is None:
+        if period_start is None:
             raise ValueError("Period of report start date must be set.")
-        if self.period_end is None:
+        if period_end is None:
             raise ValueError("Period of report end date must be set.")
-        if self.date_counseled is None:
+        if date_counseled is None:
             raise ValueError("Counseling date must be set.")
 
         # check date_reported against other dates
-        if self.date_reported <= date(2000, 1, 1):
+        if date_reported <= BLANK_DATE:
             # In the PyQt app, date fields must have a default value, so it uses 01 JAN 2000.
             # This ensures that the default value is not used.
             raise ValueError("Report date too far in the past.")
-        if self.date_reported > date.today():
+        if date_reported > today:
             raise ValueError("Report date cannot be in the future.")
-        if self.date_reported > self.period_start:
+        if date_reported > period_start:
             raise ValueError("Report date cannot be after the period of report start date.")
-        if self.date_reported > self.period_end:
+        if date_reported > period_end:
             raise ValueError("Report date cannot be after the period of report end date.")
-        if self.date_reported > self.date_counseled:
+        if date_reported > date_counseled:
             raise ValueError("Report date cannot be after the counseling date.")
 
-        if self.period_start <= date(2000, 1, 1):
+        if period_start <= BLANK_DATE:
             raise ValueError("Period of report start date too far in the past.")
-        if self.period_start > date.today():
+        if period_start > today:
             raise ValueError("Period of report start date cannot be in the future.")
-        if self.period_start > self.period_end:
+        if period_start > period_end:
             raise ValueError("Period of report start date cannot be after the end date.")
-        if self.period_start > self.date_counseled:
+        if period_start > date_counseled:
             raise ValueError("Period of report start date cannot be after the counseling date.")
 
-        if self.period_end <= date(2000, 1, 1):
+        if period_end <= BLANK_DATE:
             raise ValueError("Period of report end date too far in the past.")
-        if self.period_end < self.date_counseled:
+        if period_end < date_counseled:
             raise ValueError("Period of report end date cannot be before the counseling date.")
-        if self.period_end > date.today():
+        if period_end > today:
             raise ValueError("Period of report end date cannot be in the future.")
 
-        if self.date_counseled <= date(2000, 1, 1):
+        if date_counseled <= BLANK_DATE:
             raise ValueError("Counseling date too far in the past.")
-        if self.date_counseled > date.today():
+        if date_counseled > today:
             raise ValueError("Counseling date cannot be in the future.")
         return self
 
@@ -318,12 +395,14 @@ class Report(SQLModel):
         """
         from navfitx.importer import SUPPORTED_SCHEMA_VERSION
 
-        report_dict = self.model_dump(exclude={"id"})
+        report_dict = self.model_dump(exclude=set(STORAGE_FIELDS))
         report_dict = {k: v for k, v in report_dict.items() if v is not None and v != ""}
         for key, value in report_dict.items():
             if isinstance(value, Enum):
                 report_dict[key] = value.value
 
+        import tomlkit
+
         document = tomlkit.document()
         document.add("schema_version", SUPPORTED_SCHEMA_VERSION)
         if "doc_type" in report_dict:
@@ -349,6 +428,8 @@ class Report(SQLModel):
         pass
 
     def _open_report_pdf(self, report_name: str):
+        import pymupdf
+
         blank_report = get_blank_report_path(report_name)
         doc = pymupdf.open(str(blank_report))
         if isinstance(doc.metadata, dict):
@@ -395,13 +476,39 @@ class Report(SQLModel):
         front.insert_text(Point(405, 140), self.senior_uic, fontsize=12, fontname="Cour")
         front.insert_text(Point(461, 140), self.senior_ssn, fontsize=12, fontname="Cour")
 
-        front.insert_text(Point(19, 164), self.format_job(self.job), fontsize=10, fontname="Cour", lineheight=1.0)
+        self._insert_box_text(front, "job", 164, lineheight=1.0)
         self._insert_duties_classification_fields(front)
 
+    @classmethod
+    def layout_text(cls, field: str, text: str) -> tuple[str, ...]:
+        """The lines of text as they are printed in the box of a field of this report's form."""
+        return box_layout(text, cls.TEXT_BOXES[field])
+
+    def _insert_box_text(self, page, field: str, y: float, **kwargs) -> None:
+        box = self.TEXT_BOXES[field]
+        text = "\n".join(self.layout_text(field, getattr(self, field)))
+        page.insert_text(Point(box.left, y), text, fontsize=box.fontsize, fontname="Cour", **kwargs)
+
     @abstractmethod
-    def create_pdf(self, path: Path):
+    def build_pdf(self) -> "pymupdf.Document":
+        """
+        Fill out the blank report PDF with the fields of this report and return the open document without saving it.
+        The caller must close the document.
+        """
         pass
 
+    def create_pdf(self, path: Path):
+        """
+        Save a filled out PDF of this report to `path`.
+
+        Note: This method does not validate the model before PDF creation.
+        """
+        doc = self.build_pdf()
+        try:
+            doc.save(str(path))
+        finally:
+            doc.close()
+
     def summary_group_avg(self) -> str:
         """
         Get the text representation of the summary group average.
@@ -425,12 +532,4 @@ class Report(SQLModel):
             can be disabled, but then newlines are counted as characters that count towards the character limit
             for each line. This function handles each situation appropriately.
         """
-        parts = txt.split("\n")
-        all_lines: list[str] = []
-        for part in parts:
-            lines = textwrap.wrap(part, width=width)
-            if not lines:
-                lines = [""]
-            all_lines.extend(lines)
-        ret = "\n".join(all_lines)
-        return ret
+        return "\n".join(wrap_lines(txt, width))
@@ -1,13 +1,38 @@
+import re
 from datetime import date
+from typing import Any
 
-from sqlmodel import Field, SQLModel
+from pydantic import field_validator
+from sqlmodel import SQLModel
 
+# Dates as written by mdb-export ("02/28/25 00:00:00") and Microsoft Access ("2/28/2025"), and ISO 8601 dates.
+# Any time of day is ignored. Matching these directly is much faster than trying datetime.strptime formats in turn.
+US_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})\b")
+ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})\b")
 
-class N98Report(SQLModel, table=True):
+
+def parse_access_date(value: str) -> date:
+    """Parse a date from a NAVFIT98A export. Raises ValueError if `value` isn't a date."""
+    value = value.strip()
+    if match := US_DATE.match(value):
+        month, day, year = map(int, match.groups())
+        if len(match[3]) == 2:
+            # same pivot as datetime.strptime's %y
+            year += 2000 if year < 69 else 1900
+        return date(year, month, day)
+    if match := ISO_DATE.match(value):
+        return date(*map(int, match.groups()))
+    raise ValueError(f"Not a date: {value!r}")
+
+
+class N98Report(SQLModel):
     """
     A SQLModel that mirrors the 'Reports' table in NAVFIT98A Access db files. This is used to convert
     NAVFIT98A Access db files (.accdb) to NAVFITX SQLite db files and vice versa.
 
+    Every field is optional because NAVFIT98A leaves unused columns empty. Rows are usually read from a CSV export of
+    the table, so empty strings are read as None and Access date strings are parsed.
+
     Args:
         report_id (int): Primary key for the report record.
         parent (str): Identifier of a parent report, if applicable.
@@ -137,129 +162,156 @@ class N98Report(SQLModel, table=True):
         is_validated (str): Validation status flag or note.
     """
 
-    report_id: int = Field(primary_key=True)
-    parent: str
-    report_type: str
-    full_name: str
-    first_name: str
-    mi: str
-    last_name: str
-    suffix: str
-    rate: str
-    desig: str
-    ssn: str
-    active: bool
-    tar: bool
-    inactive: bool
-    atadsw: bool
-    uic: str
-    ship_station: str
-    promotion_status: str
-    date_reported: date
-    periodic: bool
-    det_ind: bool
-    frocking: bool
-    special: bool
-    from_date: date
-    to_date: date
-    nob: bool
-    regular: bool
-    concurrent: bool
-    ops_cdr: bool
-    physical_readiness: str
-    physical_readiness2: str
-    physical_readiness_dt: date
-    billet_subcat: str
-    rs_last_name: str
-    rs_fi: str
-    rs_mi: str
-    reporting_senior: str
-    rs_grade: str
-    rs_desig: str
-    rs_title: str
-    rs_uic: str
-    rs_ssn: str
-    achievements: str
-    primary_duty: str
-    duties: str
-    date_counseled: date
-    counselor: str
-    counselor_ln: str
-    counselor_fi: str
-    counselor_mi: str
-    prof: int
-    prof_dn1: str
-    prof_dn2: str
-    prof_dn3: str
-    qual: int
-    qual_dn1: str
-    qual_dn2: str
-    qual_dn3: str
-    eo: int
-    eo_dn1: str
-    eo_dn2: str
-    eo_dn3: str
-    mil: int
-    mil_dn1: str
-    mil_dn2: str
-    mil_dn3: str
-    pa: int
-    pa_dn1: str
-    pa_dn2: str
-    pa_dn3: str
-    team: int
-    team_dn1: str
-    team_dn2: str
-    team_dn3: str
-    lead: int
-    lead_dn1: str
-    lead_dn2: str
-    lead_dn3: str
-    mis: int
-    mis_dn1: str
-    mis_dn2: str
-    mis_dn3: str
-    tac: int
-    tac_dn1: str
-    tac_dn2: str
-    tac_dn3: str
-    recommend_1: str
-    recommend_2: str
-    rater: str
-    rater_date: date
-    comments_pitch: str
-    comments: str
-    qualifications: str
-    promotion_recom: int
-    summary_rank: int
-    summary_sp: str
-    summary_prog: str
-    summary_prom: str
-    summary_mp: str
-    summary_ep: str
-    retention_yes: bool
-    retention_no: bool
-    rsca: int
-    rs_address: str
-    rs_address1: str
-    rs_address2: str
-    rs_city: str
-    rs_state: str
-    rs_zip_cd: str
-    rs_phone: str
-    rs_dsn: str
-    senior_rater: str
-    senior_rater_date: date
-    statement_yes: bool
-    statement_no: bool
-    rs_info: str
-    rrs_fi: str
-    rrs_mi: str
-    rrs_last_name: str
-    rrs_grade: str
-    rrs_command: str
-    rrs_uic: str
-    user_comments: str
-    psswrd: str
-    standards: str
-    is_validated: str
+    report_id: int | None = None
+    parent: str | None = None
+    report_type: str | None = None
+    full_name: str | None = None
+    first_name: str | None = None
+    mi: str | None = None
+    last_name: str | None = None
+    suffix: str | None = None
+    rate: str | None = None
+    desig: str | None = None
+    ssn: str | None = None
+    active: bool | None = None
+    tar: bool | None = None
+    inactive: bool | None = None
+    atadsw: bool | None = None
+    uic: str | None = None
+    ship_station: str | None = None
+    promotion_status: str | None = None
+    date_reported: date | None = None
+    periodic: bool | None = None
+    det_ind: bool | None = None
+    frocking: bool | None = None
+    special: bool | None = None
+    from_date: date | None = None
+    to_date: date | None = None
+    nob: bool | None = None
+    regular: bool | None = None
+    concurrent: bool | None = None
+    ops_cdr: bool | None = None
+    physical_readiness: str | None = None
+    physical_readiness2: str | None = None
+    physical_readiness_dt: date | None = None
+    billet_subcat: str | None = None
+    rs_last_name: str | None = None
+    rs_fi: str | None = None
+    rs_mi: str | None = None
+    reporting_senior: str | None = None
+    rs_grade: str | None = None
+    rs_desig: str | None = None
+    rs_title: str | None = None
+    rs_uic: str | None = None
+    rs_ssn: str | None = None
+    achievements: str | None = None
+    primary_duty: str | None = None
+    duties: str | None = None
+    date_counseled: date | None = None
+    counselor: str | None = None
+    counselor_ln: str | None = None
+    counselor_fi: str | None = None
+    counselor_mi: str | None = None
+    prof: int | None = None
+    prof_dn1: str | None = None
+    prof_dn2: str | None = None
+    prof_dn3: str | None = None
+    qual: int | None = None
+    qual_dn1: str | None = None
+    qual_dn2: str | None = None
+    qual_dn3: str | None = None
+    eo: int | None = None
+    eo_dn1: str | None = None
+    eo_dn2: str | None = None
+    eo_dn3: str | None = None
+    mil: int | None = None
+    mil_dn1: str | None = None
+    mil_dn2: str | None = None
+    mil_dn3: str | None = None
+    pa: int | None = None
+    pa_dn1: str | None = None
+    pa_dn2: str | None = None
+    pa_dn3: str | None = None
+    team: int | None = None
+    team_dn1: str | None = None
+    team_dn2: str | None = None
+    team_dn3: str | None = None
+    lead: int | None = None
+    lead_dn1: str | None = None
+    lead_dn2: str | None = None
+    lead_dn3: str | None = None
+    mis: int | None = None
+    mis_dn1: str | None = None
+    mis_dn2: str | None = None
+    mis_dn3: str | None = None
+    tac: int | None = None
+    tac_dn1: str | None = None
+    tac_dn2: str | None = None
+    tac_dn3: str | None = None
+    recommend_1: str | None = None
+    recommend_2: str | None = None
+    rater: str | None = None
+    rater_date: date | None = None
+    comments_pitch: str | None = None
+    comments: str | None = None
+    qualifications: str | None = None
+    promotion_recom: int | None = None
+    summary_rank: int | None = None
+    summary_sp: str | None = None
+    summary_prog: str | None = None
+    summary_prom: str | None = None
+    summary_mp: str | None = None
+    summary_ep: str | None = None
+    retention_yes: bool | None = None
+    retention_no: bool | None = None
+    rsca: int | None = None
+    rs_address: str | None = None
+    rs_address1: str | None = None
+    rs_address2: str | None = None
+    rs_city: str | None = None
+    rs_state: str | None = None
+    rs_zip_cd: str | None = None
+    rs_phone: str | None = None
+    rs_dsn: str | None = None
+    senior_rater: str | None = None
+    senior_rater_date: date | None = None
+    statement_yes: bool | None = None
+    statement_no: bool | None = None
+    rs_info: str | None = None
+    rrs_fi: str | None = None
+    rrs_mi: str | None = None
+    rrs_last_name: str | None = None
+    rrs_grade: str | None = None
+    rrs_command: str | None = None
+    rrs_uic: str | None = None
+    user_comments: str | None = None
+    psswrd: str | None = None
+    standards: str | None = None
+    is_validated: str | None = None
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def empty_to_none(cls, value: Any) -> Any:
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
+    @field_validator(
+        "date_reported",
+        "from_date",
+        "to_date",
+        "physical_readiness_dt",
+        "date_counseled",
+        "rater_date",
+        "senior_rater_date",
+        mode="before",
+    )
+    @classmethod
+    def validate_access_date(cls, value: Any) -> Any:
+        if not isinstance(value, str) or not value.strip():
+            return value
+        try:
+            return parse_access_date(value)
+        except ValueError:
+            # leave it for pydantic to report
+            return value
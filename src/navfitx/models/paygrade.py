@@ -0,0 +1,64 @@
+"""
+The paygrade of a member from the rate or grade entered on their report.
+
+RSCAs and summary groups are kept by paygrade, so a YN1 and an ET1 count towards the same ones. The triggers that
+maintain them compute the same paygrade in SQL from these tables (see `navfitx.db`).
+"""
+
+PAYGRADES = frozenset(
+    (
+        *(f"E{i}" for i in range(1, 10)),
+        *(f"W{i}" for i in range(2, 6)),
+        *(f"O{i}" for i in range(1, 7)),
+    )
+)
+
+OFFICER_PAYGRADES = {
+    "ENS": "O1",
+    "LTJG": "O2",
+    "LT": "O3",
+    "LCDR": "O4",
+    "CDR": "O5",
+    "CAPT": "O6",
+    "CWO2": "W2",
+    "CWO3": "W3",
+    "CWO4": "W4",
+    "CWO5": "W5",
+}
+
+# The general apprenticeships (e.g. "SN", "FA"), by the paygrade their last letter stands for
+APPRENTICE_PAYGRADES = {"N": "E3", "A": "E2", "R": "E1"}
+APPRENTICESHIPS = {f"{field}{grade}" for field in "SFACH" for grade in APPRENTICE_PAYGRADES}
+
+# Rates and grades whose paygrade is looked up as a whole, e.g. "E6", "LT" or "SN"
+EXACT_PAYGRADES = {
+    **{grade: grade for grade in sorted(PAYGRADES)},
+    **OFFICER_PAYGRADES,
+    **{rate: APPRENTICE_PAYGRADES[rate[-1]] for rate in sorted(APPRENTICESHIPS)},
+}
+
+# Endings of enlisted rates (e.g. "YN1", "ITCS"), most specific first
+ENLISTED_SUFFIXES = (("CM", "E9"), ("CS", "E8"), ("C", "E7"), ("1", "E6"), ("2", "E5"), ("3", "E4"))
+
+# Characters stripped from both ends of a rate, the same as the SQL trim of the triggers
+RATE_WHITESPACE = " \t\n\r"
+
+
+def paygrade(rate: str) -> str | None:
+    """The paygrade (e.g. "E6" or "O3") of a rate or grade as entered on a report, or None if it isn't recognized."""
+    rate = rate.strip(RATE_WHITESPACE).upper()
+    if rate in EXACT_PAYGRADES:
+        return EXACT_PAYGRADES[rate]
+    for suffix, grade in ENLISTED_SUFFIXES:
+        if len(rate) > len(suffix) and rate.endswith(suffix):
+            return grade
+    return None
+
+
+def group_paygrade(rate: str | None) -> str:
+    """
+    The paygrade RSCAs and summary groups of a rate are kept by: its paygrade, or the rate itself, stripped and
+    uppercased, if it isn't recognized.
+    """
+    rate = (rate or "").strip(RATE_WHITESPACE).upper()
+    return paygrade(rate) or rate
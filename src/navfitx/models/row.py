@@ -0,0 +1,32 @@
+from datetime import date
+from typing import NamedTuple
+
+from .models import Report
+
+# Each report type has its own table, so a report id is only unique when paired with its Report Type Discriminator.
+ReportKey = tuple[str, int]
+
+
+class ReportRow(NamedTuple):
+    """
+    The fields of a report shown in the Report List.
+
+    Rows are read straight from the report tables, without building the report models, and are plain tuples with
+    named fields: they have no instance `__dict__` and share their strings with the query results, so a list of many
+    thousands of reports costs little more than its six values per report.
+    """
+
+    rate: str
+    name: str
+    ssn: str
+    doc_type: str
+    period_end: date | None
+    id: int
+
+    @property
+    def key(self) -> ReportKey:
+        return (self.doc_type, self.id)
+
+    @classmethod
+    def from_report(cls, report: Report) -> "ReportRow":
+        return cls(report.rate, report.name, report.ssn, report.doc_type, report.period_end, report.id)
@@ -0,0 +1,39 @@
+"""
+SQLModel for the Reporting Senior Cumulative Averages (RSCA).
+"""
+
+from sqlmodel import Field, SQLModel
+
+from .paygrade import group_paygrade
+
+# (senior_name, senior_ssn, senior_uic, paygrade)
+RscaKey = tuple[str, str, str, str]
+
+
+class Rsca(SQLModel, table=True):
+    """
+    The cumulative average of a reporting senior: the average of the member trait averages of every report they signed
+    for members of one paygrade. Reports without an observed trait don't count towards it.
+
+    Rows are kept as a running sum and count, which triggers on the report tables update whenever a report is
+    inserted, deleted, or has its traits, reporting senior or rate changed (see `navfitx.db.ensure_db_schema`), so
+    reading an RSCA is a single primary key lookup however many reports a senior signed.
+    """
+
+    senior_name: str = Field(primary_key=True)
+    senior_ssn: str = Field(primary_key=True)
+    senior_uic: str = Field(primary_key=True)
+    # see `group_paygrade`
+    paygrade: str = Field(primary_key=True)
+    # the sum of the member trait averages of the reports, and the number of reports
+    total: float = 0.0
+    reports: int = 0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.reports if self.reports else 0.0
+
+
+def rsca_key(senior_name: str | None, senior_ssn: str | None, senior_uic: str | None, rate: str | None) -> RscaKey:
+    """The key of the RSCA of a report with these fields, as the triggers of `navfitx.db` compute it."""
+    return (senior_name or "", senior_ssn or "", senior_uic or "", group_paygrade(rate))
@@ -0,0 +1,132 @@
+"""
+SQLModel for the promotion recommendation counts of summary groups, and the EVALMAN limits on them.
+"""
+
+from datetime import date
+from enum import Enum
+from typing import NamedTuple
+
+from sqlmodel import Field, SQLModel
+
+from .enums import PromotionRecommendation
+from .paygrade import group_paygrade, paygrade
+
+# (senior_name, senior_ssn, senior_uic, paygrade, period_end, promotion_status), with the period end as an ISO date
+SummaryGroupKey = tuple[str, str, str, str, str, str]
+
+
+class PromotionLimits(NamedTuple):
+    """
+    The percentages of a summary group that may be recommended Early Promote, and Early Promote or Must Promote. A
+    limit of None means there is none.
+    """
+
+    early_promote: int | None
+    must_promote_or_early_promote: int | None
+
+
+# Summary group limits of BUPERSINST 1610.10 (EVALMAN) by paygrade. Paygrades that aren't listed have no limits.
+PROMOTION_LIMITS = {
+    **dict.fromkeys(("E1", "E2", "E3", "E4", "E5", "E6"), PromotionLimits(20, 60)),
+    "E7": PromotionLimits(20, 50),
+    "E8": PromotionLimits(10, 40),
+    "E9": PromotionLimits(10, 30),
+    **dict.fromkeys(("W2", "W3", "W4", "W5", "O3", "O4"), PromotionLimits(20, 60)),
+    **dict.fromkeys(("O1", "O2"), PromotionLimits(20, None)),
+    "O5": PromotionLimits(15, 45),
+    "O6": PromotionLimits(10, 40),
+}
+
+
+class SummaryGroup(SQLModel, table=True):
+    """
+    The number of reports of a summary group with each promotion recommendation. A summary group is the reports one
+    reporting senior signed for members of the same paygrade and promotion status, with the same period end.
+
+    Rows are kept up to date by triggers on the report tables (see `navfitx.db.ensure_db_schema`), so the
+    recommendations of a group are counted when they change rather than by scanning its reports.
+    """
+
+    __tablename__ = "summary_group"
+
+    senior_name: str = Field(primary_key=True)
+    senior_ssn: str = Field(primary_key=True)
+    senior_uic: str = Field(primary_key=True)
+    # see `group_paygrade`
+    paygrade: str = Field(primary_key=True)
+    # ISO date, or "" for reports without a period end
+    period_end: str = Field(primary_key=True)
+    promotion_status: str = Field(primary_key=True)
+    nob: int = 0
+    significant_problems: int = 0
+    progressing: int = 0
+    promotable: int = 0
+    must_promote: int = 0
+    early_promote: int = 0
+
+    def counts(self) -> list[int]:
+        """The number of reports with each promotion recommendation, in `PromotionRecommendation` order."""
+        return [
+            self.nob,
+            self.significant_problems,
+            self.progressing,
+            self.promotable,
+            self.must_promote,
+            self.early_promote,
+        ]
+
+
+def summary_group_key(
+    senior_name: str | None,
+    senior_ssn: str | None,
+    senior_uic: str | None,
+    rate: str | None,
+    period_end: date | None,
+    promotion_status: Enum | str | None,
+) -> SummaryGroupKey:
+    """The key of the summary group of a report with these fields, as the triggers of `navfitx.db` compute it."""
+    return (
+        senior_name or "",
+        senior_ssn or "",
+        senior_uic or "",
+        group_paygrade(rate),
+        period_end.isoformat() if period_end else "",
+        str(promotion_status.value if isinstance(promotion_status, Enum) else promotion_status or ""),
+    )
+
+
+def _percent_rounded_up(size: int, percent: int) -> int:
+    return -(-size * percent // 100)
+
+
+def quota_violations(rate: str, counts: list[int]) -> list[str]:
+    """
+    Describe how a summary group exceeds its promotion recommendation limits.
+
+    Args:
+        rate: The rate, grade or paygrade of the members of the group.
+        counts: The number of reports with each promotion recommendation, in `PromotionRecommendation` order.
+
+    Limits are percentages of the reports with a recommendation other than NOB, rounded up, so a group of one may
+    always have an Early Promote.
+    """
+    grade = paygrade(rate)
+    limits = PROMOTION_LIMITS.get(grade) if grade is not None else None
+    if limits is None:
+        return []
+    size = sum(counts) - counts[PromotionRecommendation.NOB.value]
+    early_promote = counts[PromotionRecommendation.EARLY_PROMOTE.value]
+    must_promote = counts[PromotionRecommendation.MUST_PROMOTE.value]
+    violations = []
+    if limits.early_promote is not None:
+        allowed = _percent_rounded_up(size, limits.early_promote)
+        if early_promote > allowed:
+            violations.append(f"Too many EP: {early_promote}, at most {allowed} in a summary group of {size} {grade}")
+    if limits.must_promote_or_early_promote is not None:
+        allowed = _percent_rounded_up(size, limits.must_promote_or_early_promote)
+        if must_promote + early_promote > allowed:
+            violations.append(
+                f"Too many MP and EP: {must_promote + early_promote}, at most {allowed} in a summary group of {size} "
+                f"{grade}"
+            )
+    return violations
@@ -0,0 +1,595 @@
+"""
+Convert between NAVFIT98A databases and NAVFITX databases.
+
+NAVFIT98A keeps its reports in the `Reports` table of a Microsoft Access database. That table can be exported to CSV,
+e.g. with `mdb-export navfit98.accdb Reports > reports.csv`, and the export is converted here. NAVFITX reports can also
+be exported back to a CSV in the shape of the `Reports` table. Both directions stream rows and work in batches, so
+memory use does not grow with the number of reports.
+
+The correspondence between `N98Report` columns and NAVFITX fields is declared once per report type in `FIELD_MAPS`
+and `CHECKBOX_FIELDS`. `compile_import` and `compile_export` turn those tables into row transformers, so the per-row
+work is a tuple lookup and one converter call per cell.
+"""
+
+import csv
+import io
+import re
+import typing
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from enum import Enum
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+import typer
+from rich import print
+from rich.progress import BarColumn, DownloadColumn, MofNCompleteColumn, Progress, TextColumn, TimeRemainingColumn
+from sqlalchemy import func, insert, select
+from typing_extensions import Annotated
+
+from navfitx.db import REPORT_MODELS, ensure_db_schema, get_engine, iter_report_values
+from navfitx.models import DutyStatus, ValidationIssue, validate_many
+from navfitx.models.models import STORAGE_FIELDS
+from navfitx.models.navfit98 import N98Report, parse_access_date
+from navfitx.utils import print_validation_issues
+
+DEFAULT_BATCH_SIZE = 5000
+
+# NAVFIT98A column names are matched to N98Report fields ignoring case and underscores (e.g. "RSSSN" -> "rs_ssn").
+# These are the columns that can't be matched that way.
+COLUMN_OVERRIDES = {
+    "recommenda": "recommend_1",
+    "recommendb": "recommend_2",
+}
+
+# Parts of N98Report field names that NAVFIT98A writes in capitals in its column names (e.g. "rs_ssn" -> "RSSSN").
+COLUMN_ACRONYMS = frozenset(
+    {"id", "mi", "fi", "ssn", "tar", "atadsw", "uic", "nob", "rs", "rrs", "dsn", "sp", "mp", "ep"}
+    | {"prof", "qual", "eo", "mil", "pa", "team", "lead", "mis", "tac", "rsca"}
+)
+
+# NAVFITX report type -> NAVFIT98A `ReportType`
+REPORT_TYPES = {
+    "fitrep": "FitRep",
+    "eval": "Eval",
+    "chiefeval": "Chief",
+}
+
+# N98Report field -> NAVFITX field, for the fields every type of report has.
+COMMON_FIELD_MAP = {
+    "full_name": "name",
+    "rate": "rate",
+    "desig": "desig",
+    "ssn": "ssn",
+    "uic": "uic",
+    "ship_station": "station",
+    "promotion_status": "promotion_status",
+    "date_reported": "date_reported",
+    "periodic": "periodic",
+    "det_ind": "det_indiv",
+    "special": "special",
+    "from_date": "period_start",
+    "to_date": "period_end",
+    "nob": "not_observed",
+    "regular": "regular",
+    "concurrent": "concurrent",
+    "physical_readiness": "physical_readiness",
+    "billet_subcat": "billet_subcategory",
+    "reporting_senior": "senior_name",
+    "rs_grade": "senior_grade",
+    "rs_desig": "senior_desig",
+    "rs_title": "senior_title",
+    "rs_uic": "senior_uic",
+    "rs_ssn": "senior_ssn",
+    "achievements": "job",
+    "primary_duty": "duties_abbreviation",
+    "duties": "duties_description",
+    "date_counseled": "date_counseled",
+    "counselor": "counselor",
+    "recommend_1": "career_rec_1",
+    "recommend_2": "career_rec_2",
+    "comments": "comments",
+    "promotion_recom": "indiv_promo_rec",
+    "rs_address": "senior_address",
+}
+
+
+def _trait_map(*columns: str) -> dict[str, str]:
+    return {column: f"trait{i}" for i, column in enumerate(columns, start=1)}
+
+
+# N98Report field -> NAVFITX field, for each type of report. The third occasion for report checkbox is stored in the
+# `Frocking` column: it is Promotion/Frocking on EVALs and Detachment of Reporting Senior on FITREPs and Chief EVALs.
+FIELD_MAPS: dict[str, dict[str, str]] = {
+    "fitrep": {
+        **COMMON_FIELD_MAP,
+        **_trait_map("prof", "eo", "mil", "team", "mis", "lead", "tac"),
+        "frocking": "det_rs",
+        "ops_cdr": "ops_cdr",
+    },
+    "eval": {
+        **COMMON_FIELD_MAP,
+        **_trait_map("prof", "qual", "eo", "team", "pa", "lead", "mil"),
+        "frocking": "prom_frock",
+        "qualifications": "achievements",
+    },
+    "chiefeval": {
+        **COMMON_FIELD_MAP,
+        **_trait_map("prof", "qual", "eo", "mil", "pa", "lead", "team"),
+        "frocking": "det_rs",
+        "ops_cdr": "ops_cdr",
+    },
+}
+
+GROUP_CHECKBOXES = (
+    ("active", DutyStatus.ACT),
+    ("tar", DutyStatus.TAR),
+    ("inactive", DutyStatus.INACT),
+    ("atadsw", DutyStatus.ATADSW),
+)
+
+# NAVFITX fields that NAVFIT98A stores as one checkbox column per value. On import the first checked column wins.
+CHECKBOX_FIELDS: dict[str, dict[str, tuple[tuple[str, Any], ...]]] = {
+    "fitrep": {"group": GROUP_CHECKBOXES},
+    "eval": {"group": GROUP_CHECKBOXES, "retain": (("retention_yes", 1), ("retention_no", 0))},
+    "chiefeval": {"group": GROUP_CHECKBOXES},
+}
+
+TRUE_VALUES = frozenset({"1", "-1", "true", "yes", "y"})
+FALSE_VALUES = frozenset({"0", "false", "no", "n"})
+
+
+@dataclass
+class Navfit98ConversionResult:
+    """
+    Args:
+        imported: Number of reports imported for each doc_type.
+        skipped: The row number (counting from 1 after the header) and the reason for every row that was not
+            imported.
+        issues: When the reports were validated, the issues of the imported reports, with the row number of the
+            report in place of its index in the batch.
+    """
+
+    imported: Counter[str] = field(default_factory=Counter)
+    skipped: list[tuple[int, str]] = field(default_factory=list)
+    issues: list[ValidationIssue] = field(default_factory=list)
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+N98_FIELDS = {_normalize(name): name for name in N98Report.model_fields}
+
+
+def _column_name(n98_field: str) -> str:
+    if n98_field == "recommend_1":
+        return "RecommendA"
+    if n98_field == "recommend_2":
+        return "RecommendB"
+    return "".join(part.upper() if part in COLUMN_ACRONYMS else part.capitalize() for part in n98_field.split("_"))
+
+
+# The columns of the NAVFIT98A `Reports` table, in N98Report field order.
+NAVFIT98_COLUMNS = [_column_name(name) for name in N98Report.model_fields]
+
+
+def match_columns(header: Sequence[str]) -> list[str | None]:
+    """Return the N98Report field for each column of a `Reports` table export, or None for unknown columns."""
+    fields = []
+    for column in header:
+        normalized = _normalize(column)
+        fields.append(COLUMN_OVERRIDES.get(normalized) or N98_FIELDS.get(normalized))
+    return fields
+
+
+def get_doc_type(report_type: str | None) -> str | None:
+    """Return the NAVFITX doc_type for a NAVFIT98A `ReportType`, or None if it isn't a report NAVFITX supports."""
+    normalized = _normalize(report_type or "")
+    if normalized.startswith("fit"):
+        return "fitrep"
+    if normalized.startswith(("chief", "cpo")):
+        return "chiefeval"
+    if normalized.startswith("eval"):
+        return "eval"
+    return None
+
+
+def _field_type(annotation: Any) -> Any:
+    """Return the type of a field annotated `T` or `T | None`."""
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    return args[0] if args else annotation
+
+
+def _parse_bool(cell: str) -> bool:
+    value = cell.strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f"Not a checkbox value: {cell!r}")
+
+
+def _enum_parser(enum_type: type[Enum]) -> Callable[[str], Any]:
+    def parse(cell: str) -> Any:
+        # NAVFIT98A allowed free text in some of these columns; anything NAVFITX doesn't know is left blank
+        try:
+            return enum_type(cell.strip().upper())
+        except ValueError:
+            return None
+
+    return parse
+
+
+def _import_converter(n98_field: str, model: type[Any], report_field: str) -> Callable[[str], Any]:
+    """Return a function that converts a non-empty CSV cell of `n98_field` to a value of `report_field`."""
+    target = _field_type(model.model_fields[report_field].annotation)
+    if isinstance(target, type) and issubclass(target, Enum):
+        return _enum_parser(target)
+    source = _field_type(N98Report.model_fields[n98_field].annotation)
+    if source is bool:
+        return _parse_bool
+    if source is int:
+        return int
+    if source is date:
+        return parse_access_date
+    return str
+
+
+def _tuple_getter(indexes: Sequence[int]) -> Callable[[Sequence[str]], tuple[str, ...]]:
+    """Like itemgetter, but always returns a tuple."""
+    if not indexes:
+        return lambda row: ()
+    if len(indexes) == 1:
+        index = indexes[0]
+        return lambda row: (row[index],)
+    return itemgetter(*indexes)
+
+
+def _column_defaults(doc_type: str) -> dict[str, Any]:
+    model = REPORT_MODELS[doc_type]
+    return {name: info.default for name, info in model.model_fields.items() if name not in STORAGE_FIELDS}
+
+
+def compile_import(header: Sequence[str]) -> Callable[[Sequence[str]], tuple[str | None, dict[str, Any]]]:
+    """
+    Compile the field maps into a transformer for rows of a `Reports` table export with the given header.
+
+    The transformer returns the doc_type of a row and the column values of its NAVFITX report, or None and an empty
+    dict for report types NAVFITX doesn't support. It raises ValueError for a cell it can't convert.
+    """
+    index = {name: i for i, name in enumerate(match_columns(header)) if name is not None}
+    get_report_type = _tuple_getter([index["report_type"]] if "report_type" in index else [])
+
+    plans = {}
+    for doc_type, field_map in FIELD_MAPS.items():
+        model = REPORT_MODELS[doc_type]
+        mapped = [(n98_field, report_field) for n98_field, report_field in field_map.items() if n98_field in index]
+        targets = [
+            (report_field, n98_field, _import_converter(n98_field, model, report_field))
+            for n98_field, report_field in mapped
+        ]
+        checkboxes = []
+        for report_field, choices in CHECKBOX_FIELDS[doc_type].items():
+            present = [(column, value) for column, value in choices if column in index]
+            getter = _tuple_getter([index[column] for column, _ in present])
+            checkboxes.append((report_field, getter, [value for _, value in present]))
+        plans[doc_type] = (
+            _column_defaults(doc_type),
+            _tuple_getter([index[n98_field] for n98_field, _ in mapped]),
+            targets,
+            checkboxes,
+        )
+
+    def transform(row: Sequence[str]) -> tuple[str | None, dict[str, Any]]:
+        report_type = get_report_type(row)
+        doc_type = get_doc_type(report_type[0] if report_type else None)
+        if doc_type is None:
+            return None, {}
+        defaults, getter, targets, checkboxes = plans[doc_type]
+        values = defaults.copy()
+        for (report_field, n98_field, convert), cell in zip(targets, getter(row)):
+            if cell:
+                try:
+                    values[report_field] = convert(cell)
+                except ValueError:
+                    raise ValueError(f"invalid {_column_name(n98_field)} value {cell!r}") from None
+        for report_field, checkbox_getter, choices in checkboxes:
+            for value, cell in zip(choices, checkbox_getter(row)):
+                if cell and _parse_bool(cell):
+                    values[report_field] = value
+                    break
+        return doc_type, values
+
+    return transform
+
+
+def _format_date(value: date | None) -> str:
+    # same as value.strftime("%m/%d/%Y 00:00:00"), which is several times slower
+    return f"{value.month:02d}/{value.day:02d}/{value.year:04d} 00:00:00" if value is not None else ""
+
+
+def _format_enum(value: Enum | None) -> str:
+    return str(value.value) if value is not None else ""
+
+
+def _format_int(value: int | None) -> str:
+    return str(value) if value is not None else ""
+
+
+def _format_bool(value: bool | None) -> str:
+    return "1" if value else "0"
+
+
+def _format_text(value: str | None) -> str:
+    return value or ""
+
+
+def _export_formatter(n98_field: str, model: type[Any], report_field: str) -> Callable[[Any], str]:
+    """Return a function that formats a value of `report_field` as a CSV cell of `n98_field`."""
+    if _field_type(N98Report.model_fields[n98_field].annotation) is bool:
+        return _format_bool
+    target = _field_type(model.model_fields[report_field].annotation)
+    if isinstance(target, type) and issubclass(target, Enum):
+        return _format_enum
+    if target is date:
+        return _format_date
+    if target is int:
+        return _format_int
+    return _format_text
+
+
+def compile_export(doc_type: str) -> Callable[[Mapping[str, Any], int], list[str]]:
+    """
+    Compile the field maps into a transformer from the column values of a NAVFITX report of type `doc_type` to a row
+    of NAVFIT98A `Reports` table cells, in `NAVFIT98_COLUMNS` order. The transformer also takes the ReportID to use.
+    """
+    model = REPORT_MODELS[doc_type]
+    column_index = {name: i for i, name in enumerate(N98Report.model_fields)}
+
+    # unmapped columns are left blank
+    template = [""] * len(column_index)
+    template[column_index["report_type"]] = REPORT_TYPES[doc_type]
+    report_id_index = column_index["report_id"]
+
+    mapped = list(FIELD_MAPS[doc_type].items())
+    getter = itemgetter(*(report_field for _, report_field in mapped))
+    targets = [
+        (column_index[n98_field], _export_formatter(n98_field, model, report_field))
+        for n98_field, report_field in mapped
+    ]
+    checkboxes = [
+        (column_index[column], report_field, value)
+        for report_field, choices in CHECKBOX_FIELDS[doc_type].items()
+        for column, value in choices
+    ]
+
+    def transform(values: Mapping[str, Any], report_id: int) -> list[str]:
+        row = template.copy()
+        row[report_id_index] = str(report_id)
+        for (i, format_cell), value in zip(targets, getter(values)):
+            row[i] = format_cell(value)
+        for i, report_field, checked in checkboxes:
+            row[i] = "1" if values[report_field] == checked else "0"
+        return row
+
+    return transform
+
+
+def convert_navfit98_csv(
+    csv_path: Path,
+    db_path: Path,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    encoding: str = "utf-8-sig",
+    validate: bool = False,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> Navfit98ConversionResult:
+    """
+    Import a CSV export of a NAVFIT98A `Reports` table into a NAVFITX database.
+
+    Rows are read one at a time and inserted with one multi-row INSERT per `batch_size` reports of each type. Rows
+    that can't be read, or whose `ReportType` NAVFITX doesn't support, are skipped. All reports are imported in a
+    single transaction, so a failed conversion leaves the database unchanged.
+
+    Args:
+        csv_path: Path to the CSV export. The first line must be the column names.
+        db_path: Path to the NAVFITX database. It is created if it does not exist.
+        batch_size: Number of reports of one type to insert at a time.
+        encoding: Text encoding of the CSV export.
+        validate: Validate each batch of reports with `validate_many` before it is inserted. Reports with issues are
+            still imported, since NAVFIT98A keeps incomplete reports too, and their issues are returned.
+        on_progress: Called after each batch with the number of bytes read so far and the size of the file.
+    """
+    result = Navfit98ConversionResult()
+    engine = ensure_db_schema(db_path)
+    total_bytes = csv_path.stat().st_size
+    batches: dict[str, list[dict[str, Any]]] = {doc_type: [] for doc_type in REPORT_MODELS}
+    # the row number of each report in the batches, when they are validated
+    batch_rows: dict[str, list[int]] = {doc_type: [] for doc_type in REPORT_MODELS}
+
+    with csv_path.open("rb") as raw, engine.begin() as conn:
+
+        def flush(doc_type: str) -> None:
+            batch = batches[doc_type]
+            if batch:
+                if validate:
+                    rows = batch_rows[doc_type]
+                    result.issues.extend(
+                        issue._replace(index=rows[issue.index]) for issue in validate_many(batch).issues
+                    )
+                    rows.clear()
+                conn.execute(insert(REPORT_MODELS[doc_type]), batch)
+                result.imported[doc_type] += len(batch)
+                batch.clear()
+            if on_progress is not None:
+                on_progress(raw.tell(), total_bytes)
+
+        reader = csv.reader(io.TextIOWrapper(raw, encoding=encoding, newline=""))
+        transform = compile_import(next(reader, []))
+        for row_num, row in enumerate(reader, start=1):
+            try:
+                doc_type, values = transform(row)
+            except ValueError as exc:
+                result.skipped.append((row_num, str(exc)))
+                continue
+            except IndexError:
+                result.skipped.append((row_num, "missing columns"))
+                continue
+            if doc_type is None:
+                result.skipped.append((row_num, "unsupported report type"))
+                continue
+            batch = batches[doc_type]
+            batch.append(values)
+            if validate:
+                batch_rows[doc_type].append(row_num)
+            if len(batch) >= batch_size:
+                flush(doc_type)
+        for doc_type in batches:
+            flush(doc_type)
+    return result
+
+
+def export_navfit98_csv(
+    db_path: Path,
+    csv_path: Path,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> Counter[str]:
+    """
+    Export every report in a NAVFITX database to a CSV in the shape of the NAVFIT98A `Reports` table.
+
+    Reports are read `batch_size` rows at a time. They are numbered from 1 in the ReportID column, since NAVFITX
+    report ids are only unique within one type of report.
+
+    Args:
+        on_progress: Called after each batch with the number of reports exported so far and the total.
+
+    Returns:
+        The number of reports exported for each doc_type.
+    """
+    exported: Counter[str] = Counter()
+    with get_engine(db_path).connect() as conn:
+        total = sum(
+            conn.execute(select(func.count()).select_from(model)).scalar_one() for model in REPORT_MODELS.values()
+        )
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(NAVFIT98_COLUMNS)
+        report_id = 0
+        transforms = {doc_type: compile_export(doc_type) for doc_type in REPORT_MODELS}
+        for doc_type, partition in iter_report_values(db_path, batch_size=batch_size):
+            transform = transforms[doc_type]
+            writer.writerows(transform(values, report_id + i) for i, values in enumerate(partition, start=1))
+            report_id += len(partition)
+            exported[doc_type] += len(partition)
+            if on_progress is not None:
+                on_progress(report_id, total)
+    return exported
+
+
+def import_navfit98_command(
+    input: Annotated[
+        Path,
+        typer.Option(
+            "--input",
+            "-i",
+            help="Path to a CSV export of the Reports table of a NAVFIT98A database (e.g. from mdb-export).",
+            exists=True,
+            dir_okay=False,
+            readable=True,
+        ),
+    ],
+    db: Annotated[
+        Path,
+        typer.Option(
+            "--db",
+            help="Path to the target NAVFITX SQLite database file.",
+            dir_okay=False,
+        ),
+    ],
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch-size", help="Number of reports to insert at a time.", min=1),
+    ] = DEFAULT_BATCH_SIZE,
+    validate: Annotated[
+        bool,
+        typer.Option(help="Validate the imported reports and print a table of their issues."),
+    ] = False,
+) -> None:
+    """
+    Import the reports from a NAVFIT98A database into a NAVFITX database.
+    """
+    columns = (TextColumn("Importing"), BarColumn(), DownloadColumn(), TimeRemainingColumn())
+    with Progress(*columns) as progress:
+        task = progress.add_task("import", total=input.stat().st_size)
+        try:
+            result = convert_navfit98_csv(
+                input,
+                db,
+                batch_size=batch_size,
+                validate=validate,
+                on_progress=lambda done, total: progress.update(task, completed=done, total=total),
+            )
+        except Exception as exc:
+            print(f"[red]Import failed:[/red] {exc}")
+            raise typer.Exit(code=1)
+
+    for row_num, reason in result.skipped:
+        print(f"[yellow]Skipped row {row_num}:[/yellow] {reason}")
+    imported = ", ".join(f"{count} {doc_type}" for doc_type, count in sorted(result.imported.items())) or "0 reports"
+    print(f"Imported {imported} into {db}")
+    if result.issues:
+        print_validation_issues(result.issues, label=lambda issue: str(issue.index), label_header="Row")
+        invalid = len({issue.index for issue in result.issues})
+        print(f"[yellow]{invalid} imported report(s) have validation issues.[/yellow]")
+
+
+def export_navfit98_command(
+    db: Annotated[
+        Path,
+        typer.Option(
+            "--db",
+            help="Path to the NAVFITX SQLite database file.",
+            exists=True,
+            dir_okay=False,
+            readable=True,
+        ),
+    ],
+    output: Annotated[
+        Path,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Path of the CSV file to write, in the shape of the NAVFIT98A Reports table.",
+            dir_okay=False,
+        ),
+    ],
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch-size", help="Number of reports to read at a time.", min=1),
+    ] = DEFAULT_BATCH_SIZE,
+) -> None:
+    """
+    Export the reports in a NAVFITX database to a CSV for a NAVFIT98A database.
+    """
+    columns = (TextColumn("Exporting"), BarColumn(), MofNCompleteColumn(), TimeRemainingColumn())
+    with Progress(*columns) as progress:
+        task = progress.add_task("export", total=None)
+        try:
+            exported = export_navfit98_csv(
+                db,
+                output,
+                batch_size=batch_size,
+                on_progress=lambda done, total: progress.update(task, completed=done, total=total),
+            )
+        except Exception as exc:
+            print(f"[red]Export failed:[/red] {exc}")
+            raise typer.Exit(code=1)
+
+    summary = ", ".join(f"{count} {doc_type}" for doc_type, count in sorted(exported.items())) or "0 reports"
+    print(f"Exported {summary} to {output}")
@@ -51,7 +51,7 @@ def create_eval_pdf(eval: Fitrep, path: Path) -> None:
     front.insert_text(Point(24, 164), format_job(eval.job), fontsize=10, fontname="Cour", lineheight=1.0)
     front.insert_text(Point(28, 212), eval.duties_abbreviation, fontsize=12, fontname="Cour")
 
-    duties_desc = wrap_duty_desc(eval.duties_description)
+    duties_desc = wrap_duty_desc(eval.duties_description, eval.TEXT_BOXES["duties_description"])
     front.insert_text(Point(24, 212), duties_desc, fontsize=10, fontname="Cour", lineheight=1.0)
 
     for point in get_perfomance_points(eval):
@@ -0,0 +1,86 @@
+"""
+Printing many reports at once, and rendering the preview of a report.
+
+Reports are filled out in worker processes rather than threads, because pymupdf must not be used from several threads
+at the same time. Every function run in a worker process is defined at module level so it can be pickled.
+"""
+
+import hashlib
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from navfitx.db import ReportKey, get_report
+
+if TYPE_CHECKING:
+    from navfitx.models import Report
+
+
+class RenderedReport(NamedTuple):
+    key: ReportKey
+    # file name of the report's own PDF when reports are printed to a folder
+    filename: str
+    pdf: bytes
+
+
+class RenderedPage(NamedTuple):
+    page: int
+    digest: bytes
+    width: int
+    height: int
+    stride: int
+    # RGB pixels, `stride` bytes per row
+    samples: bytes
+
+
+def report_pdf_filename(doc_type: str, report_id: int, name: str) -> str:
+    """A file name for the PDF of a report that is unique within its database and safe on every OS."""
+    stem = re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_") or "report"
+    return f"{stem}_{doc_type}_{report_id}.pdf"
+
+
+def render_report(db_path: Path, key: ReportKey, read_only: bool = False) -> RenderedReport:
+    """
+    Read a report from the database and fill out its PDF.
+
+    This runs in a worker process: only the report key crosses the process boundary on the way in, and only the
+    finished PDF on the way out.
+    """
+    report = get_report(db_path, key, read_only=read_only)
+    if report is None:
+        raise ValueError("The report no longer exists.")
+    doc = report.build_pdf()
+    try:
+        pdf = doc.tobytes(garbage=1, deflate=True)
+    finally:
+        doc.close()
+    return RenderedReport(key, report_pdf_filename(key[0], key[1], report.name), pdf)
+
+
+def render_changed_pages(report: "Report", digests: Mapping[int, bytes], zoom: float) -> list[RenderedPage]:
+    """
+    Fill out the PDF of a report and rasterize every page whose content is not the one last rendered.
+
+    Filling out the PDF is cheap compared to rasterizing it, so the content of each page is compared with `digests`
+    (page number -> digest of the page last rendered) and only the pages printing a changed field are rasterized.
+
+    This runs in a worker process: only the report and the digests cross the process boundary on the way in, and only
+    the pixels of the changed pages on the way out.
+    """
+    import pymupdf
+
+    doc = report.build_pdf()
+    try:
+        rendered: list[RenderedPage] = []
+        for page in doc:
+            digest = hashlib.blake2b(page.read_contents(), digest_size=16).digest()
+            if digests.get(page.number) == digest:
+                continue
+            pixmap = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+            rendered.append(
+                RenderedPage(page.number, digest, pixmap.width, pixmap.height, pixmap.stride, pixmap.samples)
+            )
+        return rendered
+    finally:
+        doc.close()
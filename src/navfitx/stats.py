@@ -0,0 +1,237 @@
+"""
+Trait statistics over every report in a NAVFITX database.
+
+The trait grades, promotion recommendation and grouping column of the reports are read into one `array` per column,
+without building report models, and the statistics are computed a column at a time: histograms with `array.count`,
+per-report trait averages with `map` over the columns, and per-group counts with `Counter`. Each pass runs in C over
+a compact array, so statistics over many thousands of reports take a few passes over a few bytes per report.
+
+Trait grades are stored as 1-5, with 0 for Not Observed (NOB). A trait that was left blank is read as `BLANK`.
+"""
+
+import math
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import NamedTuple
+
+import typer
+from rich import print
+from rich.table import Table
+from sqlalchemy import func, select, union_all
+from typing_extensions import Annotated
+
+from navfitx.db import REPORT_MODELS, get_engine
+from navfitx.models import PromotionRecommendation
+
+TRAIT_COLUMNS = tuple(f"trait{i}" for i in range(1, 8))
+
+# Columns that reports can be grouped by, by the name used on the command line
+GROUP_COLUMNS = {
+    "senior": "senior_name",
+    "rate": "rate",
+    "type": "doc_type",
+}
+
+# A trait or promotion recommendation that was left blank
+BLANK = -1
+
+# The grades of a trait, and the promotion recommendations, in the order they are counted: NOB first
+GRADES = tuple(range(6))
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+class GroupStats(NamedTuple):
+    """Statistics of the reports of one group, e.g. of one reporting senior."""
+
+    group: str
+    reports: int
+    # average of the member trait averages of the reports with an observed trait, or None if there are none
+    trait_average: float | None
+    # number of reports with each promotion recommendation, NOB first
+    promotion: tuple[int, ...]
+
+    @property
+    def nob_rate(self) -> float | None:
+        """Fraction of the reports with a promotion recommendation that are NOB."""
+        recommended = sum(self.promotion)
+        return self.promotion[PromotionRecommendation.NOB.value] / recommended if recommended else None
+
+
+@dataclass
+class TraitColumns:
+    """
+    The trait data of many reports, one array per column.
+
+    Args:
+        traits: The grades of each of the seven traits, as signed bytes.
+        promotion: The promotion recommendation of each report.
+        groups: The group of each report, as an index into `group_names`.
+        group_names: The name of each group, in the order they were first seen.
+    """
+
+    traits: list[array] = field(default_factory=lambda: [array("b") for _ in TRAIT_COLUMNS])
+    promotion: array = field(default_factory=lambda: array("b"))
+    groups: array = field(default_factory=lambda: array("I"))
+    group_names: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.promotion)
+
+    def extend(self, rows: Sequence[Sequence]) -> None:
+        """Append rows of (trait1, ..., trait7, indiv_promo_rec, group), with blanks already read as `BLANK`."""
+        if not rows:
+            return
+        *traits, promotion, groups = zip(*rows)
+        for column, values in zip(self.traits, traits):
+            column.extend(values)
+        self.promotion.extend(promotion)
+        index = {name: i for i, name in enumerate(self.group_names)}
+        # len(index) is evaluated before setdefault adds a new group
+        self.groups.extend([index.setdefault(group, len(index)) for group in groups])
+        self.group_names.extend(list(index)[len(self.group_names) :])
+
+    def member_averages(self) -> array:
+        """
+        The member trait average of each report: the average of its observed traits, or NaN if no trait was
+        observed. This is the average printed on the report by `Report.member_trait_avg`.
+        """
+        # NOB and blank traits count as 0 towards the total and aren't counted as observed
+        observed = [array("b", map(max, column, repeat(0))) for column in self.traits]
+        totals = map(sum, zip(*observed))
+        counts = map(sum, zip(*(map(bool, column) for column in observed)))
+        return array("d", map(_mean, totals, counts))
+
+    def trait_histograms(self) -> list[tuple[int, ...]]:
+        """For each trait, the number of reports with each grade, NOB first."""
+        return [tuple(column.count(grade) for grade in GRADES) for column in self.traits]
+
+    def group_stats(self) -> list[GroupStats]:
+        """Statistics of each group of reports, in the order the groups were first seen."""
+        reports = Counter(self.groups)
+        promotion = Counter(zip(self.groups, self.promotion))
+        totals = [0.0] * len(self.group_names)
+        observed = [0] * len(self.group_names)
+        for group, average in zip(self.groups, self.member_averages()):
+            if not math.isnan(average):
+                totals[group] += average
+                observed[group] += 1
+        return [
+            GroupStats(
+                name,
+                reports[i],
+                totals[i] / observed[i] if observed[i] else None,
+                tuple(promotion[i, grade] for grade in GRADES),
+            )
+            for i, name in enumerate(self.group_names)
+        ]
+
+
+def _mean(total: int, count: int) -> float:
+    return total / count if count else math.nan
+
+
+def load_trait_columns(
+    db_path: Path,
+    *,
+    group_by: str = "senior",
+    doc_types: Sequence[str] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    archive: bool = False,
+) -> TraitColumns:
+    """
+    Read the trait grades, promotion recommendation and group of every report of the given types (by default every
+    report) into a `TraitColumns`, `batch_size` rows at a time.
+
+    The database is opened read-only. It may be written while it is read, e.g. by the GUI, unless it is opened as an
+    immutable `archive` (see `get_engine`).
+
+    Args:
+        group_by: A key of `GROUP_COLUMNS`.
+    """
+    group_column = GROUP_COLUMNS[group_by]
+    statement = union_all(
+        *(
+            select(
+                *(func.coalesce(getattr(model, name), BLANK) for name in (*TRAIT_COLUMNS, "indiv_promo_rec")),
+                func.coalesce(getattr(model, group_column), ""),
+            )
+            for doc_type, model in REPORT_MODELS.items()
+            if doc_types is None or doc_type in doc_types
+        )
+    )
+    columns = TraitColumns()
+    with get_engine(db_path, read_only=True, immutable=archive).connect() as conn:
+        for partition in conn.execution_options(yield_per=batch_size).execute(statement).partitions():
+            columns.extend(partition)
+    return columns
+
+
+def _format_average(value: float | None) -> str:
+    return "" if value is None else f"{value:.2f}"
+
+
+def _format_rate(value: float | None) -> str:
+    return "" if value is None else f"{value:.0%}"
+
+
+GRADE_HEADERS = ("NOB", "1", "2", "3", "4", "5")
+PROMOTION_HEADERS = ("NOB", "SP", "PR", "P", "MP", "EP")
+
+
+def stats_command(
+    db: Annotated[
+        Path,
+        typer.Option(
+            "--db",
+            help="Path to the NAVFITX SQLite database file.",
+            exists=True,
+            dir_okay=False,
+            readable=True,
+        ),
+    ],
+    by: Annotated[
+        str,
+        typer.Option("--by", help=f"Group the reports by {', '.join(GROUP_COLUMNS)}.", case_sensitive=False),
+    ] = "senior",
+    type_of_report: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--type",
+            "-t",
+            help="Only include reports of this type: 'eval', 'chiefeval', or 'fitrep'. Repeat for several types.",
+            case_sensitive=False,
+        ),
+    ] = None,
+) -> None:
+    """
+    Print trait averages, promotion recommendations and trait grade distributions of the reports in a database.
+    """
+    by = by.lower()
+    if by not in GROUP_COLUMNS:
+        raise typer.BadParameter(f"must be one of {', '.join(GROUP_COLUMNS)}", param_hint="--by")
+    doc_types = [doc_type.lower() for doc_type in type_of_report] if type_of_report else None
+    if doc_types is not None and not set(doc_types) <= set(REPORT_MODELS):
+        raise typer.BadParameter(f"must be one of {', '.join(REPORT_MODELS)}", param_hint="--type")
+
+    columns = load_trait_columns(db, group_by=by, doc_types=doc_types)
+
+    groups = Table(by.capitalize(), "Reports", "Trait Avg", *PROMOTION_HEADERS, "NOB Rate", title="Reports")
+    for stats in sorted(columns.group_stats(), key=lambda stats: stats.group.casefold()):
+        groups.add_row(
+            stats.group or "(blank)",
+            str(stats.reports),
+            _format_average(stats.trait_average),
+            *map(str, stats.promotion),
+            _format_rate(stats.nob_rate),
+        )
+    print(groups)
+
+    grades = Table("Trait", *GRADE_HEADERS, "Blank", title="Trait Grades")
+    for name, histogram in zip(TRAIT_COLUMNS, columns.trait_histograms()):
+        grades.add_row(f"Trait {name.removeprefix('trait')}", *map(str, histogram), str(len(columns) - sum(histogram)))
+    print(grades)
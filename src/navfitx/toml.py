@@ -17,20 +17,23 @@ from navfitx.importer import (
     build_fitrep_template_toml,
     parse_report_toml,
 )
+from navfitx.models import validate_many
+from navfitx.utils import print_validation_issues
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
 
-def validate_toml_file(file: Path) -> Path:
+def validate_toml_file(files: list[Path]) -> list[Path]:
     """
-    Validate that the provided file is a valid TOML file.
+    Validate that the provided files are valid TOML files.
     """
-    try:
-        with file.open("rb") as f:
-            tomllib.load(f)
-    except Exception as e:
-        raise typer.BadParameter(f"{e}")
-    return file
+    for file in files:
+        try:
+            with file.open("rb") as f:
+                tomllib.load(f)
+        except Exception as e:
+            raise typer.BadParameter(f"{file}: {e}")
+    return files
 
 
 @app.callback()
@@ -80,12 +83,12 @@ def example(
 
 @app.command(no_args_is_help=True)
 def pdf(
-    input: Annotated[
-        Path,
+    inputs: Annotated[
+        list[Path],
         typer.Option(
             "--input",
             "-i",
-            help="The path to the input TOML file.",
+            help="The path to an input TOML file. Repeat to generate a PDF for each of several files.",
             exists=True,
             dir_okay=False,
             readable=True,
@@ -93,46 +96,85 @@ def pdf(
         ),
     ],
     output: Annotated[
-        Path,
+        Path | None,
         typer.Option(
             "--output",
             "-o",
-            help="The name or path for the output PDF file.",
+            help=(
+                "The name or path for the output PDF file [default: navfitx_report.pdf], or with several input files "
+                "the folder to write a PDF named after each of them into [default: current folder]."
+            ),
             writable=True,
-            dir_okay=False,
         ),
-    ] = Path("navfitx_report.pdf"),
+    ] = None,
     validate: Annotated[
         bool,
         typer.Option(
-            help="Check that the toml file contains valid and complete FITREP data before generating the PDF."
+            help="Check that the toml files contain valid and complete report data before generating the PDFs."
         ),
     ] = True,
 ):
     """
-    Generate a Performance Evaluation PDF from a .toml file.
-    """
-    try:
-        with input.open("r") as f:
-            toml_str = f.read()
-    except Exception as e:
-        print(f"Error parsing TOML file; are you sure {input} is a valid TOML file?")
-        print(f"Error details: {e}")
-        raise typer.Exit(code=1)
-
-    try:
-        report = parse_report_toml(toml_str)
-    except ImportSchemaError as e:
-        print(f"Error parsing TOML file; are you sure {input} is a valid report TOML file?")
-        print(f"Error details: {e}")
-        raise typer.Exit(code=1)
+    Generate a Performance Evaluation PDF from each .toml file.
 
+    With --validate, the files are validated together and their issues printed as one table. A PDF is generated for
+    every valid file, and the command fails if any file is invalid.
+    """
+    if len(inputs) == 1:
+        if output is not None and output.is_dir():
+            raise typer.BadParameter(f"{output} is a folder, not a PDF file", param_hint="--output")
+        outputs = [output or Path("navfitx_report.pdf")]
+    else:
+        folder = output or Path(".")
+        if folder.is_file() or folder.suffix.lower() == ".pdf":
+            raise typer.BadParameter(
+                f"{folder} must be a folder to write a PDF for each of several input files into", param_hint="--output"
+            )
+        outputs = [folder / input.with_suffix(".pdf").name for input in inputs]
+        written: dict[Path, Path] = {}
+        for input, path in zip(inputs, outputs):
+            if path in written:
+                raise typer.BadParameter(
+                    f"{written[path]} and {input} would both be written to {path}; rename one of them",
+                    param_hint="--input",
+                )
+            written[path] = input
+
+    reports = []
+    for input in inputs:
+        try:
+            with input.open("r") as f:
+                toml_str = f.read()
+        except Exception as e:
+            print(f"Error parsing TOML file; are you sure {input} is a valid TOML file?")
+            print(f"Error details: {e}")
+            raise typer.Exit(code=1)
+
+        try:
+            reports.append(parse_report_toml(toml_str))
+        except ImportSchemaError as e:
+            print(f"Error parsing TOML file; are you sure {input} is a valid report TOML file?")
+            print(f"Error details: {e}")
+            raise typer.Exit(code=1)
+
+    issues = []
     if validate:
-        type(report).model_validate(report)
+        reports, issues = validate_many(reports)
+        if issues:
+            print_validation_issues(issues, label=lambda issue: str(inputs[issue.index]), label_header="File")
+
+    if len(inputs) > 1:
+        folder.mkdir(parents=True, exist_ok=True)
 
     # TODO: ensure data is printable; ie that fields don't have text that is too long
-    report.create_pdf(output)
-    print(f"PDF generated successfully at {output}")
+    for report, path in zip(reports, outputs):
+        if report is not None:
+            report.create_pdf(path)
+            print(f"PDF generated successfully at {path}")
+    if issues:
+        invalid = len({issue.index for issue in issues})
+        print(f"[red]{invalid} of {len(inputs)} report(s) failed validation.[/red]")
+        raise typer.Exit(code=1)
 
 
 @app.command(no_args_is_help=True)
@@ -3,10 +3,14 @@ Utility functions used multiple times throughout the NAVFITX app.
 """
 
 import importlib.resources as resources
-import textwrap
+from collections.abc import Callable, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from navfitx.constants import DUTIES_DESC_SPACE_FOR_ABBREV
+from navfitx.layout import TextBox, box_layout
+
+if TYPE_CHECKING:
+    from navfitx.models.batch import ValidationIssue
 
 
 def get_blank_report_path(report: str) -> Path:
@@ -32,13 +36,42 @@ def get_icon_path() -> Path:
         return icon_path
 
 
-def wrap_duty_desc(text: str) -> str:
+def wrap_duty_desc(text: str, box: TextBox) -> str:
     """
     The duties description is weird because the user manual says the constraint on this
     box is "up to 334 alhphanumeric characters without spaces".
-    In practice, there are 4 lines. The first can have up to 69 characters (not including newline),
-    and the next three can have up to 91 charaters (not including newline).
+    In practice, there are 4 lines, laid out in `box` (the "duties_description" entry of the report's TEXT_BOXES),
+    whose first line starts after the space left for the duties abbreviation.
+    """
+    return "\n".join(box_layout(text, box))
+
+
+def print_validation_issues(
+    issues: Sequence["ValidationIssue"],
+    label: Callable[["ValidationIssue"], str] | None = None,
+    label_header: str = "Report",
+) -> None:
+    """
+    Print the issues found by `validate_many` as a table, one row per field in error.
+
+    Args:
+        label: Names the report of an issue in the first column, e.g. by its input file. By default reports are named
+            by their doc_type and id, or by their position in the batch if they have no id.
+        label_header: Header of the first column.
     """
-    text = DUTIES_DESC_SPACE_FOR_ABBREV * " " + text
-    text = textwrap.fill(text, width=91)
-    return text
+    # only the CLI prints tables, so rich isn't imported with the models
+    from rich import print
+    from rich.table import Table
+
+    if label is None:
+        label = _issue_label
+    table = Table(label_header, "Field", "Error", "Message")
+    for issue in issues:
+        table.add_row(label(issue), issue.field, issue.error_type, issue.message)
+    print(table)
+
+
+def _issue_label(issue: "ValidationIssue") -> str:
+    if issue.report_id is None:
+        return f"#{issue.index + 1}"
+    return f"{issue.doc_type} {issue.report_id}"
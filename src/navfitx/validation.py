@@ -0,0 +1,122 @@
+"""
+Incremental validation of reports while they are being edited.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from functools import cache
+from typing import Annotated, Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from navfitx.models.models import Report
+
+
+class _InvalidField(Exception):
+    pass
+
+
+class _FieldReader:
+    """
+    Stands in for a report when a model validator runs, recording every field the validator reads.
+
+    Reading a field that failed its own validation stops the model validator, as pydantic does not run model
+    validators either when a field is invalid.
+    """
+
+    def __init__(self, model: type[Report], values: Mapping[str, Any], errors: Mapping[str, str]) -> None:
+        self._model = model
+        self._values = values
+        self._errors = errors
+        self.fields: set[str] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in self._values:
+            # e.g. a helper method of the model, which reads its fields through this reader too
+            return getattr(self._model, name).__get__(self)
+        self.fields.add(name)
+        if name in self._errors:
+            raise _InvalidField(name)
+        return self._values[name]
+
+
+class _CompiledModel:
+    def __init__(self, model: type[Report]) -> None:
+        self.field_adapters: dict[str, TypeAdapter] = {}
+        self.field_validators: dict[str, list[Callable[[Any], Any]]] = {}
+        for name, field in model.model_fields.items():
+            annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+            self.field_adapters[name] = TypeAdapter(annotation)
+            self.field_validators[name] = []
+
+        decorators = model.__pydantic_decorators__
+        for decorator in decorators.field_validators.values():
+            for name in decorator.info.fields:
+                self.field_validators[name].append(decorator.func)
+        self.model_validators: dict[str, Callable[[Any], Any]] = {
+            name: decorator.func
+            for name, decorator in decorators.model_validators.items()
+            if decorator.info.mode == "after"
+        }
+
+
+@cache
+def _compile(model: type[Report]) -> _CompiledModel:
+    return _CompiledModel(model)
+
+
+class ReportValidator:
+    """
+    Validates a report one field at a time as it is edited.
+
+    `set_field` runs only the type constraints and field validators of the edited field, then re-runs the model
+    validators that read that field the last time they ran. Which fields a model validator reads is recorded each
+    time it runs, so no list of dependencies has to be kept in sync with the validators.
+
+    This does not replace `model_validate`, which should still be the final check before a report is printed.
+    """
+
+    def __init__(self, model: type[Report], values: Mapping[str, Any]) -> None:
+        self.model = model
+        self._compiled = _compile(model)
+        self.values: dict[str, Any] = {}
+        self.field_errors: dict[str, str] = {}
+        self.model_errors: dict[str, str] = {}
+        # model validator name -> fields it read the last time it ran
+        self._reads: dict[str, set[str]] = {}
+        for name, value in values.items():
+            if name in self._compiled.field_adapters:
+                self._validate_field(name, value)
+        self._run_model_validators(self._compiled.model_validators)
+
+    def set_field(self, name: str, value: Any) -> None:
+        """Validate a new value of a field and re-run the model validators that depend on it."""
+        self._validate_field(name, value)
+        self._run_model_validators(validator for validator, reads in self._reads.items() if name in reads)
+
+    def model_validator_fields(self, validator: str) -> set[str]:
+        """The fields a model validator read the last time it ran."""
+        return self._reads.get(validator, set())
+
+    def _validate_field(self, name: str, value: Any) -> None:
+        self.field_errors.pop(name, None)
+        try:
+            value = self._compiled.field_adapters[name].validate_python(value)
+            for validator in self._compiled.field_validators[name]:
+                value = validator(value)
+        except ValidationError as err:
+            self.field_errors[name] = err.errors()[0]["msg"]
+        except ValueError as err:
+            self.field_errors[name] = str(err)
+        self.values[name] = value
+
+    def _run_model_validators(self, names: Iterable[str]) -> None:
+        for name in list(names):
+            self.model_errors.pop(name, None)
+            reader = _FieldReader(self.model, self.values, self.field_errors)
+            try:
+                self._compiled.model_validators[name](reader)
+            except _InvalidField:
+                pass
+            except ValueError as err:
+                self.model_errors[name] = str(err)
+            self._reads[name] = reader.fields
@@ -1,8 +1,18 @@
+import os
+import sqlite3
 from datetime import date
+from typing import cast
 
 import pytest
+from PySide6.QtWidgets import QApplication
+from sqlalchemy import Engine, event
 
-from navfitx.examples import build_validated_example_fitrep
+from navfitx.db import add_report_to_db, ensure_db_schema
+from navfitx.examples import (
+    build_validated_example_chiefeval,
+    build_validated_example_eval,
+    build_validated_example_fitrep,
+)
 from navfitx.models import (
     BilletSubcategory,
     ChiefEval,
@@ -13,6 +23,74 @@ from navfitx.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def user_config_dir(tmp_path_factory, monkeypatch):
+    """Keeps the GUI state file of the tests out of the user's own config directory."""
+    config_dir = tmp_path_factory.mktemp("config")
+    monkeypatch.setattr("navfitx.gui.home.user_config_dir", lambda *args, **kwargs: str(config_dir))
+    return config_dir
+
+
+# the GUI tests run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return cast(QApplication, app)
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    """An empty NAVFITX database."""
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    return db_path
+
+
+@pytest.fixture()
+def example_db_path(db_path):
+    """A NAVFITX database with the example report of each type: fitrep 1, eval 1 and chiefeval 1."""
+    for report in (
+        build_validated_example_fitrep(),
+        build_validated_example_eval(),
+        build_validated_example_chiefeval(),
+    ):
+        add_report_to_db(db_path, report)
+    return db_path
+
+
+@pytest.fixture()
+def statements():
+    """Records the SQL statements executed by every engine."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.split(None, 1)[0].upper())
+
+    event.listen(Engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(Engine, "before_cursor_execute", record)
+
+
+@pytest.fixture()
+def pre_folder_db(tmp_path):
+    """A database with a fitrep and an eval, written before reports could be filed in folders."""
+    db_path = tmp_path / "pre_folder.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, build_validated_example_fitrep())
+    add_report_to_db(db_path, Eval(name="DOE, JANE A"))
+    with sqlite3.connect(db_path) as conn:
+        for table in ("fitrep", "eval", "chiefeval"):
+            conn.execute(f"DROP INDEX ix_{table}_folder_id")
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN folder_id")
+        conn.execute("DROP TABLE folder")
+    return db_path
+
+
 @pytest.fixture()
 def fitrep() -> Fitrep:
     return build_validated_example_fitrep()
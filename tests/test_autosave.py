@@ -0,0 +1,115 @@
+import sqlite3
+from datetime import date
+
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+import navfitx.gui.autosave
+from navfitx.db import add_report_to_db, ensure_db_schema, get_drafts, get_report, report_from_draft
+from navfitx.gui.home import Home
+from navfitx.models import Fitrep
+
+
+def open_home(db_path) -> Home:
+    home = Home()
+    home.db = db_path
+    home.read_only = False
+    # runs the check for drafts to recover that is scheduled at startup
+    QApplication.processEvents()
+    home.wait_for_db()
+    return home
+
+
+def test_edits_are_coalesced_into_one_draft_write(qapp: QApplication, tmp_path, statements) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    home = open_home(db_path)
+    home.open_fitrep_dialog(Fitrep())
+    form = home.fitrep_form
+    # e.g. the RSCA lookup of the opened report
+    home.wait_for_db()
+
+    statements.clear()
+    for i in range(20):
+        form.name.setText("JONES, JOHN P"[: i % 13 + 1])
+    form.station.setText("USS NEVERSAIL")
+    home.wait_for_db()
+
+    # keystrokes only start the autosave timer
+    assert statements == []
+    assert home.autosaver.timer.isActive()
+
+    home.autosaver.flush()
+    home.autosaver.flush()
+    home.wait_for_db()
+
+    assert statements == ["INSERT"]
+    drafts = get_drafts(db_path)
+    assert len(drafts) == 1
+    assert report_from_draft(drafts[0]).station == "USS NEVERSAIL"
+
+    form.submit()
+    home.wait_for_db()
+
+    assert get_drafts(db_path) == []
+
+
+def test_unsaved_draft_is_recovered_on_next_launch(qapp: QApplication, tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P", period_end=date(2025, 2, 28)))
+    home = open_home(db_path)
+    report = get_report(db_path, ("fitrep", 1))
+    assert report is not None
+    home.open_fitrep_dialog(report)
+    home.fitrep_form.station.setText("USS NEVERSAIL")
+    # the window is closed without saving, as if NAVFITX had crashed
+    home.close()
+
+    monkeypatch.setattr(QMessageBox, "question", lambda *args: QMessageBox.StandardButton.Yes)
+    home = open_home(db_path)
+
+    form = home.stack.currentWidget()
+    assert form is home.fitrep_form
+    assert form.name.text() == "JONES, JOHN P"
+    assert form.station.text() == "USS NEVERSAIL"
+
+    form.submit()
+    home.wait_for_db()
+
+    assert get_drafts(db_path) == []
+    saved = get_report(db_path, ("fitrep", 1))
+    assert saved is not None
+    assert saved.station == "USS NEVERSAIL"
+
+
+def test_a_draft_that_could_not_be_written_is_written_again(qapp: QApplication, tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    home = open_home(db_path)
+    home.open_fitrep_dialog(Fitrep())
+    home.wait_for_db()
+
+    def locked(*args) -> None:
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(navfitx.gui.autosave, "save_draft", locked)
+    home.fitrep_form.station.setText("USS NEVERSAIL")
+    home.autosaver.flush()
+    home.wait_for_db()
+
+    assert home.statusBar().currentMessage() == "Unable to autosave the report: database is locked"
+    assert home.autosaver.dirty
+    assert home.autosaver.timer.isActive()
+
+    monkeypatch.undo()
+    home.autosaver.flush()
+    home.wait_for_db()
+
+    [draft] = get_drafts(db_path)
+    assert report_from_draft(draft).station == "USS NEVERSAIL"
+
+    monkeypatch.setattr(navfitx.gui.autosave, "delete_draft", locked)
+    home.cancel_form()
+    home.wait_for_db()
+
+    assert home.statusBar().currentMessage() == "Unable to delete the autosaved draft: database is locked"
@@ -0,0 +1,147 @@
+from typer.testing import CliRunner
+
+import navfitx.db
+import navfitx.models.batch
+from navfitx.cli import app
+from navfitx.db import add_report_to_db, ensure_db_schema, validate_db
+from navfitx.examples import (
+    build_validated_example_chiefeval,
+    build_validated_example_eval,
+    build_validated_example_fitrep,
+)
+from navfitx.models import ChiefEval, Eval, Fitrep, ValidationIssue, validate_many
+
+runner = CliRunner()
+
+
+def test_validate_many_validates_each_report_of_a_mixed_batch_once(monkeypatch) -> None:
+    fitrep = build_validated_example_fitrep().model_dump()
+    chiefeval = build_validated_example_chiefeval()
+    calls: list[str] = []
+
+    def counting(model):
+        model_validate = model.model_validate
+
+        def validate(value):
+            calls.append(model.__name__)
+            return model_validate(value)
+
+        return validate
+
+    for model in (Fitrep, Eval, ChiefEval):
+        monkeypatch.setattr(model, "model_validate", counting(model))
+
+    reports, issues = validate_many([fitrep, build_validated_example_eval(), fitrep | {"name": "X" * 40}, chiefeval])
+
+    # a report in error doesn't make the others be validated again
+    assert calls == ["Fitrep", "Eval", "Fitrep", "ChiefEval"]
+    assert [issue.index for issue in issues] == [2]
+    assert [type(report) for report in reports] == [Fitrep, Eval, type(None), ChiefEval]
+    assert reports[0].name == fitrep["name"]
+
+
+def test_validate_many_reports_issues_by_report_and_field() -> None:
+    fitrep = build_validated_example_fitrep().model_dump() | {"id": 7, "name": "X" * 40}
+    eval = build_validated_example_eval()
+
+    reports, issues = validate_many([fitrep, {"doc_type": "summary"}, eval])
+
+    assert reports[0] is None
+    assert reports[1] is None
+    assert isinstance(reports[2], Eval)
+    assert issues == [
+        ValidationIssue(0, "fitrep", 7, "name", "string_too_long", "String should have at most 27 characters"),
+        ValidationIssue(
+            1, "summary", None, "doc_type", "invalid_doc_type", "doc_type should be one of fitrep, eval, chiefeval"
+        ),
+    ]
+
+
+def test_db_validate_reports_invalid_reports(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, build_validated_example_fitrep())
+    add_report_to_db(db_path, build_validated_example_eval())
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P"))
+
+    count, issues = validate_db(db_path, batch_size=1)
+
+    assert count == 3
+    assert {(issue.doc_type, issue.report_id) for issue in issues} == {("fitrep", 2)}
+
+    result = runner.invoke(app, ["db", "validate", "--db", str(db_path)], terminal_width=200)
+
+    assert result.exit_code == 1
+    assert "1 of 3 report(s) failed validation." in result.stdout
+
+
+def test_db_validate_reads_a_database_created_before_folders(pre_folder_db) -> None:
+    mtime = pre_folder_db.stat().st_mtime_ns
+
+    result = runner.invoke(app, ["db", "validate", "--db", str(pre_folder_db)], terminal_width=200)
+
+    assert result.exit_code == 1, result.output
+    # the eval is incomplete, the fitrep is valid
+    assert "1 of 2 report(s) failed validation." in result.stdout
+    assert pre_folder_db.stat().st_mtime_ns == mtime
+
+
+def test_toml_pdf_prints_each_valid_file_of_a_batch(tmp_path) -> None:
+    valid = tmp_path / "eval.toml"
+    valid.write_text(build_validated_example_eval().model_dump_toml(), encoding="utf-8")
+    invalid = tmp_path / "fitrep.toml"
+    invalid.write_text(build_validated_example_fitrep().model_copy(update={"name": "X" * 40}).model_dump_toml())
+    output = tmp_path / "pdfs"
+
+    result = runner.invoke(
+        app,
+        ["toml", "pdf", "--input", str(valid), "--input", str(invalid), "--output", str(output)],
+        terminal_width=200,
+    )
+
+    assert result.exit_code == 1
+    assert "string_too_long" in result.stdout
+    assert "1 of 2 report(s) failed validation." in result.stdout
+    assert [path.name for path in output.iterdir()] == ["eval.pdf"]
+
+
+def test_toml_pdf_rejects_outputs_that_several_files_would_overwrite(tmp_path) -> None:
+    inputs = []
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        inputs.append(tmp_path / folder / "report.toml")
+        inputs[-1].write_text(build_validated_example_eval().model_dump_toml(), encoding="utf-8")
+    single = ["toml", "pdf", "--input", str(inputs[0])]
+    several = [*single, "--input", str(inputs[1])]
+
+    for args in (
+        [*several, "--output", str(tmp_path / "out")],
+        [*several, "--output", str(tmp_path / "out.pdf")],
+        [*single, "--output", str(tmp_path / "a")],
+    ):
+        result = runner.invoke(app, args, terminal_width=200)
+        assert result.exit_code == 2, result.output
+
+    assert "would both be written to" in runner.invoke(app, several, terminal_width=200).output
+    assert not (tmp_path / "out").exists()
+    assert not (tmp_path / "out.pdf").exists()
+    assert [path.name for path in (tmp_path / "a").iterdir()] == ["report.toml"]
+
+
+def test_db_validate_does_not_open_a_live_database_as_immutable(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, build_validated_example_fitrep())
+    uris: list[str] = []
+    connect = navfitx.db.sqlite3.connect
+
+    def recording(database, *args, **kwargs):
+        uris.append(database)
+        return connect(database, *args, **kwargs)
+
+    monkeypatch.setattr(navfitx.db.sqlite3, "connect", recording)
+
+    validate_db(db_path)
+    validate_db(db_path, archive=True)
+
+    assert [uri.partition("?")[2] for uri in uris] == ["mode=ro", "mode=ro&immutable=1"]
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from navfitx.examples import build_validated_example_fitrep
+
+# Generous enough for a slow CI runner; `import navfitx.cli` used to take ~900 ms when it imported the GUI.
+CLI_IMPORT_BUDGET_MS = 400
+
+
+def import_times(args: list[str], cwd: Path) -> dict[str, int]:
+    """
+    Run the CLI with `args` under `python -X importtime` and return the cumulative import time in microseconds of
+    every module it imported.
+    """
+    code = f"from navfitx.cli import app; app({args!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=cwd, capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def imported_packages(times: dict[str, int]) -> set[str]:
+    return {name.split(".")[0] for name in times}
+
+
+@pytest.mark.parametrize(
+    ("args", "not_imported"),
+    [
+        (["--version"], {"PySide6", "pymupdf", "tomlkit", "sqlmodel"}),
+        (["--help"], {"pymupdf", "tomlkit"}),
+        (["import", "--input", "fitrep.toml", "--db", "navfitx.db"], {"PySide6", "pymupdf", "tomlkit"}),
+        (["toml", "pdf", "--input", "fitrep.toml"], {"PySide6", "tomlkit"}),
+    ],
+)
+def test_headless_commands_import_only_what_they_need(tmp_path, args, not_imported) -> None:
+    (tmp_path / "fitrep.toml").write_text(build_validated_example_fitrep().model_dump_toml(), encoding="utf-8")
+
+    times = import_times(args, tmp_path)
+
+    assert imported_packages(times) & not_imported == set()
+
+
+def test_cli_import_time_budget(tmp_path) -> None:
+    times = import_times(["--version"], tmp_path)
+
+    assert times["navfitx.cli"] / 1000 < CLI_IMPORT_BUDGET_MS
@@ -0,0 +1,217 @@
+import sqlite3
+from datetime import date
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+
+import navfitx.db
+from navfitx.db import (
+    ARCHIVE_MMAP_SIZE,
+    add_report_to_db,
+    delete_reports,
+    ensure_db_schema,
+    get_all_reports,
+    get_engine,
+    get_report,
+    get_report_row,
+    get_report_rows,
+    iter_report_values,
+    move_reports_to_folder,
+    set_reporting_senior,
+)
+from navfitx.examples import build_validated_example_chiefeval, build_validated_example_eval
+from navfitx.models import ChiefEval, Eval, Fitrep, ReportRow
+from navfitx.printing import render_report
+
+
+@pytest.fixture()
+def populated_db(tmp_path):
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    for i in range(5):
+        add_report_to_db(db_path, Fitrep(name=f"FITREP {i}", senior_name="HOPPER, G", period_end=date(2025, 2, 28)))
+        add_report_to_db(db_path, Eval(name=f"EVAL {i}", senior_name="HOPPER, G", period_end=date(2025, 1, 31)))
+    chiefeval = build_validated_example_chiefeval()
+    chiefeval.id = None
+    add_report_to_db(db_path, chiefeval)
+    return db_path
+
+
+@pytest.fixture()
+def statements(monkeypatch):
+    """Record every SQL statement executed through engines created by navfitx.db.get_engine."""
+    executed: list[str] = []
+    original_get_engine = navfitx.db.get_engine
+
+    def counting_get_engine(db_path, **kwargs):
+        engine = original_get_engine(db_path, **kwargs)
+        event.listen(engine, "before_cursor_execute", lambda conn, cursor, stmt, *args: executed.append(stmt))
+        return engine
+
+    monkeypatch.setattr(navfitx.db, "get_engine", counting_get_engine)
+    return executed
+
+
+def _count(db_path, model) -> int:
+    with Session(get_engine(db_path)) as session:
+        return len(session.exec(select(model)).all())
+
+
+def test_delete_reports_by_keys_issues_one_statement_per_table(populated_db, statements) -> None:
+    keys = [("fitrep", 1), ("fitrep", 2), ("fitrep", 3), ("eval", 1), ("eval", 4)]
+
+    deleted = delete_reports(populated_db, keys)
+
+    assert deleted == 5
+    assert [stmt.split()[0] for stmt in statements] == ["DELETE", "DELETE"]
+    assert _count(populated_db, Fitrep) == 2
+    assert _count(populated_db, Eval) == 3
+    assert _count(populated_db, ChiefEval) == 1
+
+
+def test_delete_reports_by_filter(populated_db) -> None:
+    deleted = delete_reports(populated_db, where={"period_end": date(2025, 1, 31)})
+
+    assert deleted == 5
+    assert _count(populated_db, Eval) == 0
+    assert _count(populated_db, Fitrep) == 5
+
+
+def test_delete_reports_requires_a_selection(populated_db) -> None:
+    with pytest.raises(ValueError, match="selection"):
+        delete_reports(populated_db)
+    # an empty selection doesn't select every report
+    for keys, where in (([], None), (None, {}), ([], {}), (iter([]), None)):
+        with pytest.raises(ValueError, match="selection"):
+            delete_reports(populated_db, keys, where=where)
+    with pytest.raises(ValueError, match="selection"):
+        move_reports_to_folder(populated_db, None, where={})
+    assert _count(populated_db, Fitrep) + _count(populated_db, Eval) == 10
+
+
+def test_delete_reports_rejects_unknown_report_type(populated_db) -> None:
+    with pytest.raises(ValueError, match="Unknown report type"):
+        delete_reports(populated_db, [("summary", 1)])
+
+
+def test_move_reports_to_folder(populated_db) -> None:
+    moved = move_reports_to_folder(populated_db, 7, [("fitrep", 1), ("chiefeval", 1)])
+
+    assert moved == 2
+    with Session(get_engine(populated_db)) as session:
+        assert [r.id for r in session.exec(select(Fitrep).where(Fitrep.folder_id == 7))] == [1]
+        assert [r.id for r in session.exec(select(ChiefEval).where(ChiefEval.folder_id == 7))] == [1]
+
+
+def test_set_reporting_senior_by_keys_and_filter(populated_db, statements) -> None:
+    updated = set_reporting_senior(
+        populated_db,
+        {"senior_name": "NIMITZ, C", "senior_uic": "54321"},
+        [("fitrep", 1), ("fitrep", 2), ("eval", 1)],
+        where={"senior_name": "HOPPER, G"},
+    )
+
+    assert updated == 3
+    assert [stmt.split()[0] for stmt in statements] == ["UPDATE", "UPDATE"]
+    with Session(get_engine(populated_db)) as session:
+        fitreps = session.exec(select(Fitrep).where(Fitrep.senior_name == "NIMITZ, C")).all()
+        assert sorted(r.id for r in fitreps) == [1, 2]
+        assert all(r.senior_uic == "54321" for r in fitreps)
+        assert session.exec(select(Eval).where(Eval.id == 1)).one().senior_name == "NIMITZ, C"
+
+
+def test_set_reporting_senior_rejects_other_fields(populated_db) -> None:
+    with pytest.raises(ValueError, match="name"):
+        set_reporting_senior(populated_db, {"name": "DOE, J"}, [("fitrep", 1)])
+
+
+def test_report_rows_are_compact_named_tuples(populated_db) -> None:
+    rows = get_report_rows(populated_db, where={"folder_id": None})
+
+    assert len(rows) == 11
+    row = next(row for row in rows if row.name == "FITREP 3")
+    assert type(row) is ReportRow
+    assert not hasattr(row, "__dict__")
+    assert row == ("", "FITREP 3", "", "fitrep", date(2025, 2, 28), 4)
+    assert row.key == ("fitrep", 4)
+    assert get_report_row(get_report(populated_db, row.key)) == row
+
+
+def test_iter_report_values_reads_trusted_rows_in_batches(populated_db) -> None:
+    batches = list(iter_report_values(populated_db, doc_types=["fitrep", "chiefeval"], batch_size=2, read_only=True))
+
+    assert [(doc_type, len(rows)) for doc_type, rows in batches] == [
+        ("fitrep", 2),
+        ("fitrep", 2),
+        ("fitrep", 1),
+        ("chiefeval", 1),
+    ]
+    [(_, [row])] = batches[-1:]
+    chiefeval = get_report(populated_db, ("chiefeval", row["id"]))
+    assert chiefeval is not None
+    assert ChiefEval.model_construct(**row).model_dump() == chiefeval.model_dump()
+
+
+def test_ensure_db_schema_adds_new_columns_to_existing_database(tmp_path) -> None:
+    db_path = tmp_path / "old.db"
+    ensure_db_schema(db_path)
+    # simulate a database created before reports could be filed in folders
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP INDEX ix_eval_folder_id")
+        conn.execute("ALTER TABLE eval DROP COLUMN folder_id")
+
+    ensure_db_schema(db_path)
+
+    report = build_validated_example_eval()
+    report.id = None
+    add_report_to_db(db_path, report)
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(eval)")}
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(eval)")}
+    assert "folder_id" in columns
+    assert "ix_eval_folder_id" in indexes
+
+
+def test_read_only_engine_reads_archive_with_mmap(populated_db) -> None:
+    reports = get_all_reports(populated_db, read_only=True)
+
+    assert len(reports) == 11
+    assert get_report(populated_db, ("fitrep", 1), read_only=True).name == "FITREP 0"
+    with get_engine(populated_db, read_only=True).connect() as conn:
+        assert conn.execute(text("PRAGMA mmap_size")).scalar() == ARCHIVE_MMAP_SIZE
+
+
+def test_read_only_reads_of_an_unmigrated_database_read_missing_columns_as_none(pre_folder_db) -> None:
+    report = get_report(pre_folder_db, ("fitrep", 1), read_only=True)
+    assert report is not None
+    assert (report.name, report.folder_id) == ("JONES, JOHN P", None)
+    assert get_report(pre_folder_db, ("fitrep", 2), read_only=True) is None
+
+    reports = get_all_reports(pre_folder_db, read_only=True)
+    assert [(report.doc_type, report.folder_id) for report in reports] == [("fitrep", None), ("eval", None)]
+
+    rows = [row for _, partition in iter_report_values(pre_folder_db, read_only=True) for row in partition]
+    assert [(row["name"], row["folder_id"]) for row in rows] == [("JONES, JOHN P", None), ("DOE, JANE A", None)]
+    assert render_report(pre_folder_db, ("fitrep", 1), read_only=True).pdf.startswith(b"%PDF")
+    # and the archive is left as it was
+    with sqlite3.connect(pre_folder_db) as conn:
+        assert "folder_id" not in {row[1] for row in conn.execute("PRAGMA table_info(fitrep)")}
+
+
+def test_read_only_engine_rejects_writes(populated_db) -> None:
+    engine = get_engine(populated_db, read_only=True)
+
+    with pytest.raises(OperationalError):
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM fitrep"))
+    assert _count(populated_db, Fitrep) == 5
+
+
+def test_read_only_engine_does_not_create_missing_database(tmp_path) -> None:
+    db_path = tmp_path / "missing.db"
+
+    with pytest.raises(OperationalError):
+        get_all_reports(db_path, read_only=True)
+    assert not db_path.exists()
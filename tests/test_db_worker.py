@@ -0,0 +1,196 @@
+import threading
+from datetime import date
+
+from PySide6.QtWidgets import QApplication, QDialogButtonBox
+from sqlalchemy.exc import OperationalError
+
+import navfitx.gui.folders
+from navfitx.db import add_report_to_db, ensure_db_schema, get_report, get_report_rows
+from navfitx.gui.home import Home
+from navfitx.gui.worker import DatabaseWorker
+from navfitx.models import Eval, Fitrep
+
+
+def test_worker_runs_jobs_in_order_off_the_main_thread(qapp: QApplication) -> None:
+    worker = DatabaseWorker()
+    threads: list[int] = []
+    results: list[int] = []
+
+    for i in range(5):
+        worker.submit(lambda i=i: threads.append(threading.get_ident()) or i, on_result=results.append)
+    worker.wait()
+
+    assert results == [0, 1, 2, 3, 4]
+    assert threading.get_ident() not in threads
+    assert len(set(threads)) == 1
+
+
+def test_worker_cancels_stale_jobs_of_the_same_kind(qapp: QApplication) -> None:
+    worker = DatabaseWorker()
+    release = threading.Event()
+    results: list[str] = []
+
+    worker.submit(release.wait)
+    worker.submit(lambda: "stale", kind="sort", on_result=results.append)
+    worker.submit(lambda: "current", kind="sort", on_result=results.append)
+    release.set()
+    worker.wait()
+
+    assert results == ["current"]
+    assert not worker.busy
+
+
+def test_worker_delivers_errors_on_the_main_thread(qapp: QApplication) -> None:
+    worker = DatabaseWorker()
+    errors: list[tuple[Exception, int]] = []
+
+    def fail():
+        raise ValueError("bad database")
+
+    worker.submit(fail, on_error=lambda exc: errors.append((exc, threading.get_ident())))
+    worker.wait()
+
+    assert len(errors) == 1
+    assert str(errors[0][0]) == "bad database"
+    assert errors[0][1] == threading.get_ident()
+
+
+def test_worker_emits_errors_of_jobs_without_an_error_callback(qapp: QApplication, caplog) -> None:
+    worker = DatabaseWorker()
+    errors: list[Exception] = []
+    worker.failed.connect(errors.append)
+
+    def fail():
+        raise ValueError("bad database")
+
+    worker.submit(fail)
+    worker.wait()
+
+    assert [str(exc) for exc in errors] == ["bad database"]
+    assert "failed" in caplog.text
+
+
+def test_home_reports_errors_of_jobs_without_an_error_callback(qapp: QApplication, tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+
+    def fail(*args, **kwargs):
+        raise OperationalError("SELECT", {}, Exception("disk I/O error"))
+
+    home = Home(archive=db_path)
+    home.wait_for_db()
+
+    # the folders of the folder tree are read without an error callback of their own
+    monkeypatch.setattr(navfitx.gui.folders, "get_child_folders", fail)
+    home.folder_tree.set_database(db_path, read_only=True)
+    home.wait_for_db()
+
+    assert "Unable to read database" in home.statusBar().currentMessage()
+    assert "disk I/O error" in home.statusBar().currentMessage()
+
+
+def test_worker_reports_busy_state(qapp: QApplication) -> None:
+    worker = DatabaseWorker()
+    states: list[bool] = []
+    worker.busy_changed.connect(states.append)
+
+    worker.submit(lambda: None)
+    worker.submit(lambda: None)
+    worker.wait()
+
+    assert states == [True, False]
+
+
+def test_home_loads_report_list_in_background(qapp: QApplication, tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P"))
+    add_report_to_db(db_path, Eval(name="DOE, JANE A"))
+
+    home = Home()
+    home.db = db_path
+    home.refresh_reports_table()
+    assert home.db_worker.busy
+
+    home.wait_for_db()
+
+    assert home.reports_table.rowCount() == 2
+    assert not home.db_worker.busy
+
+
+def test_home_opens_archive_read_only(qapp: QApplication, tmp_path) -> None:
+    db_path = tmp_path / "archive.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P"))
+    mtime = db_path.stat().st_mtime_ns
+
+    home = Home(archive=db_path)
+    home.wait_for_db()
+
+    assert home.read_only
+    assert home.reports_table.rowCount() == 1
+    assert not home.new_submenu.isEnabled()
+    assert "read-only" in home.reports_table_label.text()
+
+    home.delete_selected_reports([("fitrep", 1)])
+    home.edit_report_from_table(0, 0)
+    home.wait_for_db()
+
+    save_btn = home.fitrep_form.button_box.button(QDialogButtonBox.StandardButton.Ok)
+    assert not save_btn.isEnabled()
+    assert home.reports_table.rowCount() == 1
+    assert db_path.stat().st_mtime_ns == mtime
+
+
+def test_home_opens_reports_of_an_archive_written_before_folders(qapp: QApplication, pre_folder_db) -> None:
+    home = Home(archive=pre_folder_db)
+    home.wait_for_db()
+    rows = [home.report_list_model.report_row(i)[3] for i in range(home.reports_table.rowCount())]
+
+    home.edit_report_from_table(rows.index("fitrep"), 0)
+    home.wait_for_db()
+
+    assert home.statusBar().currentMessage() == ""
+    assert home.fitrep_form.report.name == "JONES, JOHN P"
+
+
+def test_home_updates_report_list_rows_without_reloading(qapp: QApplication, tmp_path, statements) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P", period_end=date(2025, 2, 28)))
+    add_report_to_db(db_path, Eval(name="DOE, JANE A", period_end=date(2024, 1, 31)))
+    home = Home()
+    home.db = db_path
+    home.refresh_reports_table()
+    home.wait_for_db()
+    model = home.report_list_model
+
+    statements.clear()
+    home.submit_form(Fitrep(name="SMITH, ANN", period_end=date(2024, 6, 30)))
+    home.wait_for_db()
+
+    assert statements == ["INSERT"]
+    assert [model.report_key(row) for row in range(model.rowCount())] == [("fitrep", 1), ("fitrep", 2), ("eval", 1)]
+
+    report = get_report(db_path, ("fitrep", 2))
+    assert report is not None
+    report.name = "SMITH, ANNE"
+    report.period_end = date(2023, 6, 30)
+    statements.clear()
+    home.submit_form(report)
+    home.wait_for_db()
+
+    assert statements == ["UPDATE"]
+    assert [model.index(row, 1).data() for row in range(model.rowCount())] == [
+        "JONES, JOHN P",
+        "DOE, JANE A",
+        "SMITH, ANNE",
+    ]
+
+    statements.clear()
+    home.delete_selected_reports([("fitrep", 1)])
+    home.wait_for_db()
+
+    assert statements == ["DELETE"]
+    assert [model.report_key(row) for row in range(model.rowCount())] == [("eval", 1), ("fitrep", 2)]
+    assert sorted(get_report_rows(db_path)) == sorted(model.report_row(row) for row in range(model.rowCount()))
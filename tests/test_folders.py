@@ -0,0 +1,122 @@
+import sqlite3
+from datetime import date
+
+from PySide6.QtWidgets import QApplication
+from sqlalchemy import Engine, event
+
+from navfitx.db import (
+    add_report_to_db,
+    create_folder,
+    delete_folder,
+    get_child_folders,
+    get_report_rows,
+    move_reports_to_folder,
+)
+from navfitx.gui.home import Home
+from navfitx.models import Eval, Fitrep
+
+
+def test_folders_are_read_one_level_at_a_time(db_path) -> None:
+    ops = create_folder(db_path, "Ops")
+    deck = create_folder(db_path, "Deck", ops[0])
+    create_folder(db_path, "Bosuns", deck[0])
+    admin = create_folder(db_path, "admin")
+
+    assert get_child_folders(db_path, None) == [(admin[0], "admin", False), (ops[0], "Ops", True)]
+    assert get_child_folders(db_path, ops[0]) == [(deck[0], "Deck", True)]
+    assert get_child_folders(db_path, admin[0]) == []
+
+
+def test_deleting_a_folder_keeps_its_reports(db_path) -> None:
+    ops = create_folder(db_path, "Ops")
+    deck = create_folder(db_path, "Deck", ops[0])
+    bosuns = create_folder(db_path, "Bosuns", deck[0])
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P", folder_id=bosuns[0]))
+    add_report_to_db(db_path, Eval(name="DOE, JANE A", folder_id=deck[0]))
+
+    assert delete_folder(db_path, deck[0]) == 2
+
+    assert get_child_folders(db_path, ops[0]) == []
+    assert sorted(row[1] for row in get_report_rows(db_path, where={"folder_id": ops[0]})) == [
+        "DOE, JANE A",
+        "JONES, JOHN P",
+    ]
+
+
+def test_reports_of_a_folder_are_found_with_one_indexed_query(db_path) -> None:
+    ops = create_folder(db_path, "Ops")
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P", folder_id=ops[0]))
+    add_report_to_db(db_path, Eval(name="DOE, JANE A"))
+
+    assert [row[1] for row in get_report_rows(db_path, where={"folder_id": ops[0]})] == ["JONES, JOHN P"]
+    assert [row[1] for row in get_report_rows(db_path, where={"folder_id": None})] == ["DOE, JANE A"]
+
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        get_report_rows(db_path, where={"folder_id": ops[0]})
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+    assert len(executed) == 1
+    statement, parameters = executed[0]
+    with sqlite3.connect(db_path) as conn:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    details = [row[-1] for row in plan if "SCAN" in row[-1] or "SEARCH" in row[-1]]
+    assert len(details) == 3
+    assert all("USING INDEX ix_" in detail and "_folder_id" in detail for detail in details)
+
+
+def test_home_filters_the_report_list_by_folder(qapp: QApplication, db_path) -> None:
+    ops = create_folder(db_path, "Ops")
+    deck = create_folder(db_path, "Deck", ops[0])
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P", period_end=date(2025, 2, 28), folder_id=deck[0]))
+    add_report_to_db(db_path, Eval(name="DOE, JANE A", period_end=date(2024, 1, 31)))
+    home = Home()
+    home.db = db_path
+    home.read_only = False
+    home.reload_folders()
+    home.refresh_reports_table()
+    home.wait_for_db()
+    tree = home.folder_tree
+    model = home.report_list_model
+
+    # only the top level is read until a folder is expanded
+    assert [tree.topLevelItem(i).text(0) for i in range(tree.topLevelItemCount())] == ["All Reports", "Ops"]
+    ops_item = tree.topLevelItem(1)
+    assert ops_item.childCount() == 0
+    ops_item.setExpanded(True)
+    home.wait_for_db()
+    deck_item = ops_item.child(0)
+    assert deck_item.text(0) == "Deck"
+
+    tree.setCurrentItem(deck_item)
+    home.wait_for_db()
+    assert [model.index(row, 1).data() for row in range(model.rowCount())] == ["JONES, JOHN P"]
+
+    # new reports are created in the folder being shown
+    home.submit_form(Eval(name="SMITH, ANN", period_end=date(2024, 6, 30)))
+    home.wait_for_db()
+    assert [row[1] for row in get_report_rows(db_path, where={"folder_id": deck[0]})] == [
+        "JONES, JOHN P",
+        "SMITH, ANN",
+    ]
+
+    # reports moved to another folder leave the Report List
+    home.db_worker.submit(
+        move_reports_to_folder,
+        db_path,
+        ops[0],
+        [("fitrep", 1)],
+        on_result=lambda count: home.on_reports_moved([("fitrep", 1)], ops[0], count),
+    )
+    home.wait_for_db()
+    assert [model.index(row, 1).data() for row in range(model.rowCount())] == ["SMITH, ANN"]
+
+    tree.setCurrentItem(tree.root_item)
+    home.wait_for_db()
+    assert model.rowCount() == 3
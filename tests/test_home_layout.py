@@ -1,7 +1,3 @@
-import os
-from typing import cast
-
-import pytest
 from PySide6.QtWidgets import QApplication, QSizePolicy, QVBoxLayout, QWidget
 from sqlmodel import SQLModel, create_engine
 
@@ -9,8 +5,6 @@ from navfitx.db import add_fitrep_to_db
 from navfitx.examples import build_validated_example_fitrep
 from navfitx.gui.home import Home
 
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-
 HOME_PAGE_WINDOW_WIDTH = 1300
 HOME_PAGE_WINDOW_HEIGHT = 800
 NARROW_WINDOW_WIDTH = 500
@@ -23,14 +17,6 @@ REPORT_LIST_MANUAL_NAME_COLUMN_WIDTH = 420
 REPORT_LIST_FILL_TOLERANCE_PX = 5
 
 
-@pytest.fixture(scope="session")
-def qapp() -> QApplication:
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return cast(QApplication, app)
-
-
 def test_report_list_has_layout_stretch_on_home_page(qapp: QApplication) -> None:
     home = Home()
 
@@ -156,6 +142,7 @@ def test_report_list_fill_behavior_tracks_resize_with_populated_database(qapp: Q
 
     home.db = db_path
     home.refresh_reports_table()
+    home.wait_for_db()
 
     home.resize(LAYOUT_TEST_WIDTH, LAYOUT_TEST_HEIGHT)
     home.show()
@@ -13,6 +13,7 @@ from navfitx.importer import (
     parse_report_toml,
 )
 from navfitx.models import ChiefEval, Eval, Fitrep
+from navfitx.models.models import STORAGE_FIELDS
 
 runner = CliRunner()
 
@@ -292,7 +293,7 @@ def test_build_fitrep_template_toml_has_import_header_and_all_keys() -> None:
     assert "schema_version = 1" in template
 
     for key in Fitrep.model_fields:
-        if key in {"id", "doc_type"}:
+        if key in STORAGE_FIELDS or key == "doc_type":
             continue
         assert f"{key} = " in template
 
@@ -306,7 +307,7 @@ def test_build_chiefeval_template_toml_has_import_header_and_all_keys() -> None:
     assert "schema_version = 1" in template
 
     for key in ChiefEval.model_fields:
-        if key in {"id", "doc_type"}:
+        if key in STORAGE_FIELDS or key == "doc_type":
             continue
         assert f"{key} = " in template
 
@@ -320,6 +321,6 @@ def test_build_eval_template_toml_has_import_header_and_all_keys() -> None:
     assert "schema_version = 1" in template
 
     for key in Eval.model_fields:
-        if key in {"id", "doc_type"}:
+        if key in STORAGE_FIELDS or key == "doc_type":
             continue
         assert f"{key} = " in template
@@ -0,0 +1,98 @@
+import string
+import textwrap
+
+import pymupdf
+import pytest
+from pydantic import ValidationError
+
+from navfitx import layout
+from navfitx.examples import build_validated_example_fitrep
+from navfitx.layout import COURIER_ADVANCE, box_layout, chars_per_line, fill_lines, text_width, wrap_lines
+from navfitx.models import ChiefEval, Eval, Fitrep
+from navfitx.utils import wrap_duty_desc
+
+
+def test_wrap_lines_keeps_line_breaks_and_empty_lines() -> None:
+    assert wrap_lines("one two three\n\nfour", 8) == ("one two", "three", "", "four")
+    assert fill_lines("one two three\n\nfour", 8) == ("one two", "three", "four")
+
+
+@pytest.mark.parametrize("fontsize", [9.2, 10, 12])
+def test_text_width_matches_courier_metrics(fontsize: float) -> None:
+    text = string.printable.strip()
+
+    assert text_width(text, fontsize) == pytest.approx(pymupdf.get_text_length(text, "Cour", fontsize), abs=1e-3)
+    assert COURIER_ADVANCE * fontsize == pytest.approx(pymupdf.get_text_length("W", "Cour", fontsize), abs=1e-5)
+
+
+@pytest.mark.parametrize("model", [Fitrep, Eval, ChiefEval])
+def test_every_printed_line_fits_its_box(model) -> None:
+    for field, box in model.TEXT_BOXES.items():
+        width = box.right - box.left
+        lines = box_layout("W" * 500 + " word" * 100, box)
+
+        assert all(pymupdf.get_text_length(line, "Cour", box.fontsize) <= width + 1e-3 for line in lines), field
+        # and no more would fit
+        assert text_width("W" * (chars_per_line(box) + 1), box.fontsize) > width, field
+
+
+def test_duties_description_fit_depends_on_where_its_box_starts() -> None:
+    fitrep_box = Fitrep.TEXT_BOXES["duties_description"]
+    chief_box = ChiefEval.TEXT_BOXES["duties_description"]
+    # four words of 22 characters fill a 91 character line of the wider Chief Evaluation box
+    description = " ".join(["abcdefghijklmnopqrstuv"] * 15)
+    assert len(box_layout(description, chief_box)) == 4
+    assert len(box_layout(description, fitrep_box)) == 5
+
+    data = build_validated_example_fitrep().model_dump()
+    with pytest.raises(ValidationError, match="Duties description must be 4 lines or less"):
+        Fitrep.model_validate(data | {"duties_description": description})
+    assert ChiefEval.validate_duties_description(description) == description
+
+
+def test_boxes_are_trimmed_to_their_number_of_lines_not_words() -> None:
+    # few words over many lines are trimmed, many words on one line are not
+    assert Fitrep.validate_comments("Top.\n" + "\n" * 20).split("\n") == ["Top."] + [""] * 17
+    assert Fitrep.validate_comments(" ".join("abcdefghijklmnopqrstuvwxyz")) == " ".join("abcdefghijklmnopqrstuvwxyz")
+    assert Eval.validate_achievements("one\ntwo\nthree") == "one\ntwo"
+
+
+def test_duties_description_is_wrapped_to_its_box() -> None:
+    box = Eval.TEXT_BOXES["duties_description"]
+    # two words of 45 characters would fill a line of 91
+    description = " ".join(["x" * 45] * 3)
+
+    lines = wrap_duty_desc(description, box).split("\n")
+
+    assert chars_per_line(box) == 90
+    assert lines == list(Eval.layout_text("duties_description", description))
+    assert lines[1:] == ["x" * 45, "x" * 45]
+
+
+def test_validated_duties_description_is_stored_as_entered() -> None:
+    data = build_validated_example_fitrep().model_dump()
+
+    once = Fitrep.model_validate(data)
+    twice = Fitrep.model_validate(once.model_dump())
+
+    assert once.duties_description == data["duties_description"]
+    assert twice.duties_description == data["duties_description"]
+
+
+def test_validating_then_printing_lays_out_each_box_once(monkeypatch) -> None:
+    data = build_validated_example_fitrep().model_dump()
+    data["comments"] += "\n" * 20
+    wrapped: list[str] = []
+    wrap = textwrap.wrap
+    monkeypatch.setattr(layout, "_layouts", {})
+    monkeypatch.setattr(textwrap, "wrap", lambda text, width: wrapped.append(text) or wrap(text, width=width))
+
+    report = Fitrep.model_validate(data)
+    validated = len(wrapped)
+    doc = report.build_pdf()
+    doc.close()
+
+    # every box drawn by build_pdf was already laid out by the validators, even those whose text they trimmed
+    assert report.comments != data["comments"]
+    assert len(wrapped) == validated
+    assert Fitrep.layout_text("comments", report.comments) == Fitrep.layout_text("comments", data["comments"])[:18]
@@ -0,0 +1,258 @@
+import csv
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+import navfitx.navfit98
+from navfitx.db import add_report_to_db, ensure_db_schema, get_all_reports, get_engine
+from navfitx.examples import (
+    build_validated_example_chiefeval,
+    build_validated_example_eval,
+    build_validated_example_fitrep,
+)
+from navfitx.models import BilletSubcategory, ChiefEval, DutyStatus, Eval, Fitrep, PromotionStatus
+from navfitx.models.models import STORAGE_FIELDS
+from navfitx.models.navfit98 import N98Report, parse_access_date
+from navfitx.navfit98 import (
+    FIELD_MAPS,
+    REPORT_TYPES,
+    convert_navfit98_csv,
+    export_navfit98_csv,
+    get_doc_type,
+    match_columns,
+)
+
+COLUMNS = [
+    "ReportID",
+    "ReportType",
+    "FullName",
+    "Rate",
+    "SSN",
+    "Active",
+    "TAR",
+    "UIC",
+    "ShipStation",
+    "PromotionStatus",
+    "DateReported",
+    "Periodic",
+    "FromDate",
+    "ToDate",
+    "BilletSubcat",
+    "ReportingSenior",
+    "RSSSN",
+    "Achievements",
+    "PROF",
+    "QUAL",
+    "EO",
+    "MIL",
+    "PA",
+    "TEAM",
+    "LEAD",
+    "MIS",
+    "TAC",
+    "RecommendA",
+    "Qualifications",
+    "RetentionYes",
+    "RetentionNo",
+    "RSAddress",
+]
+
+
+def _row(report_id: int, report_type: str, **overrides) -> dict[str, object]:
+    row: dict[str, object] = {
+        "ReportID": report_id,
+        "ReportType": report_type,
+        "FullName": f"DOE, JOHN {report_id}",
+        "Rate": "LT",
+        "SSN": "123-45-6789",
+        "Active": 1,
+        "TAR": 0,
+        "UIC": "12345",
+        "ShipStation": "USS NEVERSAIL",
+        "PromotionStatus": "Regular",
+        "DateReported": "01/01/24 00:00:00",
+        "Periodic": 1,
+        "FromDate": "01/01/24 00:00:00",
+        "ToDate": "12/31/24 00:00:00",
+        "BilletSubcat": "NA",
+        "ReportingSenior": "SMITH, J",
+        "RSSSN": "987-65-4321",
+        "Achievements": "Deployed twice.",
+        "PROF": 1,
+        "QUAL": 2,
+        "EO": 3,
+        "MIL": 4,
+        "PA": 5,
+        "TEAM": 1,
+        "LEAD": 2,
+        "MIS": 3,
+        "TAC": 4,
+        "RecommendA": "XO",
+        "Qualifications": "EOOW",
+        "RetentionYes": 1,
+        "RetentionNo": 0,
+        "RSAddress": "123 MAIN ST\nNORFOLK VA",
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture()
+def export_csv(tmp_path):
+    def write(rows: list[dict[str, object]]):
+        path = tmp_path / "reports.csv"
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    return write
+
+
+def test_n98_report_reads_mdb_export_values() -> None:
+    n98 = N98Report.model_validate(
+        {"report_id": "7", "from_date": "02/28/25 00:00:00", "to_date": "2025-03-01", "prof": "", "active": "1"}
+    )
+
+    assert n98.report_id == 7
+    assert n98.from_date == date(2025, 2, 28)
+    assert n98.to_date == date(2025, 3, 1)
+    assert n98.prof is None
+    assert n98.active is True
+
+
+def test_match_columns() -> None:
+    assert match_columns(["ReportID", "RSSSN", "RecommendB", "Unknown"]) == ["report_id", "rs_ssn", "recommend_2", None]
+
+
+def test_convert_navfit98_csv(export_csv, tmp_path) -> None:
+    csv_path = export_csv([_row(1, "FitRep"), _row(2, "Eval"), _row(3, "Chief"), _row(4, "Summary")])
+    db_path = tmp_path / "navfitx.db"
+
+    result = convert_navfit98_csv(csv_path, db_path)
+
+    assert result.imported == {"fitrep": 1, "eval": 1, "chiefeval": 1}
+    assert result.skipped == [(4, "unsupported report type")]
+    with Session(get_engine(db_path)) as session:
+        fitrep = session.exec(select(Fitrep)).one()
+        eval = session.exec(select(Eval)).one()
+        chiefeval = session.exec(select(ChiefEval)).one()
+    assert fitrep.name == "DOE, JOHN 1"
+    assert fitrep.group == DutyStatus.ACT
+    assert fitrep.promotion_status == PromotionStatus.REGULAR
+    assert fitrep.billet_subcategory == BilletSubcategory.NA
+    assert fitrep.period_end == date(2024, 12, 31)
+    assert fitrep.job == "Deployed twice."
+    assert fitrep.career_rec_1 == "XO"
+    assert fitrep.senior_address == "123 MAIN ST\nNORFOLK VA"
+    assert [fitrep.trait1, fitrep.trait2, fitrep.trait7] == [1, 3, 4]
+    assert [eval.trait2, eval.trait5, eval.trait7] == [2, 5, 4]
+    assert eval.achievements == "EOOW"
+    assert eval.retain == 1
+    assert [chiefeval.trait4, chiefeval.trait6, chiefeval.trait7] == [4, 2, 1]
+
+
+def test_convert_navfit98_csv_inserts_in_batches(export_csv, tmp_path, monkeypatch) -> None:
+    csv_path = export_csv([_row(i, "FitRep") for i in range(1, 8)] + [_row(8, "Eval")])
+    db_path = tmp_path / "navfitx.db"
+    inserts: list[int] = []
+    progress: list[tuple[int, int]] = []
+    original_ensure_db_schema = navfitx.navfit98.ensure_db_schema
+
+    def counting_ensure_db_schema(path):
+        engine = original_ensure_db_schema(path)
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def count_inserts(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                inserts.append(len(parameters) if executemany else 1)
+
+        return engine
+
+    monkeypatch.setattr(navfitx.navfit98, "ensure_db_schema", counting_ensure_db_schema)
+
+    result = convert_navfit98_csv(
+        csv_path, db_path, batch_size=3, on_progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert result.imported == {"fitrep": 7, "eval": 1}
+    assert inserts == [3, 3, 1, 1]
+    assert progress[-1] == (csv_path.stat().st_size, csv_path.stat().st_size)
+
+
+def test_convert_navfit98_csv_skips_invalid_rows(export_csv, tmp_path) -> None:
+    csv_path = export_csv([_row(1, "FitRep", PROF="high"), _row(2, "FitRep")])
+
+    result = convert_navfit98_csv(csv_path, tmp_path / "navfitx.db")
+
+    assert result.imported == {"fitrep": 1}
+    assert result.skipped == [(1, "invalid PROF value 'high'")]
+
+
+@pytest.mark.parametrize(
+    "build_example",
+    [build_validated_example_fitrep, build_validated_example_eval, build_validated_example_chiefeval],
+)
+def test_export_then_import_round_trips_reports(build_example, tmp_path) -> None:
+    report = build_example()
+    report.id = None
+    doc_type = report.doc_type
+    source_db = tmp_path / "source.db"
+    ensure_db_schema(source_db)
+    add_report_to_db(source_db, report)
+    csv_path = tmp_path / "reports.csv"
+
+    exported = export_navfit98_csv(source_db, csv_path)
+    result = convert_navfit98_csv(csv_path, tmp_path / "target.db")
+
+    assert exported == {doc_type: 1}
+    assert result.imported == {doc_type: 1} and not result.skipped
+    [original] = get_all_reports(source_db)
+    [imported] = get_all_reports(tmp_path / "target.db")
+    assert imported.model_dump(exclude=set(STORAGE_FIELDS)) == original.model_dump(exclude=set(STORAGE_FIELDS))
+
+
+def test_import_then_export_round_trips_mapped_columns(export_csv, tmp_path) -> None:
+    rows = [_row(1, "FitRep"), _row(2, "Eval"), _row(3, "Chief", Active=0, TAR=1)]
+    csv_path = export_csv(rows)
+    db_path = tmp_path / "navfitx.db"
+    convert_navfit98_csv(csv_path, db_path)
+
+    export_path = tmp_path / "export.csv"
+    export_navfit98_csv(db_path, export_path)
+
+    with export_path.open(newline="", encoding="utf-8") as f:
+        exported = {row["ReportType"]: row for row in csv.DictReader(f)}
+    for row in rows:
+        doc_type = get_doc_type(str(row["ReportType"]))
+        mapped = set(FIELD_MAPS[doc_type]) | {"active", "tar", "retention_yes", "retention_no"}
+        original = {column: str(value) for column, value in row.items() if match_columns([column])[0] in mapped}
+        actual = exported[REPORT_TYPES[doc_type]]
+        if doc_type != "eval":
+            # only EVALs have a retention recommendation
+            original.pop("RetentionYes")
+            original.pop("RetentionNo")
+        for column, value in original.items():
+            if column in {"DateReported", "FromDate", "ToDate"}:
+                assert parse_access_date(actual[column]) == parse_access_date(value), column
+            elif column == "PromotionStatus":
+                assert actual[column] == value.upper()
+            else:
+                assert actual[column] == value, column
+
+
+def test_convert_navfit98_csv_reports_validation_issues_by_row(export_csv, tmp_path) -> None:
+    csv_path = export_csv([_row(1, "FitRep"), _row(2, "FitRep", FullName="X" * 40), _row(3, "Eval")])
+
+    result = convert_navfit98_csv(csv_path, tmp_path / "navfitx.db", batch_size=2, validate=True)
+
+    # reports with issues are imported all the same
+    assert result.imported == {"fitrep": 2, "eval": 1}
+    assert {issue.index for issue in result.issues} <= {1, 2, 3}
+    name_issues = [issue for issue in result.issues if issue.field == "name"]
+    assert [(issue.index, issue.doc_type, issue.error_type) for issue in name_issues] == [
+        (2, "fitrep", "string_too_long")
+    ]
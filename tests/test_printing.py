@@ -0,0 +1,60 @@
+import pymupdf
+from PySide6.QtWidgets import QApplication
+
+from navfitx.gui.printing import PrintFailure, ReportPrinter
+from navfitx.printing import render_report, report_pdf_filename
+
+KEYS = [("eval", 1), ("fitrep", 404), ("fitrep", 1), ("chiefeval", 1)]
+
+
+def test_print_selected_reports_into_one_pdf(qapp: QApplication, example_db_path, tmp_path) -> None:
+    output = tmp_path / "reports.pdf"
+    printer = ReportPrinter(example_db_path, KEYS, output, merge=True, max_workers=2)
+    progress: list[int] = []
+    printer.progress.connect(progress.append)
+
+    printer.start()
+    printer.wait()
+
+    assert progress == [1, 2, 3, 4]
+    assert printer.printed == 3
+    assert printer.failures == [PrintFailure(("fitrep", 404), "The report no longer exists.")]
+    expected = [render_report(example_db_path, key).pdf for key in KEYS if key != ("fitrep", 404)]
+    with pymupdf.open(output) as merged:
+        texts = [page.get_text() for page in merged]
+    expected_texts = []
+    for pdf in expected:
+        with pymupdf.open(stream=pdf, filetype="pdf") as doc:
+            expected_texts.extend(page.get_text() for page in doc)
+    # the reports are merged in selection order whatever order they finish in
+    assert texts == expected_texts
+
+
+def test_print_selected_reports_into_a_folder(qapp: QApplication, example_db_path, tmp_path) -> None:
+    output = tmp_path / "pdfs"
+    printer = ReportPrinter(example_db_path, KEYS, output, merge=False, max_workers=2)
+
+    printer.start()
+    printer.wait()
+
+    assert [failure.key for failure in printer.failures] == [("fitrep", 404)]
+    assert {path.name for path in output.iterdir()} == {
+        report_pdf_filename("chiefeval", 1, "DOE, JANE A"),
+        report_pdf_filename("eval", 1, "SMITH, ALEX R"),
+        report_pdf_filename("fitrep", 1, "JONES, JOHN P"),
+    }
+
+
+def test_cancelled_print_saves_nothing(qapp: QApplication, example_db_path, tmp_path) -> None:
+    output = tmp_path / "reports.pdf"
+    printer = ReportPrinter(example_db_path, KEYS * 5, output, merge=True, max_workers=1)
+    finished: list[bool] = []
+    printer.finished.connect(lambda: finished.append(True))
+
+    printer.start()
+    printer.cancel()
+    printer.wait()
+
+    assert finished == [True]
+    assert printer.cancelled
+    assert not output.exists()
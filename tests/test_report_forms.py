@@ -0,0 +1,84 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from navfitx import chiefeval_trait_descriptions
+from navfitx.examples import (
+    build_validated_example_chiefeval,
+    build_validated_example_eval,
+    build_validated_example_fitrep,
+)
+from navfitx.gui.home import REPORT_FORMS, Home
+from navfitx.models import ChiefEval, Eval, Fitrep
+
+
+@pytest.mark.parametrize(
+    "build_example",
+    [build_validated_example_fitrep, build_validated_example_eval, build_validated_example_chiefeval],
+)
+def test_rebound_form_saves_reports_like_a_new_form(qapp: QApplication, build_example) -> None:
+    home = Home()
+    form_cls = REPORT_FORMS[build_example().doc_type]
+    new_form = form_cls(home, home.submit_form, home.cancel_form, expected := build_example())
+    new_form.save_form()
+    form = form_cls(home, home.submit_form, home.cancel_form, build_example())
+
+    # bind a blank report first so every widget has to be overwritten
+    form.bind(type(expected)())
+    form.bind(report := build_example())
+    form.save_form()
+
+    assert report.model_dump() == expected.model_dump()
+
+    form.bind(type(expected)())
+
+    assert form.name.text() == ""
+    assert form.trait1.currentText() == ""
+    assert form.indiv_promo_rec.currentText() == ""
+    assert form.billet_subcategory.currentData() is None
+
+
+def test_home_reuses_one_form_per_report_type(qapp: QApplication) -> None:
+    home = Home()
+    qapp.processEvents()
+    assert set(home.report_forms) == set(REPORT_FORMS)
+    stack_size = home.stack.count()
+
+    home.open_fitrep_dialog(Fitrep(name="JONES, JOHN P"))
+    form = home.stack.currentWidget()
+    home.cancel_form()
+    home.open_fitrep_dialog(Fitrep(name="DOE, JANE A"))
+    home.cancel_form()
+    home.open_eval_dialog(Eval(name="ROE, RICK"))
+    home.open_chiefeval_dialog(ChiefEval(name="POE, ED"))
+
+    assert home.fitrep_form is form is home.report_forms["fitrep"]
+    assert home.fitrep_form.name.text() == "DOE, JANE A"
+    assert home.eval_form.name.text() == "ROE, RICK"
+    assert home.stack.currentWidget() is home.chiefeval_form
+    assert home.stack.count() == stack_size
+    assert home.windowTitle() == "Chief Evaluation"
+    assert [action.text() for action in home.menuBar().actions()] == ["File", "View", "Tools"]
+
+
+def test_chiefeval_form_describes_traits_on_demand(qapp: QApplication) -> None:
+    chiefeval_trait_descriptions._load.cache_clear()
+    home = Home()
+    form = home.get_report_form("chiefeval")
+    form.bind(ChiefEval(trait1=5, trait2=0))
+    # building and binding the form doesn't read the descriptions
+    assert chiefeval_trait_descriptions._load.cache_info().currsize == 0
+
+    assert form.trait_tooltip(form.trait1).splitlines()[:2] == [
+        "Technical Mastery 5",
+        "- Recognized expert, sought after to solve difficult problems, executes innovative ideas",
+    ]
+    # Not Observed has no description
+    assert form.trait_tooltip(form.trait2) == ""
+
+    form.trait_help_button.setChecked(True)
+    form.trait_search.setText("MISSION success")
+    items = [form.trait_descriptions.item(row).text() for row in range(form.trait_descriptions.count())]
+    assert (
+        items[0] == "Institutional Expertise 1: Unable to recognize and engage when required to ensure mission success"
+    )
+    assert all("mission success" in item.lower() for item in items)
@@ -0,0 +1,199 @@
+import json
+from datetime import date
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from navfitx.db import add_report_to_db, ensure_db_schema, get_report_rows
+from navfitx.gui.home import Home
+from navfitx.gui.report_list import ReportListModel, ReportListView, rows_from_snapshot, rows_to_snapshot
+from navfitx.models import ChiefEval, Eval, Fitrep, ReportRow
+
+
+def _rows(count: int):
+    return [
+        ReportRow("LT", f"DOE, JOHN {i:05}", "", "fitrep", date(2024, 1, 1 + i % 28), i) for i in range(1, count + 1)
+    ]
+
+
+def test_get_report_rows_reads_report_list_fields(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P", rate="LT", period_end=date(2025, 2, 28)))
+    add_report_to_db(db_path, Eval(name="DOE, JANE A"))
+    add_report_to_db(db_path, ChiefEval(name="ROE, RICK"))
+
+    assert sorted(get_report_rows(db_path)) == [
+        ReportRow("", "DOE, JANE A", "", "eval", None, 1),
+        ReportRow("", "ROE, RICK", "", "chiefeval", None, 1),
+        ReportRow("LT", "JONES, JOHN P", "", "fitrep", date(2025, 2, 28), 1),
+    ]
+
+
+def test_model_pages_rows_in_as_the_view_fetches(qapp: QApplication) -> None:
+    model = ReportListModel()
+    model.set_rows(_rows(ReportListModel.PAGE_SIZE * 2 + 10))
+
+    assert model.total_rows() == ReportListModel.PAGE_SIZE * 2 + 10
+    assert model.rowCount() == ReportListModel.PAGE_SIZE
+    assert model.canFetchMore()
+
+    model.fetchMore()
+    model.fetchMore()
+
+    assert model.rowCount() == model.total_rows()
+    assert not model.canFetchMore()
+
+
+def test_model_displays_and_sorts_rows(qapp: QApplication) -> None:
+    model = ReportListModel()
+    model.set_rows(
+        [
+            ReportRow("LT", "ZULU, Z", "111-11-1111", "fitrep", date(2024, 1, 31), 2),
+            ReportRow("YN1", "ALPHA, A", "", "eval", None, 1),
+            ReportRow("CPO", "MIKE, M", "", "chiefeval", date(2024, 1, 31), 3),
+        ]
+    )
+
+    # default Sort State: newest Period End first, ties broken by the newest report, blank Period Ends last
+    assert [model.report_key(row) for row in range(3)] == [("chiefeval", 3), ("fitrep", 2), ("eval", 1)]
+    assert model.index(1, 3).data() == "Fitness Report"
+    assert model.index(1, 3).data(ReportListModel.TYPE_ROLE) == "fitrep"
+    assert model.index(1, 4).data() == "2024-01-31"
+    assert model.index(2, 4).data() == ""
+
+    model.sort(1, Qt.SortOrder.AscendingOrder)
+
+    assert [model.index(row, 1).data() for row in range(3)] == ["ALPHA, A", "MIKE, M", "ZULU, Z"]
+
+
+def test_view_only_materializes_visible_rows(qapp: QApplication) -> None:
+    model = ReportListModel()
+    model.set_rows(_rows(20_000))
+    view = ReportListView()
+    view.setModel(model)
+    view.resize(600, 300)
+    view.show()
+    qapp.processEvents()
+
+    requested_rows: set[int] = set()
+    original_data = model.data
+
+    def recording_data(index, role=Qt.ItemDataRole.DisplayRole):
+        requested_rows.add(index.row())
+        return original_data(index, role)
+
+    model.data = recording_data  # type: ignore[method-assign]
+    view.viewport().repaint()
+
+    assert view.rowCount() == ReportListModel.PAGE_SIZE
+    assert requested_rows
+    assert max(requested_rows) < 50
+
+
+def test_model_inserts_updates_and_removes_rows_in_sorted_order(qapp: QApplication) -> None:
+    model = ReportListModel()
+    model.sort_column, model.sort_order = 1, Qt.SortOrder.AscendingOrder
+    model.set_rows(
+        [ReportRow("LT", "ALPHA, A", "", "fitrep", None, 1), ReportRow("LT", "MIKE, M", "", "fitrep", None, 2)]
+    )
+    changed: list[int] = []
+    model.dataChanged.connect(lambda top_left, bottom_right: changed.append(top_left.row()))
+
+    model.insert_row(ReportRow("LT", "golf, g", "", "eval", None, 1))
+    assert [model.index(row, 1).data() for row in range(model.rowCount())] == ["ALPHA, A", "golf, g", "MIKE, M"]
+
+    assert model.update_row(ReportRow("LCDR", "ALPHA, A", "", "fitrep", None, 1))
+    assert changed == [0]
+    assert model.index(0, 0).data() == "LCDR"
+
+    assert model.update_row(ReportRow("LT", "ZULU, Z", "", "fitrep", None, 1))
+    assert [model.index(row, 1).data() for row in range(model.rowCount())] == ["golf, g", "MIKE, M", "ZULU, Z"]
+
+    assert model.remove_row(("eval", 1))
+    assert not model.remove_row(("eval", 1))
+    assert not model.update_row(ReportRow("LT", "NEW, N", "", "eval", None, 1))
+    assert [model.report_key(row) for row in range(model.rowCount())] == [("fitrep", 2), ("fitrep", 1)]
+
+
+def test_model_inserts_rows_past_the_fetched_page_without_showing_them(qapp: QApplication) -> None:
+    model = ReportListModel()
+    model.sort_column, model.sort_order = 1, Qt.SortOrder.AscendingOrder
+    model.set_rows(_rows(ReportListModel.PAGE_SIZE + 1))
+
+    model.insert_row(ReportRow("LT", "ZULU, Z", "", "eval", None, 1))
+    model.insert_row(ReportRow("LT", "ALPHA, A", "", "eval", None, 2))
+
+    assert model.rowCount() == ReportListModel.PAGE_SIZE + 1
+    assert model.total_rows() == ReportListModel.PAGE_SIZE + 3
+    assert model.report_key(0) == ("eval", 2)
+    model.fetchMore()
+    assert model.report_key(model.rowCount() - 1) == ("eval", 1)
+
+
+def test_snapshot_round_trips_rows() -> None:
+    rows = [*_rows(3), ReportRow("", "DOE, JANE A", "", "eval", None, 7)]
+
+    assert rows_from_snapshot(json.loads(json.dumps(rows_to_snapshot(rows)))) == rows
+    with pytest.raises(ValueError):
+        rows_from_snapshot([["LT", "DOE, JOHN", "", "fitrep", "not a date", 1]])
+
+
+def test_home_paints_last_report_list_before_reading_database(qapp: QApplication, tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, Fitrep(name="JONES, JOHN P", rate="LT", period_end=date(2025, 2, 28)))
+    add_report_to_db(db_path, Eval(name="DOE, JANE A"))
+    home = Home()
+    home.save_last_db(db_path)
+    home.db = db_path
+    home.refresh_reports_table()
+    home.wait_for_db()
+    home.sort_reports_by_column(1)
+    home.reports_table.setColumnWidth(0, 77)
+    home.close()
+
+    add_report_to_db(db_path, ChiefEval(name="ROE, RICK"))
+    home = Home()
+
+    # the previous session's rows and Sort State are shown before the database has been read
+    assert home.db == db_path
+    assert (home.sort_column, home.sort_ascending) == (1, True)
+    assert home.reports_table.columnWidth(0) == 77
+    assert [home.report_list_model.report_row(i)[1] for i in range(home.reports_table.rowCount())] == [
+        "DOE, JANE A",
+        "JONES, JOHN P",
+    ]
+
+    home.wait_for_db()
+
+    assert [home.report_list_model.report_row(i)[1] for i in range(home.reports_table.rowCount())] == [
+        "DOE, JANE A",
+        "JONES, JOHN P",
+        "ROE, RICK",
+    ]
+
+
+def test_home_does_not_paint_the_last_report_list_over_an_archive(qapp: QApplication, tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    archive = tmp_path / "archive.db"
+    for path, name in ((db_path, "JONES, JOHN P"), (archive, "ROE, RICK")):
+        ensure_db_schema(path)
+        add_report_to_db(path, Fitrep(name=name))
+    home = Home()
+    home.save_last_db(db_path)
+    home.db = db_path
+    home.refresh_reports_table()
+    home.wait_for_db()
+    home.reports_table.setColumnWidth(0, 77)
+    home.close()
+
+    home = Home(archive=archive)
+
+    assert home.reports_table.rowCount() == 0
+    assert home.reports_table.columnWidth(0) == 77
+
+    home.wait_for_db()
+
+    assert [home.report_list_model.report_row(i)[1] for i in range(home.reports_table.rowCount())] == ["ROE, RICK"]
@@ -0,0 +1,52 @@
+from PySide6.QtWidgets import QApplication
+
+from navfitx.examples import build_validated_example_fitrep
+from navfitx.gui.fitrep import FitrepForm
+from navfitx.gui.home import Home
+from navfitx.printing import render_changed_pages
+
+
+def test_render_changed_pages_skips_unchanged_pages() -> None:
+    report = build_validated_example_fitrep()
+
+    pages = render_changed_pages(report, {}, 1)
+    digests = {page.page: page.digest for page in pages}
+
+    assert [page.page for page in pages] == [0, 1]
+    assert len(pages[0].samples) == pages[0].stride * pages[0].height
+    assert render_changed_pages(report, digests, 1) == []
+
+    report.comments = "Top performer."
+    assert [page.page for page in render_changed_pages(report, digests, 1)] == [1]
+
+    report.name = "DOE, JANE A"
+    assert [page.page for page in render_changed_pages(report, digests, 1)] == [0, 1]
+
+
+def test_form_preview_renders_edits_debounced(qapp: QApplication) -> None:
+    home = Home()
+    report = build_validated_example_fitrep()
+    form = FitrepForm(home, home.submit_form, home.cancel_form, report)
+    form.show()
+    rendered: list[list[int]] = []
+    form.preview.pages_rendered.connect(rendered.append)
+
+    form.set_preview_visible(True)
+    form.preview.wait()
+
+    assert rendered == [[0, 1]]
+    assert set(form.preview.pixmaps) == {0, 1}
+    assert not form.preview.pixmaps[0].isNull()
+
+    for text in ("Top", "Top perf", "Top performer."):
+        form.comments.setText(text)
+    assert form.preview.timer.isActive()
+    form.preview.wait()
+
+    assert rendered == [[0, 1], [1]]
+    # the preview renders a draft, the report itself only changes when the form is saved
+    assert report.comments != "Top performer."
+
+    form.set_preview_visible(False)
+    form.comments.setText("Hidden edit")
+    assert not form.preview.timer.isActive()
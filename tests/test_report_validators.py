@@ -1,5 +1,6 @@
 # ty: ignore
 import re
+from datetime import timedelta
 
 import pytest
 from pydantic import ValidationError
@@ -8,6 +9,7 @@ from navfitx.models import (
     ChiefEval,
     Fitrep,
 )
+from navfitx.models.models import validation_date
 
 
 def test_valid_fitrep(fitrep):
@@ -134,6 +136,23 @@ def test_date_reported_validation(fitrep: Fitrep):
         Fitrep.model_validate(fitrep)
 
 
+def test_date_order_validation(fitrep: Fitrep):
+    # the first check that fails is reported, whichever dates are out of order
+    fitrep.date_reported = fitrep.period_end + timedelta(days=1)
+    fitrep.period_start = fitrep.period_end + timedelta(days=2)
+    with pytest.raises(ValidationError, match="Report date cannot be after the period of report end date"):
+        Fitrep.model_validate(fitrep)
+
+
+def test_dates_are_checked_against_one_today_per_batch(fitrep: Fitrep):
+    with validation_date() as today:
+        fitrep.date_counseled = fitrep.period_end = today
+        Fitrep.model_validate(fitrep)
+        fitrep.period_end = today + timedelta(days=1)
+        with pytest.raises(ValidationError, match="Period of report end date cannot be in the future"):
+            Fitrep.model_validate(fitrep)
+
+
 def test_periodic_validation(fitrep: Fitrep):
     fitrep.periodic = None
     with pytest.raises(ValidationError, match="periodic"):
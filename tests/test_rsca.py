@@ -0,0 +1,137 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from navfitx.db import (
+    add_report_to_db,
+    delete_reports,
+    ensure_db_schema,
+    get_engine,
+    get_report,
+    get_rsca,
+    rebuild_rsca,
+    set_reporting_senior,
+)
+from navfitx.gui.home import Home
+from navfitx.models import Eval, Fitrep, Rsca, rsca_key
+
+HOPPER = ("HOPPER, G", "123-45-6789", "12345", "O3")
+
+
+def hopper_fitrep(**fields) -> Fitrep:
+    values = dict(senior_name="HOPPER, G", senior_ssn="123-45-6789", senior_uic="12345", rate="LT")
+    return Fitrep(**(values | fields))
+
+
+def all_rscas(db_path) -> list[tuple]:
+    with Session(get_engine(db_path)) as session:
+        return sorted(
+            (rsca.senior_name, rsca.paygrade, round(rsca.total, 9), rsca.reports) for rsca in session.exec(select(Rsca))
+        )
+
+
+def rebuilt_rscas(db_path) -> list[tuple]:
+    with get_engine(db_path).begin() as conn:
+        rebuild_rsca(conn)
+    return all_rscas(db_path)
+
+
+def test_rsca_is_maintained_as_reports_change(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(trait1=4, trait2=0))
+    add_report_to_db(db_path, hopper_fitrep(trait1=3, trait2=2))
+    # reports without an observed trait don't count
+    add_report_to_db(db_path, hopper_fitrep(trait1=0))
+    add_report_to_db(db_path, Eval(senior_name="HOPPER, G", rate="YN1", trait1=5))
+
+    rsca = get_rsca(db_path, HOPPER)
+    assert rsca is not None
+    assert (rsca.reports, rsca.average) == (2, pytest.approx((4 + 2.5) / 2))
+
+    report = get_report(db_path, ("fitrep", 2))
+    assert report is not None
+    report.trait1 = 5
+    add_report_to_db(db_path, report)
+    set_reporting_senior(db_path, {"senior_name": "NIMITZ, C"}, keys=[("fitrep", 1)])
+    delete_reports(db_path, keys=[("eval", 1)])
+
+    rsca = get_rsca(db_path, HOPPER)
+    assert rsca is not None
+    assert (rsca.reports, rsca.average) == (1, pytest.approx(3.5))
+    assert get_rsca(db_path, ("NIMITZ, C", "123-45-6789", "12345", "O3")) is not None
+    assert get_rsca(db_path, ("HOPPER, G", "", "", "E6")) is None
+    expected = all_rscas(db_path)
+    assert rebuilt_rscas(db_path) == expected
+
+
+def test_rsca_is_kept_by_paygrade(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    # a YN1 and an ET1 are both E6, whatever the case the rate was saved in
+    add_report_to_db(db_path, Eval(senior_name="HOPPER, G", rate="yn1", trait1=5))
+    add_report_to_db(db_path, Eval(senior_name="HOPPER, G", rate="ET1", trait1=3))
+
+    rsca = get_rsca(db_path, rsca_key("HOPPER, G", None, None, "Yn1"))
+    assert rsca is not None
+    assert (rsca.paygrade, rsca.reports, rsca.average) == ("E6", 2, 4.0)
+
+
+def test_rsca_is_computed_for_a_database_from_before_rscas(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(trait1=4, trait2=3))
+    with get_engine(db_path).begin() as conn:
+        for trigger in ("insert", "update", "delete"):
+            conn.execute(text(f"DROP TRIGGER fitrep_rsca_{trigger}"))
+        conn.execute(text("DROP TABLE rsca"))
+
+    ensure_db_schema(db_path)
+
+    rsca = get_rsca(db_path, HOPPER)
+    assert rsca is not None
+    assert (rsca.reports, rsca.average) == (1, 3.5)
+
+
+def test_report_form_compares_trait_average_to_rsca(qapp: QApplication, tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(trait1=4, trait2=3))
+    home = Home()
+    home.db = db_path
+    home.read_only = False
+    QApplication.processEvents()
+    home.wait_for_db()
+
+    home.open_fitrep_dialog(hopper_fitrep(trait1=5))
+    home.wait_for_db()
+    QApplication.processEvents()
+    form = home.fitrep_form
+
+    assert form.trait_average.text() == "5.00   RSCA 3.50 over 1 report(s), +1.50"
+
+    form.trait2.setCurrentText("3 - Meets Standards")
+    assert form.trait_average.text() == "4.00   RSCA 3.50 over 1 report(s), +0.50"
+
+    form.senior_name.setText("NIMITZ, C")
+    home.wait_for_db()
+    QApplication.processEvents()
+    assert form.trait_average.text() == "4.00"
+
+
+def test_report_form_finds_the_rsca_of_a_lowercase_rate(qapp: QApplication, tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(trait1=3, rate="lt"))
+    home = Home()
+    home.db = db_path
+    home.read_only = False
+    QApplication.processEvents()
+    home.wait_for_db()
+
+    home.open_fitrep_dialog(hopper_fitrep(trait1=4, rate="lt"))
+    home.wait_for_db()
+    QApplication.processEvents()
+
+    assert home.fitrep_form.trait_average.text() == "4.00   RSCA 3.00 over 1 report(s), +1.00"
@@ -0,0 +1,76 @@
+import math
+
+import pytest
+from typer.testing import CliRunner
+
+import navfitx.db
+from navfitx.cli import app
+from navfitx.db import add_report_to_db
+from navfitx.examples import (
+    build_validated_example_fitrep,
+)
+from navfitx.models import Eval, Fitrep
+from navfitx.stats import BLANK, GroupStats, load_trait_columns
+
+runner = CliRunner()
+
+
+@pytest.fixture()
+def stats_db_path(example_db_path):
+    """The example reports plus a HOPPER, G fitrep and eval with NOB and blank traits."""
+    add_report_to_db(example_db_path, Fitrep(senior_name="HOPPER, G", trait1=0, trait2=0, indiv_promo_rec=0))
+    add_report_to_db(example_db_path, Eval(senior_name="HOPPER, G", trait1=5, trait2=4, trait3=0, indiv_promo_rec=5))
+    return example_db_path
+
+
+def test_member_averages_match_the_averages_printed_on_each_report(stats_db_path) -> None:
+    columns = load_trait_columns(stats_db_path, doc_types=["fitrep"])
+
+    averages = columns.member_averages()
+
+    assert len(columns) == 2
+    assert f"{averages[0]:.2f}" == build_validated_example_fitrep().member_trait_avg()
+    # a report whose every trait is NOB or blank has no average
+    assert math.isnan(averages[1])
+
+
+def test_group_stats_and_trait_histograms(stats_db_path) -> None:
+    columns = load_trait_columns(stats_db_path, group_by="senior", batch_size=2)
+
+    stats = {group.group: group for group in columns.group_stats()}
+
+    assert stats["HOPPER, G"] == GroupStats(
+        "HOPPER, G",
+        reports=3,
+        trait_average=pytest.approx((float(build_validated_example_fitrep().member_trait_avg()) + 4.5) / 2, abs=0.01),
+        promotion=(1, 0, 0, 1, 0, 1),
+    )
+    assert stats["HOPPER, G"].nob_rate == pytest.approx(1 / 3)
+    assert sum(group.reports for group in stats.values()) == len(columns) == 5
+    trait3 = columns.trait_histograms()[2]
+    assert trait3[0] == 1
+    assert sum(trait3) == len(columns) - list(columns.traits[2]).count(BLANK)
+
+
+def test_stats_command_prints_groups(stats_db_path) -> None:
+    result = runner.invoke(app, ["stats", "--db", str(stats_db_path), "--by", "type"], terminal_width=200)
+
+    assert result.exit_code == 0, result.stdout
+    assert "chiefeval" in result.stdout
+    assert "Trait Grades" in result.stdout
+
+
+def test_trait_columns_are_read_without_opening_a_live_database_as_immutable(stats_db_path, monkeypatch) -> None:
+    uris: list[str] = []
+    connect = navfitx.db.sqlite3.connect
+
+    def recording(database, *args, **kwargs):
+        uris.append(database)
+        return connect(database, *args, **kwargs)
+
+    monkeypatch.setattr(navfitx.db.sqlite3, "connect", recording)
+
+    load_trait_columns(stats_db_path)
+    load_trait_columns(stats_db_path, archive=True)
+
+    assert [uri.partition("?")[2] for uri in uris] == ["mode=ro", "mode=ro&immutable=1"]
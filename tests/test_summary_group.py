@@ -0,0 +1,209 @@
+from datetime import date
+
+from PySide6.QtWidgets import QApplication
+from sqlalchemy import text
+from sqlmodel import Session, select
+from typer.testing import CliRunner
+
+from navfitx.cli import app
+from navfitx.db import (
+    add_report_to_db,
+    delete_reports,
+    ensure_db_schema,
+    get_engine,
+    get_report,
+    get_summary_group,
+    get_summary_groups,
+    rebuild_summary_groups,
+)
+from navfitx.gui.home import Home
+from navfitx.models import Fitrep, PromotionStatus, SummaryGroup, quota_violations
+from navfitx.models.paygrade import group_paygrade
+from navfitx.models.summary_group import paygrade
+
+runner = CliRunner()
+
+PERIOD_END = date(2026, 1, 31)
+HOPPER_LT = ("HOPPER, G", "123-45-6789", "12345", "O3", "2026-01-31", "REGULAR")
+
+
+def hopper_fitrep(indiv_promo_rec: int | None, **fields) -> Fitrep:
+    values = dict(
+        senior_name="HOPPER, G",
+        senior_ssn="123-45-6789",
+        senior_uic="12345",
+        rate="LT",
+        period_end=PERIOD_END,
+        promotion_status=PromotionStatus.REGULAR,
+        indiv_promo_rec=indiv_promo_rec,
+    )
+    return Fitrep(**(values | fields))
+
+
+def all_summary_groups(db_path) -> list[tuple]:
+    with Session(get_engine(db_path)) as session:
+        return sorted(tuple(group.model_dump().values()) for group in session.exec(select(SummaryGroup)))
+
+
+def test_summary_groups_are_counted_as_reports_change(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(5))
+    add_report_to_db(db_path, hopper_fitrep(4))
+    add_report_to_db(db_path, hopper_fitrep(0))
+    # reports without a recommendation don't count
+    add_report_to_db(db_path, hopper_fitrep(None))
+    add_report_to_db(db_path, hopper_fitrep(5, promotion_status=PromotionStatus.FROCKED))
+
+    group = get_summary_group(db_path, HOPPER_LT)
+    assert group is not None
+    assert group.counts() == [1, 0, 0, 0, 1, 1]
+
+    report = get_report(db_path, ("fitrep", 2))
+    assert report is not None
+    report.indiv_promo_rec = 5
+    add_report_to_db(db_path, report)
+    delete_reports(db_path, keys=[("fitrep", 3), ("fitrep", 5)])
+
+    group = get_summary_group(db_path, HOPPER_LT)
+    assert group is not None
+    assert group.counts() == [0, 0, 0, 0, 0, 2]
+    assert get_summary_group(db_path, (*HOPPER_LT[:5], "FROCKED")) is None
+
+    expected = all_summary_groups(db_path)
+    with get_engine(db_path).begin() as conn:
+        rebuild_summary_groups(conn)
+    assert all_summary_groups(db_path) == expected
+
+
+def test_summary_groups_are_kept_by_paygrade(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    # one EP of two is within the E8 quota for each rating, but a YNCS and an ETCS of one reporting senior are in one
+    # summary group, which may only have one EP in four
+    for rate, rec in (("YNCS", 5), ("YNCS", 3), ("etcs ", 5), ("ETCS", 3)):
+        add_report_to_db(db_path, hopper_fitrep(rec, rate=rate))
+
+    [group] = get_summary_groups(db_path)
+    assert (group.paygrade, group.counts()) == ("E8", [0, 0, 0, 2, 0, 2])
+    assert quota_violations(group.paygrade, group.counts()) == ["Too many EP: 2, at most 1 in a summary group of 4 E8"]
+
+
+def test_triggers_compute_the_paygrade_of_group_paygrade(tmp_path) -> None:
+    rates = ["LT", "lt", " CWO3", "YN1", "ITCS", "YNCM", "ABHC", "SN", "fa", "E6", "C", "1", "MIDN", "", "CS\t"]
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    for rate in rates:
+        add_report_to_db(db_path, hopper_fitrep(3, rate=rate))
+
+    paygrades = {group.paygrade: sum(group.counts()) for group in get_summary_groups(db_path)}
+    expected: dict[str, int] = {}
+    for rate in rates:
+        expected[group_paygrade(rate)] = expected.get(group_paygrade(rate), 0) + 1
+    assert paygrades == expected
+
+
+def test_stale_triggers_are_replaced_and_their_table_recomputed(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(5))
+    with get_engine(db_path).begin() as conn:
+        conn.execute(text("DROP TRIGGER fitrep_summary_group_insert"))
+        conn.execute(text("CREATE TRIGGER fitrep_summary_group_insert AFTER INSERT ON fitrep BEGIN SELECT 1; END"))
+        conn.execute(text("DELETE FROM summary_group"))
+
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(3))
+
+    group = get_summary_group(db_path, HOPPER_LT)
+    assert group is not None
+    assert group.counts() == [0, 0, 0, 1, 0, 1]
+
+
+def test_quota_violations() -> None:
+    assert paygrade("LT") == "O3"
+    assert paygrade("YNCS") == "E8"
+    assert paygrade("IT2") == "E5"
+    assert paygrade("SN") == "E3"
+    assert paygrade("MIDN") is None
+
+    # one EP is allowed in a group of one however low the limit, and NOB doesn't count towards the size
+    assert quota_violations("CAPT", [3, 0, 0, 0, 0, 1]) == []
+    # limits are rounded up: 20% of 6 allows 2 EP
+    assert quota_violations("LT", [0, 0, 0, 4, 0, 2]) == []
+    assert quota_violations("LT", [0, 0, 0, 0, 4, 2]) == ["Too many MP and EP: 6, at most 4 in a summary group of 6 O3"]
+    assert quota_violations("ITCM", [0, 0, 0, 5, 0, 2]) == ["Too many EP: 2, at most 1 in a summary group of 7 E9"]
+    # there is no MP limit for ensigns, nor any limit for grades EVALMAN doesn't list
+    assert quota_violations("ENS", [0, 0, 0, 0, 5, 0]) == []
+    assert quota_violations("MIDN", [0, 0, 0, 0, 0, 5]) == []
+
+
+def test_quotas_command_lists_over_quota_groups(tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(5))
+    add_report_to_db(db_path, hopper_fitrep(3))
+
+    result = runner.invoke(app, ["db", "quotas", "--db", str(db_path)], terminal_width=200)
+    assert result.exit_code == 0, result.output
+    assert "No summary group" in result.output
+
+    add_report_to_db(db_path, hopper_fitrep(5))
+    result = runner.invoke(app, ["db", "quotas", "--db", str(db_path)], env={"COLUMNS": "200"})
+    assert result.exit_code == 1, result.output
+    assert "Too many EP: 2, at most 1 in a summary group of 3 O3" in result.output
+
+
+def test_report_form_flags_an_over_quota_recommendation(qapp: QApplication, tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    add_report_to_db(db_path, hopper_fitrep(5))
+    add_report_to_db(db_path, hopper_fitrep(3))
+    home = Home()
+    home.db = db_path
+    home.read_only = False
+    QApplication.processEvents()
+    home.wait_for_db()
+
+    saved = get_report(db_path, ("fitrep", 1))
+    assert saved is not None
+    home.open_fitrep_dialog(saved)
+    home.wait_for_db()
+    QApplication.processEvents()
+    form = home.fitrep_form
+    # the saved recommendation of the report is counted once
+    assert form.promotion_quota.text() == "Summary group of 2: 0 MP, 1 EP"
+
+    home.open_fitrep_dialog(hopper_fitrep(4))
+    home.wait_for_db()
+    QApplication.processEvents()
+    assert form.promotion_quota.text() == "Summary group of 3: 1 MP, 1 EP"
+
+    form.indiv_promo_rec.setCurrentText("Early Promote")
+    assert form.promotion_quota.text().splitlines()[1:] == ["Too many EP: 2, at most 1 in a summary group of 3 O3"]
+
+    form.promotion_status.setCurrentText("FROCKED")
+    home.wait_for_db()
+    QApplication.processEvents()
+    assert form.promotion_quota.text() == "Summary group of 1: 0 MP, 1 EP"
+
+
+def test_report_form_finds_the_group_of_a_lowercase_rate_and_blank_period_end(qapp: QApplication, tmp_path) -> None:
+    db_path = tmp_path / "navfitx.db"
+    ensure_db_schema(db_path)
+    # a blank period end is saved from the form as the date its date field shows until a date is picked
+    add_report_to_db(db_path, hopper_fitrep(5, rate="lt", period_end=date(2000, 1, 1)))
+    home = Home()
+    home.db = db_path
+    home.read_only = False
+    QApplication.processEvents()
+    home.wait_for_db()
+
+    home.open_fitrep_dialog(hopper_fitrep(5, rate="lt", period_end=None))
+    home.wait_for_db()
+    QApplication.processEvents()
+
+    assert home.fitrep_form.promotion_quota.text().splitlines() == [
+        "Summary group of 2: 0 MP, 2 EP",
+        "Too many EP: 2, at most 1 in a summary group of 2 O3",
+    ]
@@ -0,0 +1,106 @@
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+from PySide6.QtCore import QDate
+from PySide6.QtWidgets import QApplication
+
+from navfitx.examples import (
+    build_validated_example_chiefeval,
+    build_validated_example_eval,
+    build_validated_example_fitrep,
+)
+from navfitx.gui.fitrep import FitrepForm
+from navfitx.gui.home import Home
+from navfitx.models import Fitrep
+from navfitx.validation import ReportValidator, _compile
+
+
+def _is_valid(report_type, values) -> bool:
+    try:
+        report_type.model_validate(values)
+    except ValidationError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "build_example",
+    [build_validated_example_fitrep, build_validated_example_eval, build_validated_example_chiefeval],
+)
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("name", ""),
+        ("ssn", "123456789"),
+        ("uic", "123456"),
+        ("trait3", None),
+        ("career_rec_1", ""),
+        ("career_rec_1", "THIS IS FAR TOO LONG FOR A CAREER RECOMMENDATION"),
+        ("period_start", date(2099, 1, 1)),
+        ("indiv_promo_rec", None),
+        ("regular", False),
+        ("comments", "Shorter comments."),
+    ],
+)
+def test_report_validator_agrees_with_model_validate(build_example, field, value) -> None:
+    report = build_example()
+    validator = ReportValidator(type(report), report.model_dump())
+    assert not validator.field_errors and not validator.model_errors
+
+    validator.set_field(field, value)
+
+    values = report.model_dump() | {field: value}
+    has_errors = bool(validator.field_errors or validator.model_errors)
+    assert has_errors == (not _is_valid(type(report), values))
+
+
+def test_report_validator_only_reruns_dependent_model_validators(monkeypatch) -> None:
+    runs: list[str] = []
+    compiled = _compile(Fitrep)
+    for name, func in list(compiled.model_validators.items()):
+
+        def counting(report, name=name, func=func):
+            runs.append(name)
+            return func(report)
+
+        monkeypatch.setitem(compiled.model_validators, name, counting)
+    validator = ReportValidator(Fitrep, build_validated_example_fitrep().model_dump())
+
+    runs.clear()
+    validator.set_field("comments", "Top performer.")
+    assert runs == []
+
+    validator.set_field("career_rec_1", "")
+    assert runs == ["validate_career_recs"]
+    assert "validate_career_recs" in validator.model_errors
+
+    runs.clear()
+    validator.set_field("date_counseled", date(2000, 1, 1))
+    assert runs == ["validate_dates"]
+    assert validator.model_validator_fields("validate_dates") >= {"date_reported", "date_counseled"}
+
+
+def test_form_shows_errors_of_edited_fields_inline(qapp: QApplication) -> None:
+    home = Home()
+    form = FitrepForm(home, home.submit_form, home.cancel_form, Fitrep())
+    form.bind(build_validated_example_fitrep())
+
+    assert form.validation_label.isHidden()
+
+    form.name.setText("")
+    assert form.name.property("validationError")
+    assert form.name.toolTip() == "String should have at least 1 character"
+    assert form.validation_label.text() == "Name: String should have at least 1 character"
+
+    form.name.setText("JONES, JOHN P")
+    assert not form.name.property("validationError")
+    assert form.validation_label.isHidden()
+
+    form.date_counseled.setDate(QDate(2001, 1, 1))
+    assert form.validation_label.text() == "Report date cannot be after the counseling date."
+
+    # a new report starts out without errors, as none of its fields has been edited
+    form.bind(Fitrep())
+    assert form.validation_label.isHidden()
+    assert form.validator is not None and form.validator.field_errors